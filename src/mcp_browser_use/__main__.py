@@ -51,7 +51,7 @@ When a second agent opens a browser, the agent gets its own browser window. IT M
 
 * **Content Pagination:** The MCP supports paginating through large HTML pages using `html_offset` (for HTML mode) and `text_offset` (for TEXT mode). When pages exceed token limits, agents can make multiple calls with increasing offsets to retrieve all content. The offset is applied to cleaned content (after removing scripts/styles/ads), enabling efficient pagination through content-rich pages. Check the `hard_capped` flag in responses to detect truncation.
 
-* **HTML Truncation & Token Management:** The MCP allows you to configure truncation of HTML pages via `token_budget` parameter on all tools. Other scraping MCPs may overwhelm the AI with accessibility snapshots or HTML dumps that are larger than the context window. This MCP provides precise control over snapshot size through configurable token budgets and cleaning levels.
+* **HTML Truncation & Token Management:** The MCP allows you to configure truncation of HTML pages via `token_budget` parameter on all tools. Other scraping MCPs may overwhelm the AI with accessibility snapshots or HTML dumps that are larger than the context window. This MCP provides precise control over snapshot size through configurable token budgets and cleaning levels. A `token_budget` of 0 returns only url, title and the action result, without packing the page.
 
 * **Multiple Browser Windows and Multiple Agents:** You can connect multiple agents to this MCP independently, without requiring coordination on behalf of the agents. Each agent can work with **the same** browser profile, which is helpful when logins should persist across agents. Each agent gets their own browser window, so they do not interfere with each other.
 
@@ -157,6 +157,8 @@ take_screenshot
 >         thumbnail_width: Optional width in pixels for thumbnail (default: 200px if return_base64=True)
 >                         Minimum: 50px. Only used when return_base64=True.
 >                         Note: 200px accounts for MCP protocol overhead to stay under 25K token limit.
+>         thumbnail_format: "webp" (default, smallest), "jpeg" or "png" for the base64 thumbnail
+>         thumbnail_quality: WebP/JPEG quality 1-100 (default: 80)
 
 
 ```
@@ -217,10 +219,11 @@ extract_elements
 ```
 read_chromedriver_log
 ```
->     Fetch the first N lines of the Chromedriver log for debugging.
+>     Fetch the last N lines of the Chromedriver log for debugging.
 >
 >    Args:
->        lines (int): Number of lines to return from the top of the log.
+>        lines (int): Number of lines to return (default 50).
+>        from_top (bool): Return the first N lines instead of the last.
 
 
 ```
@@ -249,8 +252,12 @@ debug_element
 #endregion
 
 #region Imports
+import asyncio
+import dataclasses
 import logging
-from typing import Optional
+import re
+from typing import Annotated, Awaitable, List, Literal, Optional, Union
+from pydantic import Field
 from mcp.server.fastmcp import FastMCP
 #endregion
 
@@ -259,12 +266,15 @@ import mcp_browser_use as MBU
 from mcp_browser_use.decorators import (
     tool_envelope,
     exclusive_browser_access,
-    ensure_driver_ready,
+    fast_path,
+    browser_tool,
 )
 from mcp_browser_use.helpers_context import to_context_pack as _to_context_pack
+from mcp_browser_use.helpers_context import ShapeOpts, metadata_pack as _metadata_pack, prewarm_packing as _prewarm_packing
+from mcp_browser_use.utils.jsonio import dumps as _dumps, loads as _loads
 
 # Import tools directly (not via helpers) to break circular dependency
-from mcp_browser_use.tools import browser_management, navigation, interaction, screenshots, debugging, extraction
+from mcp_browser_use.tools import browser_management, navigation, interaction, screenshots, debugging, extraction, batch
 
 # Camoufox engine (Firefox-based anti-bot browser)
 from mcp_browser_use.camoufox import engine as camoufox_engine
@@ -274,77 +284,172 @@ from mcp_browser_use.camoufox import engine as camoufox_engine
 logger = logging.getLogger(__name__)
 #endregion
 
+#region Shared Parameter Types
+# Reused across tool signatures so FastMCP/pydantic builds each validator once.
+SelectorType = Annotated[
+    Literal["css", "xpath", "id", "name", "tag", "class", "link_text", "partial_link_text"],
+    Field(description="How to interpret the selector."),
+]
+Timeout = Annotated[float, Field(ge=0, description="Maximum time to wait in seconds.")]
+OptionalSelector = Annotated[Optional[str], Field(description="Optional CSS selector or XPath.")]
+WaitCondition = Annotated[
+    Literal["present", "visible", "clickable"],
+    Field(description="What to wait for: the element in the DOM, visible, or visible and enabled."),
+]
+DetailLevel = Annotated[
+    Optional[Literal["full", "interactive", "minimal"]],
+    Field(description='Snapshot detail; "interactive" keeps only actionable elements, "minimal" only url and title. Defaults to MCP_DEFAULT_DETAIL_LEVEL.'),
+]
+DiffMode = Annotated[
+    Optional[bool],
+    Field(description='In html mode, replace subtrees unchanged since the previous snapshot of this window with `data-mcp="unchanged"` stubs. Defaults to MCP_SNAPSHOT_DIFF.'),
+]
+#endregion
+
 #region Helper Functions
-async def _merge_extraction_results(
-    action_result_json: str,
-    extract_selectors: Optional[list] = None,
-    extract_container: Optional[str] = None,
-    extract_fields: Optional[list] = None,
-    extract_selector_type: Optional[str] = None,
-    extract_wait_visible: bool = False,
-    extract_timeout: int = 10,
-    extract_max_items: Optional[int] = None,
-    extract_discover: bool = False,
-    extract_wait_content: Optional[dict] = None,
-) -> str:
+@dataclasses.dataclass(slots=True)
+class ExtractionOpts:
+    """
+    The extract_* parameters of an action tool, bundled once per call so they
+    travel to the extraction as one object instead of as eight keyword
+    arguments at every hop. Treat as read-only.
+    """
+    selectors: Optional[list] = None
+    container: Optional[str] = None
+    fields: Optional[list] = None
+    selector_type: Optional[str] = None
+    wait_visible: bool = False
+    timeout: int = 10
+    max_items: Optional[int] = None
+    discover: bool = False
+    wait_content: Optional[dict] = None
+
+
+def _extraction_opts(
+    selectors: Optional[list],
+    container: Optional[str],
+    fields: Optional[list] = None,
+    selector_type: Optional[str] = None,
+    wait_visible: bool = False,
+    timeout: int = 10,
+    max_items: Optional[int] = None,
+    discover: bool = False,
+) -> Optional[ExtractionOpts]:
+    """
+    ExtractionOpts for a tool's extract_* parameters (passed positionally, in
+    signature order), or None when no extraction was requested.
     """
-    Helper to merge extraction results into action results.
+    if not selectors and not container:
+        return None
+    return ExtractionOpts(selectors, container, fields, selector_type, wait_visible, timeout, max_items, discover)
 
-    If extraction parameters are provided, performs extraction and merges results
-    into the action result JSON before returning to _to_context_pack.
+
+async def _extraction_summary(extract: ExtractionOpts) -> Optional[dict]:
+    """
+    Run the requested extraction and return the part merged into action results.
 
     Args:
-        action_result_json: JSON result from the action
-        extract_selectors: Simple extraction selectors
-        extract_container: Container selector for structured extraction
-        extract_fields: Fields for structured extraction
-        extract_selector_type: Selector type for container
-        extract_wait_visible: Wait for elements to be visible
-        extract_timeout: Timeout for extraction
-        extract_max_items: Limit number of containers to extract
-        extract_discover: Discovery mode flag
-        extract_wait_content: Smart wait config for lazy-loaded content
+        extract: The extraction to run
 
     Returns:
-        Merged JSON result with extraction data
-    """
-    import json as _json
-
-    # If no extraction parameters, return original result
-    if not extract_selectors and not extract_container:
-        return action_result_json
-
-    # Perform extraction
-    extraction_result_json = await extraction.extract_elements(
-        selectors=extract_selectors,
-        container_selector=extract_container,
-        fields=extract_fields,
-        selector_type=extract_selector_type,
-        wait_for_visible=extract_wait_visible,
-        timeout=extract_timeout,
-        max_items=extract_max_items,
-        discover_containers=extract_discover,
-        wait_for_content_loaded=extract_wait_content
+        The extraction summary, or None if the extraction result is unusable
+    """
+    extraction_result = await extraction.extract_elements_data(
+        selectors=extract.selectors,
+        container_selector=extract.container,
+        fields=extract.fields,
+        selector_type=extract.selector_type,
+        wait_for_visible=extract.wait_visible,
+        timeout=extract.timeout,
+        max_items=extract.max_items,
+        discover_containers=extract.discover,
+        wait_for_content_loaded=extract.wait_content
     )
+    if not isinstance(extraction_result, dict):
+        logger.warning("extraction returned %s, not a result dict; not merged", type(extraction_result).__name__)
+        return None
+    return {
+        'mode': extraction_result.get('mode'),
+        'extracted_elements': extraction_result.get('extracted_elements'),
+        'items': extraction_result.get('items'),
+        'count': extraction_result.get('count')
+    }
+
+
+def _pack_with_extraction(
+    action_result_json: Union[dict, str, bytes],
+    opts: ShapeOpts,
+    extract: Optional[ExtractionOpts] = None,
+) -> Awaitable[str]:
+    """
+    Pack an action result, merging extraction results into its `mixed` field.
+
+    Not a coroutine itself: without an extraction (the usual case) it hands
+    back the _to_context_pack coroutine as is, so the hot path costs no extra
+    coroutine frame. Await the result either way.
+
+    Args:
+        action_result_json: Result dict (or JSON str/bytes) from the action
+        opts: Shaping options for _to_context_pack
+        extract: Extraction to run alongside (see _extraction_opts), or None
+
+    Returns:
+        Awaitable of the JSON-serialized ContextPack
+    """
+    if extract is None:
+        return _to_context_pack(result_json=action_result_json, opts=opts)
+    return _pack_and_merge_extraction(action_result_json, opts, extract)
+
+
+# Placeholder for the extraction summary in the action result; packed like
+# any other field, then swapped for the encoded summary in the pack string
+_EXTRACTION_SLOT = "\x00extraction\x00"
+# Matches the encoded slot whichever backend wrote the pack: orjson/msgspec
+# separate compactly, the stdlib fallback with ", " and ": "
+_ENCODED_EXTRACTION_SLOT = re.compile(r',\s*"extraction":\s*' + re.escape(_dumps(_EXTRACTION_SLOT)))
 
-    # Parse both results
-    try:
-        action_result = _json.loads(action_result_json)
-        extraction_result = _json.loads(extraction_result_json)
-
-        # Merge extraction data into action result
-        # The extraction results will appear in the 'mixed' field via _to_context_pack
-        action_result['extraction'] = {
-            'mode': extraction_result.get('mode'),
-            'extracted_elements': extraction_result.get('extracted_elements'),
-            'items': extraction_result.get('items'),
-            'count': extraction_result.get('count')
-        }
 
-        return _json.dumps(action_result)
-    except Exception:
-        # If merge fails, return original result
-        return action_result_json
+async def _pack_and_merge_extraction(action_result_json: Union[dict, str, bytes], opts: ShapeOpts, extract: ExtractionOpts) -> str:
+    """
+    _pack_with_extraction() when extraction was requested. The extraction (a
+    Selenium round trip) and the snapshot packing (CPU work) read the same
+    settled page, so they run concurrently.
+
+    The merge is done on the action result dict: it is packed with a
+    placeholder under "extraction", which the encoded summary replaces in the
+    pack string, so the pack is never parsed and encoded again. A failed
+    extraction is logged and its placeholder dropped.
+    """
+    result = action_result_json if isinstance(action_result_json, dict) else _loads(action_result_json)
+    result = {**result, "extraction": _EXTRACTION_SLOT}
+    summary, pack = await asyncio.gather(
+        _extraction_summary(extract),
+        _to_context_pack(result_json=result, opts=opts),
+        return_exceptions=True,
+    )
+    if isinstance(pack, BaseException):
+        raise pack
+    if isinstance(summary, BaseException):
+        if not isinstance(summary, Exception):
+            raise summary  # cancellation
+        logger.warning("extraction failed, returning the pack without it: %r", summary)
+        summary = None
+
+    merged = "" if summary is None else ',"extraction":' + _dumps(summary)
+    # A callable replacement, so backslashes in the summary are taken literally
+    out, found = _ENCODED_EXTRACTION_SLOT.subn(lambda m: merged, pack)
+    if found:
+        return out
+
+    # Slot not found in the encoded pack: merge the parsed pack instead
+    obj = _loads(pack)
+    mixed = obj.get("mixed")
+    if not isinstance(mixed, dict):
+        mixed = obj["mixed"] = {}
+    mixed.pop("extraction", None)
+    if summary is not None:
+        mixed["extraction"] = summary
+    return _dumps(obj)
 #endregion
 
 #region Logging
@@ -362,6 +467,8 @@ async def mcp_browser_use__start_browser(
     return_mode: str = "outline",
     cleaning_level: int = 2,
     token_budget: int = 5_000,
+    detail_level: DetailLevel = None,
+    diff_mode: DiffMode = None,
 ) -> str:
     """
     Start a browser session or open a new window in an existing session.
@@ -373,18 +480,24 @@ async def mcp_browser_use__start_browser(
     Returns:
         ContextPack JSON
     """
+    # Chrome startup takes seconds; load the cleaning stack meanwhile
+    warm = _prewarm_packing()
     result = await browser_management.start_browser()
+    if warm is not None:
+        await warm
     return await _to_context_pack(
         result_json=result,
-        return_mode=return_mode,
-        cleaning_level=cleaning_level,
-        token_budget=token_budget
+        opts=ShapeOpts(
+            return_mode=return_mode,
+            cleaning_level=cleaning_level,
+            token_budget=token_budget,
+            detail_level=detail_level,
+            diff_mode=diff_mode,
+        ),
     )
 
 @mcp.tool()
-@tool_envelope
-@exclusive_browser_access
-@ensure_driver_ready
+@browser_tool
 async def mcp_browser_use__navigate_to_url(
     url: str,
     wait_for: str = "load",
@@ -392,6 +505,8 @@ async def mcp_browser_use__navigate_to_url(
     return_mode: str = "outline",
     cleaning_level: int = 2,
     token_budget: int = 5_000,
+    detail_level: DetailLevel = None,
+    diff_mode: DiffMode = None,
     text_offset: Optional[int] = None,
     html_offset: Optional[int] = None,
     # Optional extraction parameters
@@ -425,9 +540,14 @@ async def mcp_browser_use__navigate_to_url(
             **Recommendation**: Use "outline" for navigation, "text" for content extraction.
         cleaning_level: Structural/content cleaning intensity for snapshot rendering.
             0 = none, 1 = light, 2 = default, 3 = aggressive.
+            -1 = raw page as captured, scripts included: no cleaning pass at all,
+            the fastest option with return_mode="html" when the agent wants the DOM verbatim.
             **Recommendation**: Start with 3 (aggressive) to minimize tokens.
         token_budget: Approximate token cap for the returned snapshot. Should usually be 5_000 or lower.
             **Recommendation**: Start with 1000-2000, only increase if needed.
+        detail_level: "full", "interactive" (actionable elements only, long text summarized) or "minimal" (url and title only).
+            Defaults to MCP_DEFAULT_DETAIL_LEVEL.
+        diff_mode: Elide subtrees unchanged since the previous html-mode snapshot. Defaults to MCP_SNAPSHOT_DIFF.
         text_offset: Optional character offset to start text extraction (for pagination).
             Only applies when return_mode="text".
             Example: Use text_offset=10000 to skip the first 10,000 characters.
@@ -499,47 +619,167 @@ async def mcp_browser_use__navigate_to_url(
 
           This is more efficient than calling navigate followed by extract_elements separately.
     """
-    result = await navigation.navigate_to_url(url=url, wait_for=wait_for, timeout_sec=timeout_sec)
+    result = await navigation.navigate_to_url(
+        url=url, wait_for=wait_for, timeout_sec=timeout_sec
+    )
 
-    # Merge extraction results if extraction parameters provided
-    result = await _merge_extraction_results(
+    # Extraction (if requested) runs while the snapshot is packed
+    return await _pack_with_extraction(
         action_result_json=result,
-        extract_selectors=extract_selectors,
-        extract_container=extract_container,
-        extract_fields=extract_fields,
-        extract_selector_type=extract_selector_type,
-        extract_wait_visible=extract_wait_visible,
-        extract_timeout=extract_timeout,
-        extract_max_items=extract_max_items,
-        extract_discover=extract_discover
+        opts=ShapeOpts(
+            return_mode=return_mode,
+            cleaning_level=cleaning_level,
+            token_budget=token_budget,
+            text_offset=text_offset,
+            html_offset=html_offset,
+            detail_level=detail_level,
+            diff_mode=diff_mode,
+        ),
+        extract=_extraction_opts(
+            extract_selectors, extract_container, extract_fields, extract_selector_type,
+            extract_wait_visible, extract_timeout, extract_max_items, extract_discover,
+        ),
     )
 
+@mcp.tool()
+@browser_tool
+async def mcp_browser_use__navigate_and_wait_idle(
+    url: str,
+    idle_ms: int = 500,
+    timeout_sec: int = 20,
+    return_mode: str = "outline",
+    cleaning_level: int = 2,
+    token_budget: int = 5_000,
+    detail_level: DetailLevel = None,
+    diff_mode: DiffMode = None,
+    text_offset: Optional[int] = None,
+    html_offset: Optional[int] = None,
+) -> str:
+    """
+    MCP tool: Navigate to a URL, wait until the page is loaded and network-idle, and return a ContextPack.
+
+    Use this instead of `navigate_to_url` for pages that keep fetching data after the
+    load event (single-page apps, lazy lists) when the next step needs that data.
+    The load/idle wait and the snapshot run inside the browser in one round-trip.
+
+    Args:
+        url: Absolute URL to navigate to.
+        idle_ms: How long (ms) no new network resources may arrive before the page counts as idle.
+        timeout_sec: Maximum time (seconds) to wait for load and idle; the snapshot is taken anyway afterwards.
+        return_mode: Snapshot content type {"outline","text","html","dompaths","mixed"}.
+        cleaning_level: Structural/content cleaning intensity (0–3), or -1 for the raw page (no cleaning; fastest with return_mode="html").
+        token_budget: Approximate token cap for the returned snapshot. Should usually be 5_000 or lower.
+        detail_level: "full", "interactive" (actionable elements only, long text summarized) or "minimal" (url and title only).
+            Defaults to MCP_DEFAULT_DETAIL_LEVEL.
+        diff_mode: Elide subtrees unchanged since the previous html-mode snapshot. Defaults to MCP_SNAPSHOT_DIFF.
+
+    Returns:
+        str: JSON-serialized ContextPack captured after the page went idle.
+    """
+    result = await navigation.navigate_and_wait_idle(
+        url=url,
+        idle_ms=idle_ms,
+        timeout_sec=timeout_sec,
+    )
     return await _to_context_pack(
         result_json=result,
-        return_mode=return_mode,
-        cleaning_level=cleaning_level,
-        token_budget=token_budget,
-        text_offset=text_offset,
-        html_offset=html_offset
+        opts=ShapeOpts(
+            return_mode=return_mode,
+            cleaning_level=cleaning_level,
+            token_budget=token_budget,
+            text_offset=text_offset,
+            html_offset=html_offset,
+            detail_level=detail_level,
+            diff_mode=diff_mode,
+        ),
     )
 
 @mcp.tool()
-@tool_envelope
-@exclusive_browser_access
-@ensure_driver_ready
+@browser_tool
+async def mcp_browser_use__navigate_and_wait(
+    url: str,
+    selector: str,
+    selector_type: SelectorType = "css",
+    condition: WaitCondition = "visible",
+    wait_for: str = "load",
+    timeout_sec: int = 20,
+    timeout: Timeout = 10.0,
+    iframe_selector: OptionalSelector = None,
+    iframe_selector_type: SelectorType = "css",
+    return_mode: str = "outline",
+    cleaning_level: int = 2,
+    token_budget: int = 5_000,
+    text_offset: Optional[int] = None,
+    html_offset: Optional[int] = None,
+    detail_level: DetailLevel = None,
+    diff_mode: DiffMode = None,
+) -> str:
+    """
+    MCP tool: Navigate to a URL, wait for an element, and return one ContextPack snapshot.
+
+    Equivalent to `navigate_to_url` followed by `wait_for_element`, but performed under a
+    single browser lock with a single snapshot taken after the wait.
+
+    Args:
+        url: Absolute URL to navigate to.
+        selector: Element locator (CSS or XPath) to wait for after navigation.
+        selector_type: One of {"css", "xpath", "id"}.
+        condition: What to wait for - 'present', 'visible', or 'clickable'.
+        wait_for: Page readiness before the element wait - "load" (default) or "complete".
+        timeout_sec: Maximum time (seconds) to wait for navigation readiness.
+        timeout: Maximum time (seconds) to wait for the element condition.
+        iframe_selector: Optional iframe locator containing the element.
+        iframe_selector_type: One of {"css", "xpath"}.
+        return_mode: Snapshot content type {"outline","text","html","dompaths","mixed"}.
+        cleaning_level: Structural/content cleaning intensity (0–3), or -1 for the raw page (no cleaning; fastest with return_mode="html").
+        token_budget: Approximate token cap for the returned snapshot. Should usually be 5_000 or lower.
+        detail_level: "full", "interactive" (actionable elements only, long text summarized) or "minimal" (url and title only).
+        diff_mode: Elide subtrees unchanged since the previous html-mode snapshot. Defaults to MCP_SNAPSHOT_DIFF.
+
+    Returns:
+        str: JSON-serialized ContextPack captured after the wait condition.
+    """
+    result = await navigation.navigate_and_wait(
+        url=url,
+        selector=selector,
+        selector_type=selector_type,
+        condition=condition,
+        wait_for=wait_for,
+        timeout_sec=timeout_sec,
+        timeout=timeout,
+        iframe_selector=iframe_selector,
+        iframe_selector_type=iframe_selector_type,
+    )
+    return await _to_context_pack(
+        result_json=result,
+        opts=ShapeOpts(
+            return_mode=return_mode,
+            cleaning_level=cleaning_level,
+            token_budget=token_budget,
+            text_offset=text_offset,
+            html_offset=html_offset,
+            detail_level=detail_level,
+            diff_mode=diff_mode,
+        ),
+    )
+
+@mcp.tool()
+@browser_tool
 async def mcp_browser_use__fill_text(
     selector: str,
     text: str,
-    selector_type: str = "css",
+    selector_type: SelectorType = "css",
     clear_first: bool = True,
-    timeout: float = 10.0,
-    iframe_selector: Optional[str] = None,
-    iframe_selector_type: str = "css",
-    shadow_root_selector: Optional[str] = None,
-    shadow_root_selector_type: str = "css",
+    timeout: Timeout = 10.0,
+    iframe_selector: OptionalSelector = None,
+    iframe_selector_type: SelectorType = "css",
+    shadow_root_selector: OptionalSelector = None,
+    shadow_root_selector_type: SelectorType = "css",
     return_mode: str = "outline",
     cleaning_level: int = 2,
     token_budget: int = 5_000,
+    detail_level: DetailLevel = None,
+    diff_mode: DiffMode = None,
     text_offset: Optional[int] = None,
     html_offset: Optional[int] = None,
     # Optional extraction parameters
@@ -572,8 +812,11 @@ async def mcp_browser_use__fill_text(
         shadow_root_selector: Optional shadow root host locator.
         shadow_root_selector_type: One of {"css", "xpath"}.
         return_mode: Snapshot content type {"outline","text","html","dompaths","mixed"}.
-        cleaning_level: Structural/content cleaning intensity (0–3).
+        cleaning_level: Structural/content cleaning intensity (0–3), or -1 for the raw page (no cleaning; fastest with return_mode="html").
         token_budget: Approximate token cap for the returned snapshot. Should usually be 5_000 or lower.
+        detail_level: "full", "interactive" (actionable elements only, long text summarized) or "minimal" (url and title only).
+            Defaults to MCP_DEFAULT_DETAIL_LEVEL.
+        diff_mode: Elide subtrees unchanged since the previous html-mode snapshot. Defaults to MCP_SNAPSHOT_DIFF.
 
         extract_selectors: [OPTIONAL EXTRACTION] Simple extraction selectors (MODE 1).
         extract_container: [OPTIONAL EXTRACTION] Container selector for structured extraction (MODE 2).
@@ -609,44 +852,40 @@ async def mcp_browser_use__fill_text(
         shadow_root_selector_type=shadow_root_selector_type,
     )
 
-    # Merge extraction results if extraction parameters provided
-    result = await _merge_extraction_results(
+    # Extraction (if requested) runs while the snapshot is packed
+    return await _pack_with_extraction(
         action_result_json=result,
-        extract_selectors=extract_selectors,
-        extract_container=extract_container,
-        extract_fields=extract_fields,
-        extract_selector_type=extract_selector_type,
-        extract_wait_visible=extract_wait_visible,
-        extract_timeout=extract_timeout,
-        extract_max_items=extract_max_items,
-        extract_discover=extract_discover
-    )
-
-    return await _to_context_pack(
-        result_json=result,
-        return_mode=return_mode,
-        cleaning_level=cleaning_level,
-        token_budget=token_budget,
-        text_offset=text_offset,
-        html_offset=html_offset
+        opts=ShapeOpts(
+            return_mode=return_mode,
+            cleaning_level=cleaning_level,
+            token_budget=token_budget,
+            text_offset=text_offset,
+            html_offset=html_offset,
+            detail_level=detail_level,
+            diff_mode=diff_mode,
+        ),
+        extract=_extraction_opts(
+            extract_selectors, extract_container, extract_fields, extract_selector_type,
+            extract_wait_visible, extract_timeout, extract_max_items, extract_discover,
+        ),
     )
 
 @mcp.tool()
-@tool_envelope
-@exclusive_browser_access
-@ensure_driver_ready
+@browser_tool
 async def mcp_browser_use__click_element(
     selector: str,
-    selector_type: str = "css",
-    timeout: float = 10.0,
+    selector_type: SelectorType = "css",
+    timeout: Timeout = 10.0,
     force_js: bool = False,
-    iframe_selector: Optional[str] = None,
-    iframe_selector_type: str = "css",
-    shadow_root_selector: Optional[str] = None,
-    shadow_root_selector_type: str = "css",
+    iframe_selector: OptionalSelector = None,
+    iframe_selector_type: SelectorType = "css",
+    shadow_root_selector: OptionalSelector = None,
+    shadow_root_selector_type: SelectorType = "css",
     return_mode: str = "outline",
     cleaning_level: int = 2,
     token_budget: int = 5_000,
+    detail_level: DetailLevel = None,
+    diff_mode: DiffMode = None,
     text_offset: Optional[int] = None,
     html_offset: Optional[int] = None,
     # Optional extraction parameters
@@ -679,8 +918,11 @@ async def mcp_browser_use__click_element(
         shadow_root_selector_type: One of {"css", "xpath"}; applies to `shadow_root_selector`.
         return_mode: Controls the content type in the ContextPack snapshot.
             {"outline", "text", "html", "dompaths", "mixed"}.
-        cleaning_level: Structural/content cleaning intensity (0–3).
+        cleaning_level: Structural/content cleaning intensity (0–3), or -1 for the raw page (no cleaning; fastest with return_mode="html").
         token_budget: Approximate token cap for the returned snapshot. Should usually be 5_000 or lower.
+        detail_level: "full", "interactive" (actionable elements only, long text summarized) or "minimal" (url and title only).
+            Defaults to MCP_DEFAULT_DETAIL_LEVEL.
+        diff_mode: Elide subtrees unchanged since the previous html-mode snapshot. Defaults to MCP_SNAPSHOT_DIFF.
 
         extract_selectors: [OPTIONAL EXTRACTION] Simple extraction selectors (MODE 1).
         extract_container: [OPTIONAL EXTRACTION] Container selector for structured extraction (MODE 2).
@@ -717,40 +959,194 @@ async def mcp_browser_use__click_element(
         shadow_root_selector_type=shadow_root_selector_type,
     )
 
-    # Merge extraction results if extraction parameters provided
-    result = await _merge_extraction_results(
+    # Extraction (if requested) runs while the snapshot is packed
+    return await _pack_with_extraction(
         action_result_json=result,
-        extract_selectors=extract_selectors,
-        extract_container=extract_container,
-        extract_fields=extract_fields,
-        extract_selector_type=extract_selector_type,
-        extract_wait_visible=extract_wait_visible,
-        extract_timeout=extract_timeout,
-        extract_max_items=extract_max_items,
-        extract_discover=extract_discover
+        opts=ShapeOpts(
+            return_mode=return_mode,
+            cleaning_level=cleaning_level,
+            token_budget=token_budget,
+            text_offset=text_offset,
+            html_offset=html_offset,
+            detail_level=detail_level,
+            diff_mode=diff_mode,
+        ),
+        extract=_extraction_opts(
+            extract_selectors, extract_container, extract_fields, extract_selector_type,
+            extract_wait_visible, extract_timeout, extract_max_items, extract_discover,
+        ),
     )
 
+@mcp.tool()
+@browser_tool
+async def mcp_browser_use__click_and_wait(
+    selector: str,
+    wait_selector: str,
+    selector_type: SelectorType = "css",
+    timeout: Timeout = 10.0,
+    force_js: bool = False,
+    iframe_selector: OptionalSelector = None,
+    iframe_selector_type: SelectorType = "css",
+    shadow_root_selector: OptionalSelector = None,
+    shadow_root_selector_type: SelectorType = "css",
+    wait_selector_type: SelectorType = "css",
+    wait_condition: WaitCondition = "visible",
+    wait_timeout: Timeout = 10.0,
+    wait_iframe_selector: OptionalSelector = None,
+    wait_iframe_selector_type: SelectorType = "css",
+    return_mode: str = "outline",
+    cleaning_level: int = 2,
+    token_budget: int = 5_000,
+    text_offset: Optional[int] = None,
+    html_offset: Optional[int] = None,
+    detail_level: DetailLevel = None,
+    diff_mode: DiffMode = None,
+) -> str:
+    """
+    MCP tool: Click an element, wait for another element, and return one ContextPack snapshot.
+
+    Equivalent to `click_element` followed by `wait_for_element`, but performed under a
+    single browser lock with a single snapshot taken after the wait.
+
+    Args:
+        selector: Locator (CSS or XPath) of the element to click.
+        wait_selector: Locator of the element to wait for after the click.
+        selector_type: One of {"css", "xpath"}; applies to `selector`.
+        timeout: Maximum time (seconds) to locate a clickable element.
+        force_js: If True, use JavaScript-based click instead of native click.
+        iframe_selector: Optional iframe locator containing the element to click.
+        iframe_selector_type: One of {"css", "xpath"}.
+        shadow_root_selector: Optional shadow root host locator for the element to click.
+        shadow_root_selector_type: One of {"css", "xpath"}.
+        wait_selector_type: One of {"css", "xpath"}; applies to `wait_selector`.
+        wait_condition: What to wait for - 'present', 'visible', or 'clickable'.
+        wait_timeout: Maximum time (seconds) to wait for `wait_selector`.
+        wait_iframe_selector: Optional iframe locator containing `wait_selector`.
+        wait_iframe_selector_type: One of {"css", "xpath"}.
+        return_mode: Snapshot content type {"outline","text","html","dompaths","mixed"}.
+        cleaning_level: Structural/content cleaning intensity (0–3), or -1 for the raw page (no cleaning; fastest with return_mode="html").
+        token_budget: Approximate token cap for the returned snapshot. Should usually be 5_000 or lower.
+        detail_level: "full", "interactive" (actionable elements only, long text summarized) or "minimal" (url and title only).
+        diff_mode: Elide subtrees unchanged since the previous html-mode snapshot. Defaults to MCP_SNAPSHOT_DIFF.
+
+    Returns:
+        str: JSON-serialized ContextPack captured after the wait condition.
+    """
+    result = await interaction.click_and_wait(
+        selector=selector,
+        wait_selector=wait_selector,
+        selector_type=selector_type,
+        timeout=timeout,
+        force_js=force_js,
+        iframe_selector=iframe_selector,
+        iframe_selector_type=iframe_selector_type,
+        shadow_root_selector=shadow_root_selector,
+        shadow_root_selector_type=shadow_root_selector_type,
+        wait_selector_type=wait_selector_type,
+        wait_condition=wait_condition,
+        wait_timeout=wait_timeout,
+        wait_iframe_selector=wait_iframe_selector,
+        wait_iframe_selector_type=wait_iframe_selector_type,
+    )
     return await _to_context_pack(
         result_json=result,
-        return_mode=return_mode,
-        cleaning_level=cleaning_level,
-        token_budget=token_budget,
-        text_offset=text_offset,
-        html_offset=html_offset
+        opts=ShapeOpts(
+            return_mode=return_mode,
+            cleaning_level=cleaning_level,
+            token_budget=token_budget,
+            text_offset=text_offset,
+            html_offset=html_offset,
+            detail_level=detail_level,
+            diff_mode=diff_mode,
+        ),
     )
 
 @mcp.tool()
-@tool_envelope
-@exclusive_browser_access
-@ensure_driver_ready
+@browser_tool
+async def mcp_browser_use__fill_text_and_submit(
+    selector: str,
+    text: str,
+    selector_type: SelectorType = "css",
+    clear_first: bool = True,
+    timeout: Timeout = 10.0,
+    iframe_selector: OptionalSelector = None,
+    iframe_selector_type: SelectorType = "css",
+    shadow_root_selector: OptionalSelector = None,
+    shadow_root_selector_type: SelectorType = "css",
+    submit_key: str = "ENTER",
+    return_mode: str = "outline",
+    cleaning_level: int = 2,
+    token_budget: int = 5_000,
+    text_offset: Optional[int] = None,
+    html_offset: Optional[int] = None,
+    detail_level: DetailLevel = None,
+    diff_mode: DiffMode = None,
+) -> str:
+    """
+    MCP tool: Fill an input and submit it with a key press, returning one ContextPack snapshot.
+
+    Equivalent to `fill_text` followed by `send_keys("ENTER")` on the same element, but
+    performed under a single browser lock with a single snapshot taken after the submit.
+
+    Args:
+        selector: Element locator (CSS or XPath) of the input.
+        text: The exact text to set.
+        selector_type: One of {"css", "xpath"}.
+        clear_first: If True, clear any existing value before typing.
+        timeout: Maximum time (seconds) to locate and interact with the element.
+        iframe_selector: Optional iframe locator containing the element.
+        iframe_selector_type: One of {"css", "xpath"}.
+        shadow_root_selector: Optional shadow root host locator.
+        shadow_root_selector_type: One of {"css", "xpath"}.
+        submit_key: Key sent after typing (default "ENTER").
+        return_mode: Snapshot content type {"outline","text","html","dompaths","mixed"}.
+        cleaning_level: Structural/content cleaning intensity (0–3), or -1 for the raw page (no cleaning; fastest with return_mode="html").
+        token_budget: Approximate token cap for the returned snapshot. Should usually be 5_000 or lower.
+        detail_level: "full", "interactive" (actionable elements only, long text summarized) or "minimal" (url and title only).
+        diff_mode: Elide subtrees unchanged since the previous html-mode snapshot. Defaults to MCP_SNAPSHOT_DIFF.
+
+    Returns:
+        str: JSON-serialized ContextPack with the snapshot after submitting.
+    """
+    result = await interaction.fill_text_and_submit(
+        selector=selector,
+        text=text,
+        selector_type=selector_type,
+        clear_first=clear_first,
+        timeout=timeout,
+        iframe_selector=iframe_selector,
+        iframe_selector_type=iframe_selector_type,
+        shadow_root_selector=shadow_root_selector,
+        shadow_root_selector_type=shadow_root_selector_type,
+        submit_key=submit_key,
+    )
+    return await _to_context_pack(
+        result_json=result,
+        opts=ShapeOpts(
+            return_mode=return_mode,
+            cleaning_level=cleaning_level,
+            token_budget=token_budget,
+            text_offset=text_offset,
+            html_offset=html_offset,
+            detail_level=detail_level,
+            diff_mode=diff_mode,
+        ),
+    )
+
+@mcp.tool()
+@browser_tool(shared=True)
 async def mcp_browser_use__take_screenshot(
     screenshot_path: Optional[str] = None,
     return_base64: bool = False,
     return_snapshot: bool = False,
     thumbnail_width: Optional[int] = None,
+    thumbnail_format: Literal["webp", "jpeg", "png"] = "webp",
+    thumbnail_quality: Annotated[int, Field(ge=1, le=100)] = 80,
     return_mode: str = "outline",
     cleaning_level: int = 2,
     token_budget: int = 5_000,
+    detail_level: DetailLevel = None,
+    diff_mode: DiffMode = None,
     text_offset: Optional[int] = None,
     html_offset: Optional[int] = None,
 ) -> str:
@@ -759,75 +1155,172 @@ async def mcp_browser_use__take_screenshot(
         return_base64=return_base64,
         return_snapshot=return_snapshot,
         thumbnail_width=thumbnail_width,
+        thumbnail_format=thumbnail_format,
+        thumbnail_quality=thumbnail_quality,
     )
     return await _to_context_pack(
         result_json=result,
-        return_mode=return_mode,
-        cleaning_level=cleaning_level,
-        token_budget=token_budget,
-        text_offset=text_offset,
-        html_offset=html_offset
+        opts=ShapeOpts(
+            return_mode=return_mode,
+            cleaning_level=cleaning_level,
+            token_budget=token_budget,
+            text_offset=text_offset,
+            html_offset=html_offset,
+            detail_level=detail_level,
+            diff_mode=diff_mode,
+        ),
     )
 #endregion
 
-#region Tools -- Debugging
+#region Tools -- Batch
 @mcp.tool()
-@tool_envelope
-async def mcp_browser_use__get_debug_diagnostics_info(
+@browser_tool
+async def mcp_browser_use__batch(
+    steps: list,
+    stop_on_error: bool = True,
     return_mode: str = "outline",
-    cleaning_level: int = 2,
-    token_budget: int = 5_000,
+    cleaning_level: int = 3,
+    token_budget: int = 1_000,
     text_offset: Optional[int] = None,
     html_offset: Optional[int] = None,
+    detail_level: DetailLevel = None,
+    diff_mode: DiffMode = None,
 ) -> str:
     """
-    MCP tool: Collect driver/browser diagnostics and return a ContextPack.
+    MCP tool: Run several browser actions under one lock and return one ContextPack.
 
-    Captures diagnostics such as driver session info, user agent, window size, active
-    targets, and other implementation-specific debug fields. Diagnostics are included
-    in the ContextPack's auxiliary section (e.g., `mixed.diagnostics`).
+    Each step is {"tool": <name>, "args": {...}, "expectation": bool}. Supported tools:
+    navigate_to_url, navigate_and_wait_idle, navigate_and_wait, scroll, fill_text,
+    click_element, send_keys, wait_for_element, click_and_wait, fill_text_and_submit
+    (with or without the "mcp_browser_use__" prefix). Args are the same as for the
+    standalone tools; snapshot rendering args are taken from this call.
 
-    **Performance Recommendation**: Use token_budget=500 and cleaning_level=3.
-    Diagnostic info is typically metadata, not content.
+    Intermediate steps skip page capture and report a short ack. Set
+    "expectation": true on a step to capture it and get its own ContextPack in
+    `steps[i].pack`. The last step is always captured and rendered as the result.
 
     Args:
+        steps: List of step dicts as described above.
+        stop_on_error: Stop at the first failing step (its result becomes the response).
         return_mode: Snapshot content type {"outline","text","html","dompaths","mixed"}.
-        cleaning_level: Structural/content cleaning intensity (0–3).
-        token_budget: Approximate token cap for the returned snapshot. Should usually be 5_000 or lower.
+        cleaning_level: Structural/content cleaning intensity (0–3), or -1 for the raw page (no cleaning; fastest with return_mode="html").
+        token_budget: Approximate token cap for the returned snapshot.
+        detail_level: "full", "interactive" (actionable elements only, long text summarized) or "minimal" (url and title only).
+        diff_mode: Elide subtrees unchanged since the previous html-mode snapshot. Defaults to MCP_SNAPSHOT_DIFF.
 
     Returns:
-        str: JSON-serialized ContextPack including diagnostics in `mixed`.
+        str: JSON-serialized ContextPack of the last executed step; `mixed.steps`
+        lists the per-step acks.
+
+    Example:
+        steps=[
+            {"tool": "fill_text", "args": {"selector": "#q", "text": "shoes"}},
+            {"tool": "click_element", "args": {"selector": "button[type=submit]"}},
+            {"tool": "wait_for_element", "args": {"selector": ".results"}}
+        ]
+    """
+    step_opts = ShapeOpts(
+        return_mode=return_mode,
+        cleaning_level=cleaning_level,
+        token_budget=token_budget,
+        detail_level=detail_level,
+        diff_mode=diff_mode,
+    )
 
-    Raises:
-        RuntimeError: If diagnostics cannot be collected.
-        ValueError: If `return_mode` is invalid.
+    async def render(result_json: str) -> str:
+        return await _to_context_pack(result_json=result_json, opts=step_opts)
+
+    result = await batch.run_batch(steps=steps, stop_on_error=stop_on_error, render=render)
+    return await _to_context_pack(
+        result_json=result,
+        opts=ShapeOpts(
+            return_mode=return_mode,
+            cleaning_level=cleaning_level,
+            token_budget=token_budget,
+            text_offset=text_offset,
+            html_offset=html_offset,
+            detail_level=detail_level,
+            diff_mode=diff_mode,
+        ),
+    )
+#endregion
+
+#region Tools -- Debugging
+@mcp.tool()
+@tool_envelope
+async def mcp_browser_use__get_debug_diagnostics_info() -> str:
+    """
+    MCP tool: Collect driver/browser diagnostics.
+
+    Captures diagnostics such as driver session info, user agent, window size, active
+    targets, and other implementation-specific debug fields. The result is metadata
+    only: it is returned under `mixed.diagnostics` without a page snapshot.
+
+    Returns:
+        str: JSON object with `url`/`title` (null) and the diagnostics in `mixed`.
 
     Notes:
         - Useful for troubleshooting issues such as stale sessions, blocked popups,
           or failed navigation. Avoid exposing sensitive values in logs.
     """
-    diagnostics = await debugging.get_debug_diagnostics_info()
-    return await _to_context_pack(
-        result_json=diagnostics,
-        return_mode=return_mode,
-        cleaning_level=cleaning_level,
-        token_budget=token_budget,
-        text_offset=text_offset,
-        html_offset=html_offset
-    )
+    return _metadata_pack(debugging.get_debug_diagnostics_info())
 
 @mcp.tool()
 @tool_envelope
-@exclusive_browser_access
-@ensure_driver_ready
+async def mcp_browser_use__get_diagnostics(
+    diagnostics_id: str,
+) -> str:
+    """
+    MCP tool: Retrieve the post-mortem diagnostics for a failed tool call.
+
+    Failing tools do not collect diagnostics inline; they return a
+    `diagnostics_id` and the driver/browser post-mortem is gathered in the
+    background. Pass that id here to fetch it. Does not touch the browser and
+    does not take the action lock.
+
+    Args:
+        diagnostics_id: The `diagnostics_id` field from a failed tool response.
+
+    Returns:
+        str: JSON with ok=True, error, error_type, created_at and diagnostics, or
+        ok=False with error "pending" (still collecting, retry shortly) or
+        "unknown_diagnostics_id".
+    """
+    return await asyncio.to_thread(debugging.get_diagnostics, diagnostics_id)
+
+@mcp.tool()
+@tool_envelope
+async def mcp_browser_use__read_chromedriver_log(
+    lines: int = 50,
+    from_top: bool = False,
+) -> str:
+    """
+    MCP tool: Read the Chromedriver log of this server process.
+
+    Returns the most recent lines by default; only the tail of the file is
+    read, so large logs stay cheap. Does not touch the browser and does not
+    take the action lock.
+
+    Args:
+        lines: Number of lines to return (default 50).
+        from_top: Return the first `lines` lines instead of the last.
+
+    Returns:
+        str: JSON with ok, log_path, from_top, lines_read, has_errors and
+        content, or ok=False with error "log_not_found".
+    """
+    return await asyncio.to_thread(debugging.read_chromedriver_log, lines, from_top)
+
+@mcp.tool()
+@browser_tool(shared=True)
 async def mcp_browser_use__debug_element(
     selector: str,
-    selector_type: str = "css",
-    timeout: float = 10.0,
-    iframe_selector: Optional[str] = None,
-    iframe_selector_type: str = "css",
-    shadow_root_selector: Optional[str] = None,
-    shadow_root_selector_type: str = "css",
+    selector_type: SelectorType = "css",
+    timeout: Timeout = 10.0,
+    iframe_selector: OptionalSelector = None,
+    iframe_selector_type: SelectorType = "css",
+    shadow_root_selector: OptionalSelector = None,
+    shadow_root_selector_type: SelectorType = "css",
     max_html_length: int = 5000,
     include_html: bool = True,
     return_mode: str = "outline",
@@ -835,6 +1328,8 @@ async def mcp_browser_use__debug_element(
     token_budget: int = 5_000,
     text_offset: Optional[int] = None,
     html_offset: Optional[int] = None,
+    detail_level: DetailLevel = None,
+    diff_mode: DiffMode = None,
 ) -> str:
     result = await debugging.debug_element(
         selector=selector,
@@ -849,11 +1344,15 @@ async def mcp_browser_use__debug_element(
     )
     return await _to_context_pack(
         result_json=result,
-        return_mode=return_mode,
-        cleaning_level=cleaning_level,
-        token_budget=token_budget,
-        text_offset=text_offset,
-        html_offset=html_offset
+        opts=ShapeOpts(
+            return_mode=return_mode,
+            cleaning_level=cleaning_level,
+            token_budget=token_budget,
+            text_offset=text_offset,
+            html_offset=html_offset,
+            detail_level=detail_level,
+            diff_mode=diff_mode,
+        ),
     )
 #endregion
 
@@ -861,9 +1360,9 @@ async def mcp_browser_use__debug_element(
 @mcp.tool()
 @tool_envelope
 @exclusive_browser_access
-async def mcp_browser_use__unlock_browser() -> str:
-    unlock_browser_info = await browser_management.unlock_browser()
-    return unlock_browser_info
+@fast_path
+def mcp_browser_use__unlock_browser() -> str:
+    return browser_management.unlock_browser()
 
 @mcp.tool()
 @tool_envelope
@@ -903,9 +1402,7 @@ async def mcp_browser_use__force_close_all_chrome() -> str:
 
 #region Tools -- Page interaction
 @mcp.tool()
-@tool_envelope
-@exclusive_browser_access
-@ensure_driver_ready
+@browser_tool
 async def mcp_browser_use__scroll(
     x: int = 0,
     y: int = 0,
@@ -914,6 +1411,8 @@ async def mcp_browser_use__scroll(
     token_budget: int = 100,
     text_offset: Optional[int] = None,
     html_offset: Optional[int] = None,
+    detail_level: DetailLevel = None,
+    diff_mode: DiffMode = None,
     # Optional extraction parameters
     extract_selectors: Optional[list] = None,
     extract_container: Optional[str] = None,
@@ -941,8 +1440,10 @@ async def mcp_browser_use__scroll(
         smooth: If True, perform a smooth scroll animation (if supported).
         timeout: Maximum time (seconds) to locate the `selector` when provided.
         return_mode: Snapshot content type {"outline","text","html","dompaths","mixed"}.
-        cleaning_level: Structural/content cleaning intensity (0–3).
+        cleaning_level: Structural/content cleaning intensity (0–3), or -1 for the raw page (no cleaning; fastest with return_mode="html").
         token_budget: Optional approximate token cap for the returned snapshot. It is generally advisable to set a very low token budget when scrolling.
+        detail_level: "full", "interactive" (actionable elements only, long text summarized) or "minimal" (url and title only).
+        diff_mode: Elide subtrees unchanged since the previous html-mode snapshot. Defaults to MCP_SNAPSHOT_DIFF.
 
         extract_selectors: [OPTIONAL EXTRACTION] Simple extraction selectors (MODE 1).
         extract_container: [OPTIONAL EXTRACTION] Container selector for structured extraction (MODE 2).
@@ -966,44 +1467,44 @@ async def mcp_browser_use__scroll(
           and extract newly loaded items. Example:
               scroll(y=1000, extract_container="article.product", extract_fields=[...])
     """
+    warm = _prewarm_packing()
     result = await navigation.scroll(x=x, y=y)
+    if warm is not None:
+        await warm
 
-    # Merge extraction results if extraction parameters provided
-    result = await _merge_extraction_results(
+    # Extraction (if requested) runs while the snapshot is packed
+    return await _pack_with_extraction(
         action_result_json=result,
-        extract_selectors=extract_selectors,
-        extract_container=extract_container,
-        extract_fields=extract_fields,
-        extract_selector_type=extract_selector_type,
-        extract_wait_visible=extract_wait_visible,
-        extract_timeout=extract_timeout,
-        extract_max_items=extract_max_items,
-        extract_discover=extract_discover
-    )
-
-    return await _to_context_pack(
-        result_json=result,
-        return_mode=return_mode,
-        cleaning_level=cleaning_level,
-        token_budget=token_budget,
-        text_offset=text_offset,
-        html_offset=html_offset
+        opts=ShapeOpts(
+            return_mode=return_mode,
+            cleaning_level=cleaning_level,
+            token_budget=token_budget,
+            text_offset=text_offset,
+            html_offset=html_offset,
+            detail_level=detail_level,
+            diff_mode=diff_mode,
+        ),
+        extract=_extraction_opts(
+            extract_selectors, extract_container, extract_fields, extract_selector_type,
+            extract_wait_visible, extract_timeout, extract_max_items, extract_discover,
+        ),
     )
 
 @mcp.tool()
-@tool_envelope
-@exclusive_browser_access
-@ensure_driver_ready
+@browser_tool
 async def mcp_browser_use__send_keys(
-    key: str,
+    key: Union[str, List[str]],
     selector: Optional[str] = None,
-    selector_type: str = "css",
-    timeout: float = 10.0,
+    selector_type: SelectorType = "css",
+    timeout: Timeout = 10.0,
     return_mode: str = "outline",
     cleaning_level: int = 2,
     token_budget: int = 1_000,
     text_offset: Optional[int] = None,
     html_offset: Optional[int] = None,
+    detail_level: DetailLevel = None,
+    diff_mode: DiffMode = None,
+    snapshot: bool = True,
 ) -> str:
     """
     MCP tool: Send key strokes to an element and return a ContextPack snapshot.
@@ -1012,8 +1513,8 @@ async def mcp_browser_use__send_keys(
 
     Args:
         selector: Element locator (CSS or XPath).
-        keys: A string or list of key tokens to send. Special keys can be supported by
-            name (e.g., "ENTER", "TAB", "ESCAPE") depending on implementation.
+        key: A key name (e.g., "ENTER", "TAB", "ESCAPE") or text, or a list of them;
+            a list is sent in order in a single browser command.
         selector_type: One of {"css", "xpath"}.
         timeout: Maximum time (seconds) to locate and focus the element.
         iframe_selector: Optional iframe locator containing the element.
@@ -1021,8 +1522,12 @@ async def mcp_browser_use__send_keys(
         shadow_root_selector: Optional shadow root host locator.
         shadow_root_selector_type: One of {"css", "xpath"}.
         return_mode: Snapshot content type {"outline","text","html","dompaths","mixed"}.
-        cleaning_level: Structural/content cleaning intensity (0–3).
+        cleaning_level: Structural/content cleaning intensity (0–3), or -1 for the raw page (no cleaning; fastest with return_mode="html").
         token_budget: Approximate token cap for the returned snapshot. Should usually be 5_000 or lower.
+        detail_level: "full", "interactive" (actionable elements only, long text summarized) or "minimal" (url and title only).
+        diff_mode: Elide subtrees unchanged since the previous html-mode snapshot. Defaults to MCP_SNAPSHOT_DIFF.
+        snapshot: False skips capturing the page and returns an empty ContextPack
+            (url and title only); use it for keystrokes in the middle of a sequence.
 
     Returns:
         str: JSON-serialized ContextPack with snapshot after key events.
@@ -1035,38 +1540,46 @@ async def mcp_browser_use__send_keys(
 
     Notes:
         - Combine with `wait_for_element` to ensure predictable post-typing state.
+        - When sending several keys in a row, pass snapshot=False for all but the
+          last one (or snapshot explicitly with `wait_for_element` afterwards).
     """
     result = await interaction.send_keys(
         key=key,
         selector=selector,
         selector_type=selector_type,
         timeout=timeout,
+        snapshot=snapshot,
     )
     return await _to_context_pack(
         result_json=result,
-        return_mode=return_mode,
-        cleaning_level=cleaning_level,
-        token_budget=token_budget,
-        text_offset=text_offset,
-        html_offset=html_offset
+        opts=ShapeOpts(
+            return_mode=return_mode,
+            cleaning_level=cleaning_level,
+            token_budget=token_budget,
+            text_offset=text_offset,
+            html_offset=html_offset,
+            detail_level=detail_level,
+            diff_mode=diff_mode,
+        ),
     )
 
 @mcp.tool()
-@tool_envelope
-@exclusive_browser_access
-@ensure_driver_ready
+@browser_tool
 async def mcp_browser_use__wait_for_element(
     selector: str,
-    selector_type: str = "css",
-    timeout: float = 10.0,
-    condition: str = "visible",
-    iframe_selector: Optional[str] = None,
-    iframe_selector_type: str = "css",
+    selector_type: SelectorType = "css",
+    timeout: Timeout = 10.0,
+    condition: WaitCondition = "visible",
+    iframe_selector: OptionalSelector = None,
+    iframe_selector_type: SelectorType = "css",
+    iframe_selectors: Optional[List[str]] = None,
     return_mode: str = "outline",
     cleaning_level: int = 2,
     token_budget: int = 1_000,
     text_offset: Optional[int] = None,
     html_offset: Optional[int] = None,
+    detail_level: DetailLevel = None,
+    diff_mode: DiffMode = None,
 ) -> str:
     """
     MCP tool: Wait for an element to appear (and optionally be visible) and return a snapshot.
@@ -1080,11 +1593,15 @@ async def mcp_browser_use__wait_for_element(
         timeout: Maximum time (seconds) to wait.
         iframe_selector: Optional iframe locator containing the element.
         iframe_selector_type: One of {"css", "xpath"}.
+        iframe_selectors: Optional candidate iframe locators, searched together; the
+            first one containing the element is reported back as "iframe_selector".
         shadow_root_selector: Optional shadow root host locator.
         shadow_root_selector_type: One of {"css", "xpath"}.
         return_mode: Snapshot content type {"outline","text","html","dompaths","mixed"}.
-        cleaning_level: Structural/content cleaning intensity (0–3).
+        cleaning_level: Structural/content cleaning intensity (0–3), or -1 for the raw page (no cleaning; fastest with return_mode="html").
         token_budget: Approximate token cap for the returned snapshot. Should usually be 5_000 or lower.
+        detail_level: "full", "interactive" (actionable elements only, long text summarized) or "minimal" (url and title only).
+        diff_mode: Elide subtrees unchanged since the previous html-mode snapshot. Defaults to MCP_SNAPSHOT_DIFF.
 
     Returns:
         str: JSON-serialized ContextPack capturing the page after the wait condition.
@@ -1102,20 +1619,23 @@ async def mcp_browser_use__wait_for_element(
         condition=condition,
         iframe_selector=iframe_selector,
         iframe_selector_type=iframe_selector_type,
+        iframe_selectors=iframe_selectors,
     )
     return await _to_context_pack(
         result_json=result,
-        return_mode=return_mode,
-        cleaning_level=cleaning_level,
-        token_budget=token_budget,
-        text_offset=text_offset,
-        html_offset=html_offset
+        opts=ShapeOpts(
+            return_mode=return_mode,
+            cleaning_level=cleaning_level,
+            token_budget=token_budget,
+            text_offset=text_offset,
+            html_offset=html_offset,
+            detail_level=detail_level,
+            diff_mode=diff_mode,
+        ),
     )
 
 @mcp.tool()
-@tool_envelope
-@exclusive_browser_access
-@ensure_driver_ready
+@browser_tool
 async def mcp_browser_use__extract_elements(
     selectors: Optional[list] = None,
     container_selector: Optional[str] = None,
@@ -1131,6 +1651,8 @@ async def mcp_browser_use__extract_elements(
     token_budget: int = 5_000,
     text_offset: Optional[int] = None,
     html_offset: Optional[int] = None,
+    detail_level: DetailLevel = None,
+    diff_mode: DiffMode = None,
 ) -> str:
     """
     MCP tool: Extract content from specific elements on the current page or get page snapshot.
@@ -1213,8 +1735,10 @@ async def mcp_browser_use__extract_elements(
             Results include _wait_metadata with timing and loading statistics.
 
         return_mode: Snapshot content type {"outline","text","html","dompaths","mixed"}
-        cleaning_level: Structural/content cleaning intensity (0–3)
+        cleaning_level: Structural/content cleaning intensity (0–3), or -1 for the raw page (no cleaning; fastest with return_mode="html")
         token_budget: Approximate token cap for the returned snapshot. Should usually be 5_000 or lower.
+        detail_level: "full", "interactive" (actionable elements only, long text summarized) or "minimal" (url and title only).
+        diff_mode: Elide subtrees unchanged since the previous html-mode snapshot. Defaults to MCP_SNAPSHOT_DIFF.
         text_offset: Optional character offset for text mode pagination
         html_offset: Optional character offset for html mode pagination
 
@@ -1318,7 +1842,8 @@ async def mcp_browser_use__extract_elements(
         - Use return_mode="mixed" to see extraction results alongside page content
         - All extractions performed on current page state (no navigation)
     """
-    result = await extraction.extract_elements(
+    # The result dict goes to the packer as is: no JSON round trip
+    result = await extraction.extract_elements_data(
         selectors=selectors,
         container_selector=container_selector,
         fields=fields,
@@ -1331,16 +1856,19 @@ async def mcp_browser_use__extract_elements(
     )
     return await _to_context_pack(
         result_json=result,
-        return_mode=return_mode,
-        cleaning_level=cleaning_level,
-        token_budget=token_budget,
-        text_offset=text_offset,
-        html_offset=html_offset
+        opts=ShapeOpts(
+            return_mode=return_mode,
+            cleaning_level=cleaning_level,
+            token_budget=token_budget,
+            text_offset=text_offset,
+            html_offset=html_offset,
+            detail_level=detail_level,
+            diff_mode=diff_mode,
+        ),
     )
 #endregion
 
 #region Tools -- Camoufox (Firefox-based anti-bot engine)
-import json as _json
 
 @mcp.tool()
 async def mcp_browser_use__camoufox_start(
@@ -1377,9 +1905,9 @@ async def mcp_browser_use__camoufox_start(
             os_hint=os_list,
             profile_dir=profile_dir or None,
         )
-        return _json.dumps({"ok": True, "session_id": session_id, "engine": "camoufox", "os": os_hint, "locale": locale, "profile_dir": profile_dir or None})
+        return _dumps({"ok": True, "session_id": session_id, "engine": "camoufox", "os": os_hint, "locale": locale, "profile_dir": profile_dir or None})
     except Exception as e:
-        return _json.dumps({"ok": False, "error": str(e)})
+        return _dumps({"ok": False, "error": str(e)})
 
 
 @mcp.tool()
@@ -1401,9 +1929,9 @@ async def mcp_browser_use__camoufox_navigate(
     """
     try:
         result = await camoufox_engine.navigate(session_id, url, timeout_sec=timeout_sec)
-        return _json.dumps({"ok": True, **result})
+        return _dumps({"ok": True, **result})
     except Exception as e:
-        return _json.dumps({"ok": False, "error": str(e)})
+        return _dumps({"ok": False, "error": str(e)})
 
 
 @mcp.tool()
@@ -1421,9 +1949,9 @@ async def mcp_browser_use__camoufox_screenshot(
     """
     try:
         b64 = await camoufox_engine.screenshot(session_id)
-        return _json.dumps({"ok": True, "screenshot_base64": b64})
+        return _dumps({"ok": True, "screenshot_base64": b64})
     except Exception as e:
-        return _json.dumps({"ok": False, "error": str(e)})
+        return _dumps({"ok": False, "error": str(e)})
 
 
 @mcp.tool()
@@ -1443,9 +1971,9 @@ async def mcp_browser_use__camoufox_get_html(
     """
     try:
         html = await camoufox_engine.get_html(session_id, clean=clean)
-        return _json.dumps({"ok": True, "html": html})
+        return _dumps({"ok": True, "html": html})
     except Exception as e:
-        return _json.dumps({"ok": False, "error": str(e)})
+        return _dumps({"ok": False, "error": str(e)})
 
 
 @mcp.tool()
@@ -1467,9 +1995,9 @@ async def mcp_browser_use__camoufox_click(
     """
     try:
         result = await camoufox_engine.click(session_id, selector, selector_type)
-        return _json.dumps({"ok": True, **result})
+        return _dumps({"ok": True, **result})
     except Exception as e:
-        return _json.dumps({"ok": False, "error": str(e)})
+        return _dumps({"ok": False, "error": str(e)})
 
 
 @mcp.tool()
@@ -1493,9 +2021,9 @@ async def mcp_browser_use__camoufox_fill_text(
     """
     try:
         result = await camoufox_engine.fill_text(session_id, selector, text, selector_type)
-        return _json.dumps({"ok": True, **result})
+        return _dumps({"ok": True, **result})
     except Exception as e:
-        return _json.dumps({"ok": False, "error": str(e)})
+        return _dumps({"ok": False, "error": str(e)})
 
 
 @mcp.tool()
@@ -1519,9 +2047,9 @@ async def mcp_browser_use__camoufox_wait_for_element(
     """
     try:
         result = await camoufox_engine.wait_for_element(session_id, selector, timeout, selector_type)
-        return _json.dumps({"ok": True, **result})
+        return _dumps({"ok": True, **result})
     except Exception as e:
-        return _json.dumps({"ok": False, "error": str(e)})
+        return _dumps({"ok": False, "error": str(e)})
 
 
 @mcp.tool()
@@ -1539,9 +2067,9 @@ async def mcp_browser_use__camoufox_close(
     """
     try:
         await camoufox_engine.close(session_id)
-        return _json.dumps({"ok": True, "closed": session_id})
+        return _dumps({"ok": True, "closed": session_id})
     except Exception as e:
-        return _json.dumps({"ok": False, "error": str(e)})
+        return _dumps({"ok": False, "error": str(e)})
 
 
 @mcp.tool()
@@ -1567,11 +2095,53 @@ async def mcp_browser_use__camoufox_evaluate_js(
     """
     try:
         result = await camoufox_engine.evaluate_js(session_id, script)
-        return _json.dumps({"ok": True, "result": result})
+        return _dumps({"ok": True, "result": result})
     except Exception as e:
-        return _json.dumps({"ok": False, "error": str(e)})
+        return _dumps({"ok": False, "error": str(e)})
 #endregion
 
 
+def _cache_tool_listing() -> None:
+    """
+    Answer tools/list from a listing built once instead of rebuilding every
+    tool descriptor (and re-validating every name) per request. The tool set
+    is fixed at import; the cache is keyed on the registered names anyway.
+    """
+    from mcp import types
+
+    server = mcp._mcp_server
+    build = server.request_handlers[types.ListToolsRequest]
+    cached: dict = {}
+
+    async def handler(req):
+        key = tuple(t.name for t in mcp._tool_manager.list_tools())
+        result = cached.get(key)
+        if result is None:
+            cached.clear()
+            result = cached[key] = await build(req)
+        return result
+
+    server.request_handlers[types.ListToolsRequest] = handler
+
+
+_cache_tool_listing()
+
+
+def _install_fast_event_loop() -> None:
+    """Use uvloop (winloop on Windows) for the server's event loop when installed."""
+    import asyncio
+    import sys
+
+    try:
+        if sys.platform == "win32":
+            import winloop as _loop_impl
+        else:
+            import uvloop as _loop_impl
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(_loop_impl.EventLoopPolicy())
+
+
 if __name__ == "__main__":
+    _install_fast_event_loop()
     mcp.run()
\ No newline at end of file
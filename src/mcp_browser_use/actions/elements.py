@@ -1,7 +1,8 @@
 """Element finding and interaction."""
 
 import time
-from typing import Optional
+import functools
+from typing import Optional, Tuple
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -20,17 +21,36 @@ def _wait_clickable_element(el, driver, timeout: float = 10.0):
     WebDriverWait(driver, timeout).until(lambda d: el.is_displayed() and el.is_enabled())
     return el
 
+_BY_SELECTOR = {
+    'css': By.CSS_SELECTOR,
+    'xpath': By.XPATH,
+    'id': By.ID,
+    'name': By.NAME,
+    'tag': By.TAG_NAME,
+    'class': By.CLASS_NAME,
+    'link_text': By.LINK_TEXT,
+    'partial_link_text': By.PARTIAL_LINK_TEXT
+}
+
+
 def get_by_selector(selector_type: str):
-    return {
-        'css': By.CSS_SELECTOR,
-        'xpath': By.XPATH,
-        'id': By.ID,
-        'name': By.NAME,
-        'tag': By.TAG_NAME,
-        'class': By.CLASS_NAME,
-        'link_text': By.LINK_TEXT,
-        'partial_link_text': By.PARTIAL_LINK_TEXT
-    }.get(selector_type.lower())
+    by = _BY_SELECTOR.get(selector_type)
+    return by if by is not None else _BY_SELECTOR.get(selector_type.lower())
+
+
+@functools.lru_cache(maxsize=1024)
+def _locator(selector_type: str, selector: str) -> Optional[Tuple[str, str]]:
+    """
+    Resolve (selector_type, selector) to a Selenium locator tuple, cached per process.
+
+    Agents reuse the same selectors across many tool calls; locators are plain
+    values, so the cache never needs invalidation. Returns None for unsupported
+    selector types.
+    """
+    by = get_by_selector(selector_type)
+    if not by:
+        return None
+    return (by, selector)
 
 
 def find_element(
@@ -57,35 +77,35 @@ def find_element(
     switched_iframe = False
     try:
         if iframe_selector:
-            by_iframe = get_by_selector(iframe_selector_type)
-            if not by_iframe:
+            iframe_locator = _locator(iframe_selector_type, iframe_selector)
+            if not iframe_locator:
                 raise ValueError(f"Unsupported iframe selector type: {iframe_selector_type}")
             iframe = WebDriverWait(driver, timeout).until(
-                EC.presence_of_element_located((by_iframe, iframe_selector))
+                EC.presence_of_element_located(iframe_locator)
             )
             driver.switch_to.frame(iframe)
             switched_iframe = True
 
         search_context = driver
         if shadow_root_selector:
-            by_shadow_host = get_by_selector(shadow_root_selector_type)
-            if not by_shadow_host:
+            shadow_host_locator = _locator(shadow_root_selector_type, shadow_root_selector)
+            if not shadow_host_locator:
                 raise ValueError(f"Unsupported shadow root selector type: {shadow_root_selector_type}")
             shadow_host = WebDriverWait(driver, timeout).until(
-                EC.presence_of_element_located((by_shadow_host, shadow_root_selector))
+                EC.presence_of_element_located(shadow_host_locator)
             )
             shadow_root = shadow_host.shadow_root
             search_context = shadow_root
 
-        by_selector = get_by_selector(selector_type)
-        if not by_selector:
+        locator = _locator(selector_type, selector)
+        if not locator:
             raise ValueError(f"Unsupported selector type: {selector_type}")
 
         wait = WebDriverWait(search_context, timeout)
         if visible_only:
-            element = wait.until(EC.visibility_of_element_located((by_selector, selector)))
+            element = wait.until(EC.visibility_of_element_located(locator))
         else:
-            element = wait.until(EC.presence_of_element_located((by_selector, selector)))
+            element = wait.until(EC.presence_of_element_located(locator))
 
         return element
 
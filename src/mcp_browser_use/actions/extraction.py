@@ -1,18 +1,60 @@
 """Element extraction functionality for fine-grained data collection."""
 
-import json
 import re
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, NamedTuple
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from ..utils.jsonio import dumps, respond
 from ..context import get_context
-from .elements import find_element, get_by_selector
-from .screenshots import _make_page_snapshot
+from .elements import find_element, get_by_selector, _locator
+from .screenshots import _make_page_snapshot, _read_mutation_signature
 
+# Extraction results kept per snapshot cache entry (i.e. per unchanged DOM)
+_EXTRACTIONS_PER_PAGE = 8
 
-async def extract_elements(
+
+def _detect_selector_type(selector: str) -> str:
+    """Auto-detect a selector's type: leading '/' means XPath, else CSS."""
+    return "xpath" if selector.startswith('/') else "css"
+
+
+class _FieldPlan(NamedTuple):
+    """A field spec resolved once per extraction, reused for every container."""
+    field_name: Optional[str]
+    selector_type: str
+    locator: Optional[tuple]
+    attribute: Optional[str]
+    regex: Optional["re.Pattern"]
+    fallback: Any
+
+
+def _compile_field(field_spec: Dict[str, str]) -> _FieldPlan:
+    """
+    Normalize a field spec: lower-case its selector type, resolve the locator
+    and compile the regex. An invalid regex compiles to None so the original
+    value is kept, as before.
+    """
+    selector_type = field_spec.get("selector_type", "css").lower()
+    regex = None
+    regex_pattern = field_spec.get("regex")
+    if regex_pattern:
+        try:
+            regex = re.compile(regex_pattern)
+        except re.error:
+            regex = None
+    return _FieldPlan(
+        field_name=field_spec.get("field_name"),
+        selector_type=selector_type,
+        locator=_locator(selector_type, field_spec.get("selector", "")),
+        attribute=field_spec.get("attribute"),
+        regex=regex,
+        fallback=field_spec.get("fallback"),
+    )
+
+
+async def extract_elements_data(
     selectors: Optional[List[Dict[str, str]]] = None,
     container_selector: Optional[str] = None,
     fields: Optional[List[Dict[str, str]]] = None,
@@ -23,7 +65,7 @@ async def extract_elements(
     offset: Optional[int] = None,
     discover_containers: bool = False,
     wait_for_content_loaded: Optional[Dict[str, Any]] = None,
-) -> str:
+) -> Dict[str, Any]:
     """
     Extract content from specific elements on the current page.
 
@@ -86,7 +128,8 @@ async def extract_elements(
                                 with asynchronous data loading.
 
     Returns:
-        JSON string with structure:
+        The result dict, shared with the extraction cache (treat it as
+        read-only; extract_elements() returns it serialized):
 
         MODE 1 (simple):
         {
@@ -120,8 +163,88 @@ async def extract_elements(
             {"field_name": "price_brutto", "selector": ".price", "regex": r"[0-9,.]+"},
             {"field_name": "url", "selector": "a.product-link", "attribute": "href"}
         ]
+
+    Extraction is read-only, so a result is remembered on the snapshot cache
+    entry of the page it was taken from. The same extraction is served from
+    there after one mutation-signature check while the DOM is unchanged;
+    any mutation or ctx.invalidate_snapshot() retires it with the entry.
     """
     ctx = get_context()
+    key = dumps([
+        selectors, container_selector, fields, selector_type, wait_for_visible,
+        max_items, offset, discover_containers, wait_for_content_loaded,
+    ])
+    sig = _read_mutation_signature(ctx.driver) if ctx.driver is not None else None
+    cached = ctx.snapshot_cache
+    if sig is not None and cached is not None and cached[0] == sig:
+        hit = cached[1].get("extractions", {}).get(key)
+        if hit is not None:
+            return hit
+
+    result = await _extract_elements_uncached(
+        selectors=selectors,
+        container_selector=container_selector,
+        fields=fields,
+        selector_type=selector_type,
+        wait_for_visible=wait_for_visible,
+        timeout=timeout,
+        max_items=max_items,
+        offset=offset,
+        discover_containers=discover_containers,
+        wait_for_content_loaded=wait_for_content_loaded,
+    )
+
+    # The closing snapshot re-read the signature: remember the result only if
+    # the DOM did not change while it was extracted
+    cached = ctx.snapshot_cache
+    if sig is not None and cached is not None and cached[0] == sig:
+        extractions = cached[1].setdefault("extractions", {})
+        if len(extractions) >= _EXTRACTIONS_PER_PAGE:
+            extractions.clear()
+        extractions[key] = result
+    return result
+
+
+async def extract_elements(
+    selectors: Optional[List[Dict[str, str]]] = None,
+    container_selector: Optional[str] = None,
+    fields: Optional[List[Dict[str, str]]] = None,
+    selector_type: str = "css",
+    wait_for_visible: bool = False,
+    timeout: int = 10,
+    max_items: Optional[int] = None,
+    offset: Optional[int] = None,
+    discover_containers: bool = False,
+    wait_for_content_loaded: Optional[Dict[str, Any]] = None,
+) -> bytes:
+    """extract_elements_data() serialized to UTF-8 JSON bytes."""
+    return respond(await extract_elements_data(
+        selectors=selectors,
+        container_selector=container_selector,
+        fields=fields,
+        selector_type=selector_type,
+        wait_for_visible=wait_for_visible,
+        timeout=timeout,
+        max_items=max_items,
+        offset=offset,
+        discover_containers=discover_containers,
+        wait_for_content_loaded=wait_for_content_loaded,
+    ))
+
+
+async def _extract_elements_uncached(
+    selectors: Optional[List[Dict[str, str]]],
+    container_selector: Optional[str],
+    fields: Optional[List[Dict[str, str]]],
+    selector_type: str,
+    wait_for_visible: bool,
+    timeout: int,
+    max_items: Optional[int],
+    offset: Optional[int],
+    discover_containers: bool,
+    wait_for_content_loaded: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    ctx = get_context()
 
     # Determine extraction mode
     if container_selector:
@@ -133,12 +256,12 @@ async def extract_elements(
                 timeout=min(timeout, 5)  # Cap at 5s for fast discovery
             )
             snapshot = _make_page_snapshot()
-            return json.dumps({
+            return {
                 "ok": True,
                 "mode": "discovery",
                 **discovery,
                 "snapshot": snapshot
-            })
+            }
         else:
             # MODE 2: Structured extraction (with or without fields)
             # When fields is None/empty, extract full text/HTML of each container
@@ -153,13 +276,13 @@ async def extract_elements(
                 wait_for_content_loaded=wait_for_content_loaded
             )
             snapshot = _make_page_snapshot()
-            return json.dumps({
+            return {
                 "ok": True,
                 "mode": "structured",
                 "items": items,
                 "count": len(items),
                 "snapshot": snapshot
-            })
+            }
     else:
         # MODE 1: Simple extraction (existing behavior)
         extracted_results: List[Dict[str, Any]] = []
@@ -169,12 +292,12 @@ async def extract_elements(
                 extracted_results.append(result)
 
         snapshot = _make_page_snapshot()
-        return json.dumps({
+        return {
             "ok": True,
             "mode": "simple",
             "extracted_elements": extracted_results,
             "snapshot": snapshot
-        })
+        }
 
 
 async def _discover_containers(
@@ -199,10 +322,7 @@ async def _discover_containers(
 
     # Auto-detect selector type
     if selector_type is None:
-        if container_selector.startswith('//') or container_selector.startswith('/'):
-            selector_type = "xpath"
-        else:
-            selector_type = "css"
+        selector_type = _detect_selector_type(container_selector)
 
     try:
         by_type = get_by_selector(selector_type)
@@ -393,10 +513,7 @@ async def _extract_structured(
     try:
         # Auto-detect selector type if not provided
         if selector_type is None:
-            if container_selector.startswith('//') or container_selector.startswith('/'):
-                selector_type = "xpath"
-            else:
-                selector_type = "css"
+            selector_type = _detect_selector_type(container_selector)
 
         # Find all container elements
         by_type = get_by_selector(selector_type)
@@ -443,18 +560,20 @@ async def _extract_structured(
                 ctx=ctx
             )
 
+        # Resolve each field spec once, not once per container
+        plans = [_compile_field(field_spec) for field_spec in fields or ()]
+
         # Extract fields from each container
         for idx, container in enumerate(containers):
             item = {}
             # _container_index reflects the actual position in the original full list
             item["_container_index"] = offset_val + idx
 
-            if fields:
+            if plans:
                 # Extract specified fields
-                for field_spec in fields:
-                    field_name = field_spec.get("field_name", f"field_{idx}")
-                    value = _extract_field_from_container(container, field_spec, ctx)
-                    item[field_name] = value
+                for plan in plans:
+                    field_name = plan.field_name if plan.field_name is not None else f"field_{idx}"
+                    item[field_name] = _extract_field_from_container(container, plan, ctx)
             else:
                 # No fields specified - extract full text content of container
                 try:
@@ -599,10 +718,7 @@ def _wait_for_lazy_content(
 
     # Auto-detect selector type if not provided
     if selector_type is None:
-        if selector.startswith('//') or selector.startswith('/'):
-            selector_type = "xpath"
-        else:
-            selector_type = "css"
+        selector_type = _detect_selector_type(selector)
 
     by_type = get_by_selector(selector_type)
     if not by_type:
@@ -683,7 +799,7 @@ def _wait_for_lazy_content(
 
 def _extract_field_from_container(
     container,
-    field_spec: Dict[str, str],
+    field_spec,
     ctx
 ) -> Any:
     """
@@ -691,31 +807,27 @@ def _extract_field_from_container(
 
     Args:
         container: WebElement representing the container
-        field_spec: Field extraction specification
+        field_spec: Field extraction specification, or a _FieldPlan compiled
+            from one by _compile_field
         ctx: Browser context
 
     Returns:
         Extracted and cleaned value, or fallback/None if not found
     """
-    selector = field_spec.get("selector", "")
-    field_selector_type = field_spec.get("selector_type", "css").lower()
-    attribute = field_spec.get("attribute")
-    regex_pattern = field_spec.get("regex")
-    fallback = field_spec.get("fallback")
+    plan = field_spec if isinstance(field_spec, _FieldPlan) else _compile_field(field_spec)
+    fallback = plan.fallback
 
     try:
-        # Find element within container
-        by_type = get_by_selector(field_selector_type)
-        if not by_type:
-            return fallback or f"Invalid selector_type: {field_selector_type}"
+        if not plan.locator:
+            return fallback or f"Invalid selector_type: {plan.selector_type}"
 
         # Find element relative to container
-        element = container.find_element(by_type, selector)
+        element = container.find_element(*plan.locator)
 
         # Extract value
-        if attribute:
+        if plan.attribute:
             # Extract from attribute
-            value = element.get_attribute(attribute)
+            value = element.get_attribute(plan.attribute)
         else:
             # Extract text content
             value = ctx.driver.execute_script("return arguments[0].textContent;", element)
@@ -724,19 +836,16 @@ def _extract_field_from_container(
                 value = value.replace('\x00', '').encode('utf-8', errors='ignore').decode('utf-8')
                 value = ' '.join(value.split())
 
-        # Apply regex if specified
-        if value and regex_pattern:
-            try:
-                match = re.search(regex_pattern, value)
-                if match:
-                    # Return first capturing group if exists, otherwise whole match
-                    value = match.group(1) if match.lastindex else match.group(0)
-                else:
-                    # Regex didn't match, use fallback if available
-                    value = fallback if fallback is not None else value
-            except re.error:
-                # Invalid regex, keep original value
-                pass
+        # Apply regex if specified (an invalid regex compiled to None: keep
+        # the original value)
+        if value and plan.regex is not None:
+            match = plan.regex.search(value)
+            if match:
+                # Return first capturing group if exists, otherwise whole match
+                value = match.group(1) if match.lastindex else match.group(0)
+            else:
+                # Regex didn't match, use fallback if available
+                value = fallback if fallback is not None else value
 
         return value if value is not None else fallback
 
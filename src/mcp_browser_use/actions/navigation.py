@@ -8,18 +8,25 @@ from ..context import get_context
 
 
 def _wait_document_ready(timeout: float = 10.0):
-    """Wait for document to be ready."""
+    """Wait for document to be ready, polling with exponential backoff (10ms -> 250ms)."""
     ctx = get_context()
     if not ctx.driver:
         return
 
-    try:
-        WebDriverWait(ctx.driver, timeout).until(
-            lambda d: d.execute_script("return document.readyState") in ("interactive", "complete")
-        )
-    except Exception:
-        # Not fatal
-        pass
+    delay = 0.01
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if ctx.driver.execute_script("return document.readyState") in ("interactive", "complete"):
+                return
+        except Exception:
+            # Not fatal; keep polling until the deadline
+            pass
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 0.25)
 
 
 def navigate_to_url(url: str) -> dict:
@@ -1,65 +1,223 @@
 """Screenshot and page snapshot functionality."""
 
-import os
 import time
 import io
 import base64
 from typing import Optional
 
 from ..context import get_context
+from ..utils.jsonio import Snapshot
 
 
-def _make_page_snapshot() -> dict:
+# Installs a MutationObserver counter once per document. Shared by the scripts below.
+_INSTALL_MUTATION_OBSERVER_JS = """
+var w = window;
+if (!w.__mcp_mut_installed) {
+    w.__mcp_mut = 0;
+    try {
+        new MutationObserver(function () { w.__mcp_mut++; }).observe(
+            document,
+            {subtree: true, childList: true, attributes: true, characterData: true}
+        );
+        w.__mcp_mut_installed = true;
+    } catch (e) {}
+}
+"""
+
+# Returns a cheap signature of the DOM state: (document time origin, mutation
+# count, href). With a truthy first argument, outerHTML is read in the same
+# script so the signature and the HTML describe exactly the same DOM.
+_MUTATION_SIGNATURE_JS = _INSTALL_MUTATION_OBSERVER_JS + """
+if (!w.__mcp_mut_installed) {
+    return null;
+}
+var sig = [performance.timeOrigin, w.__mcp_mut, location.href];
+if (arguments[0]) {
+    return [sig, document.documentElement.outerHTML];
+}
+return sig;
+"""
+
+# Async: waits (in the page) until the document is at least interactive or
+# arguments[0] ms have passed, then arguments[1] ms of settle time, and
+# resolves with everything a snapshot needs in one round-trip.
+# With arguments[2] > 0 it instead waits for readyState "complete" plus that
+# many ms without a new resource timing entry (network-idle heuristic).
+_READY_AND_SNAPSHOT_JS = _INSTALL_MUTATION_OBSERVER_JS + """
+var done = arguments[arguments.length - 1];
+var timeoutMs = arguments[0], settleMs = arguments[1], idleMs = arguments[2] || 0, start = Date.now();
+var resources = -1, quietSince = start;
+function networkIdle(now) {
+    var n = performance.getEntriesByType('resource').length;
+    if (n !== resources) {
+        resources = n;
+        quietSince = now;
+    }
+    return now - quietSince >= idleMs;
+}
+function finish() {
+    done({
+        readyState: document.readyState,
+        url: location.href,
+        title: document.title,
+        sig: w.__mcp_mut_installed ? [performance.timeOrigin, w.__mcp_mut, location.href] : null,
+        html: document.documentElement.outerHTML
+    });
+}
+(function poll() {
+    var rs = document.readyState, now = Date.now();
+    if (now - start >= timeoutMs) {
+        finish();
+    } else if (idleMs > 0) {
+        if (rs === 'complete' && networkIdle(now)) {
+            finish();
+        } else {
+            setTimeout(poll, 50);
+        }
+    } else if (rs === 'interactive' || rs === 'complete') {
+        setTimeout(finish, settleMs);
+    } else {
+        setTimeout(poll, 25);
+    }
+})();
+"""
+
+
+def _read_mutation_signature(driver) -> Optional[tuple]:
+    try:
+        sig = driver.execute_script(_MUTATION_SIGNATURE_JS, False)
+    except Exception:
+        return None
+    return tuple(sig) if sig else None
+
+
+def _settle_ms() -> int:
+    from ..constants import SNAPSHOT_SETTLE_MS
+    return SNAPSHOT_SETTLE_MS
+
+
+def _capture_fused(driver, ready_timeout: float, idle_ms: int = 0) -> Optional[dict]:
+    """Readiness wait, settle, url, title, signature and outerHTML in one async script."""
+    try:
+        res = driver.execute_async_script(
+            _READY_AND_SNAPSHOT_JS, int(ready_timeout * 1000), _settle_ms(), int(idle_ms)
+        )
+    except Exception:
+        return None
+    return res if isinstance(res, dict) and res.get("html") else None
+
+
+def _capture_sequential(driver, ready_timeout: float) -> dict:
+    """Fallback when async scripts are unavailable: one call per field."""
+    from .navigation import _wait_document_ready
+
+    url = title = None
+    try:
+        url = driver.current_url
+    except Exception:
+        pass
+    try:
+        title = driver.title
+    except Exception:
+        pass
+    try:
+        _wait_document_ready(timeout=ready_timeout)
+    except Exception:
+        pass
+    settle_ms = _settle_ms()
+    if settle_ms > 0:
+        time.sleep(settle_ms / 1000.0)
+
+    sig = None
+    html = ""
+    try:
+        res = driver.execute_script(_MUTATION_SIGNATURE_JS, True)
+        if res:
+            sig, html = res[0], res[1] or ""
+        else:
+            html = driver.execute_script("return document.documentElement.outerHTML") or ""
+        if not html:
+            sig = None
+            html = driver.page_source or ""
+    except Exception:
+        sig = None
+        try:
+            html = driver.page_source or ""
+        except Exception:
+            html = ""
+    return {"url": url, "title": title, "sig": sig, "html": html}
+
+
+# Returned while ctx.defer_snapshots is set (intermediate batch steps)
+_DEFERRED_SNAPSHOT = Snapshot(url=None, title=None, html="")
+
+
+def _make_page_snapshot(ready_timeout: float = 5.0, idle_ms: int = 0) -> dict:
     """
     Capture the raw page snapshot (no cleaning, no truncation).
     Returns a dict: {"url": str|None, "title": str|None, "html": str}
-    """
-    from .navigation import _wait_document_ready
+    (a read-only `Snapshot` that memoizes its JSON encoding).
+
+    The HTML is always the full page; detail_level is applied when the
+    result is packed (see helpers_context.to_context_pack).
 
+    Readiness wait (up to `ready_timeout` seconds), settle delay and the page
+    read run in a single async script, so callers do not need their own
+    _wait_document_ready() before taking a snapshot. idle_ms > 0 waits for
+    readyState "complete" and that long without new network resources instead
+    of the settle delay.
+
+    The HTML is cached on the browser context together with a DOM mutation
+    signature. If nothing in the document changed since the last capture,
+    the cached snapshot is returned after one signature check, without
+    waiting for the settle delay or transferring the page again. Actions
+    that change the page call ctx.invalidate_snapshot() to force a fresh
+    capture. While ctx.defer_snapshots is set nothing is captured and an empty
+    placeholder is returned.
+    """
     ctx = get_context()
-    url = None
-    title = None
-    html = ""
+    if ctx.defer_snapshots:
+        return _DEFERRED_SNAPSHOT
+    entry = {"url": None, "title": None, "html": ""}
     try:
         if ctx.driver is not None:
             try:
                 ctx.driver.switch_to.default_content()
             except Exception:
                 pass
-            try:
-                url = ctx.driver.current_url
-            except Exception:
-                url = None
-            try:
-                title = ctx.driver.title
-            except Exception:
-                title = None
 
-            # Ensure DOM is ready, then apply configurable settle
-            try:
-                _wait_document_ready(timeout=5.0)
-            except Exception:
-                pass
-            try:
-                settle_ms = int(os.getenv("SNAPSHOT_SETTLE_MS", "200") or "0")
-                if settle_ms > 0:
-                    time.sleep(settle_ms / 1000.0)
-            except Exception:
-                pass
+            cached = ctx.snapshot_cache
+            if cached is not None:
+                sig = _read_mutation_signature(ctx.driver)
+                if sig is not None and sig == cached[0]:
+                    return _snapshot_view(cached[1])
 
-            # Prefer outerHTML; fall back to page_source
-            try:
-                html = ctx.driver.execute_script("return document.documentElement.outerHTML") or ""
-                if not html:
-                    html = ctx.driver.page_source or ""
-            except Exception:
-                try:
-                    html = ctx.driver.page_source or ""
-                except Exception:
-                    html = ""
+            res = (_capture_fused(ctx.driver, ready_timeout, idle_ms)
+                   or _capture_sequential(ctx.driver, ready_timeout))
+            sig = tuple(res["sig"]) if res.get("sig") else None
+            entry = {"url": res.get("url"), "title": res.get("title"), "html": res.get("html") or ""}
+            ctx.snapshot_cache = (sig, entry) if sig is not None and entry["html"] else None
+            ctx.last_url = entry["url"]
     except Exception:
         pass
-    return {"url": url, "title": title, "html": html}
+    return _snapshot_view(entry)
+
+
+def _snapshot_view(entry: dict) -> Snapshot:
+    """
+    Snapshot of a cache entry. The view (and its JSON encoding and content
+    digest) is memoized on the entry, so repeated cache hits neither re-encode
+    nor re-hash the page.
+    """
+    view = entry.get("view")
+    if view is None:
+        html = entry["html"]
+        view = Snapshot(url=entry["url"], title=entry["title"], html=html)
+        if html:
+            from ..helpers_context import html_digest
+            view.digest = html_digest(html).hex()
+        entry["view"] = view
+    return view
 
 
 def take_screenshot(filename: Optional[str] = None) -> dict:
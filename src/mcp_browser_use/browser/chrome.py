@@ -3,6 +3,8 @@
 import os
 import time
 import platform
+import contextlib
+import subprocess
 from pathlib import Path
 from typing import Tuple, Optional
 import psutil
@@ -60,7 +62,9 @@ def _launch_chrome_with_debug(cfg: dict, port: int) -> None:
     # On Windows, Chrome's launcher process exits immediately after spawning background processes.
     # This is normal behavior. Only check for immediate exit on non-Windows platforms.
     if platform.system() != "Windows":
-        time.sleep(0.2)  # Brief wait to check if process exits immediately
+        # Brief wait to check if process exits immediately (returns early if it does)
+        with contextlib.suppress(subprocess.TimeoutExpired):
+            proc.wait(timeout=0.2)
         if proc.poll() is not None:
             raise RuntimeError(f"Chrome process exited immediately with code {proc.returncode}")
 
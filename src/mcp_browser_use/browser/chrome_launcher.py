@@ -13,7 +13,7 @@ from .chrome_process import find_chrome_by_port, is_chrome_running_with_userdata
 
 # Import from sibling modules
 from .devtools import devtools_active_port_from_file, is_debugger_listening
-from .process import write_rendezvous, get_free_port
+from .process import write_rendezvous, get_free_port, _is_port_open
 
 import logging
 logger = logging.getLogger(__name__)
@@ -119,6 +119,25 @@ def build_chrome_command(
     return cmd
 
 
+_LAUNCH_SETTLE_SECS = 2.0
+
+
+def _wait_for_launch(proc: subprocess.Popen, port: int, timeout: float = _LAUNCH_SETTLE_SECS) -> None:
+    """Block until Chrome exits, its debug port accepts connections, or `timeout` passes."""
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        try:
+            proc.wait(timeout=min(0.05, remaining))
+            return
+        except subprocess.TimeoutExpired:
+            pass
+        if _is_port_open("127.0.0.1", port, timeout=0.05):
+            return
+
+
 def launch_chrome_process(
     cmd: list[str],
     port: int,
@@ -160,8 +179,8 @@ def launch_chrome_process(
             stdout=subprocess.DEVNULL
         )
 
-    # Verify Chrome started
-    time.sleep(2.0)
+    # Verify Chrome started: wake as soon as it exits or its debug port accepts
+    _wait_for_launch(proc, port)
     if proc.poll() is not None:
         try:
             with open(error_log, "r") as log:
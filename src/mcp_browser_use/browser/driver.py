@@ -95,7 +95,11 @@ def _ensure_singleton_window(driver: webdriver.Chrome):
         # Recovery failed - clear target and recreate
         ctx.reset_window_state()
 
-    # 1) Create new window if we don't have a target
+    # 1) Reuse an idle pooled window before paying for a new one
+    if not ctx.target_id:
+        _take_pooled_window(driver)
+
+    # 2) Create new window if we don't have a target
     if not ctx.target_id:
         # Cleanup orphaned windows
         try:
@@ -138,7 +142,7 @@ def _ensure_singleton_window(driver: webdriver.Chrome):
             except Exception:
                 ctx.window_id = None
 
-    # 2) Map targetId -> Selenium handle
+    # 3) Map targetId -> Selenium handle
     h = _handle_for_target(driver, ctx.target_id)
     if not h:
         for _ in range(20):
@@ -163,6 +167,40 @@ def _ensure_singleton_window(driver: webdriver.Chrome):
         raise RuntimeError(f"Failed to find window handle for target {ctx.target_id}")
 
 
+def _take_pooled_window(driver: webdriver.Chrome) -> bool:
+    """Adopt the first pooled window whose target still exists. Returns True on success."""
+    ctx = get_context()
+    while ctx.window_pool:
+        target_id, window_id = ctx.window_pool.popleft()
+        try:
+            if _handle_for_target(driver, target_id):
+                ctx.target_id = target_id
+                ctx.window_id = window_id
+                return True
+        except Exception:
+            continue
+    return False
+
+
+def _pool_window(driver: webdriver.Chrome, target_id: str, window_id: Optional[int]) -> bool:
+    """Blank the window and keep it for reuse instead of closing it. Returns True if pooled."""
+    from ..constants import WINDOW_POOL_MAX
+
+    ctx = get_context()
+    if WINDOW_POOL_MAX <= 0 or len(ctx.window_pool) >= WINDOW_POOL_MAX:
+        return False
+    try:
+        h = _handle_for_target(driver, target_id)
+        if not h:
+            return False
+        driver.switch_to.window(h)
+        driver.execute_script("window.location = 'about:blank';")
+    except Exception:
+        return False
+    ctx.window_pool.append((target_id, window_id))
+    return True
+
+
 def _ensure_driver_and_window() -> None:
     """Ensure both driver and window are ready."""
     _ensure_driver()
@@ -228,6 +266,12 @@ def close_singleton_window() -> bool:
     if ctx.driver is None or not ctx.target_id:
         return False
 
+    # Keep the window (still registered to us, so orphan cleanup covers it if this
+    # process dies) for the next start_browser instead of tearing it down.
+    if _pool_window(ctx.driver, ctx.target_id, ctx.window_id):
+        ctx.reset_window_state()
+        return True
+
     closed = False
     try:
         ctx.driver.execute_cdp_cmd("Target.closeTarget", {"targetId": ctx.target_id})
@@ -255,6 +299,22 @@ def close_singleton_window() -> bool:
     return closed
 
 
+def _ignore_proxy_for_chromedriver(options) -> None:
+    """
+    Talk to the local chromedriver directly even when HTTP(S)_PROXY is set and
+    NO_PROXY does not cover localhost; otherwise every WebDriver command takes
+    a detour through the proxy. Browser traffic is unaffected.
+    """
+    import warnings
+    with warnings.catch_warnings():
+        # Deprecated in favour of a ClientConfig, which webdriver.Chrome() does not take
+        warnings.simplefilter("ignore", DeprecationWarning)
+        try:
+            options.ignore_local_proxy_environment_variables()
+        except AttributeError:
+            pass
+
+
 def create_webdriver(debugger_host: str, debugger_port: int, config: dict) -> webdriver.Chrome:
     from selenium.webdriver.chrome.options import Options
     from selenium.webdriver.chrome.service import Service as ChromeService
@@ -264,6 +324,7 @@ def create_webdriver(debugger_host: str, debugger_port: int, config: dict) -> we
     if chrome_path:
         options.binary_location = chrome_path
     options.add_experimental_option("debuggerAddress", f"{debugger_host}:{debugger_port}")
+    _ignore_proxy_for_chromedriver(options)
 
     # Handle differing Selenium versions that accept log_output vs. log_path
     log_file = chromedriver_log_path(config)
@@ -272,7 +333,8 @@ def create_webdriver(debugger_host: str, debugger_port: int, config: dict) -> we
     except TypeError:
         service = ChromeService(log_path=log_file)    # older Selenium
 
-    driver = webdriver.Chrome(service=service, options=options)
+    # keep_alive: every command reuses one pooled HTTP connection to chromedriver
+    driver = webdriver.Chrome(service=service, options=options, keep_alive=True)
 
     # Apply user-agent override via CDP (works for both launched and attached Chrome)
     custom_user_agent = os.getenv("MCP_USER_AGENT", "").strip()
@@ -18,6 +18,15 @@ def _get_session(session_id: str) -> dict:
     return _sessions[session_id]
 
 
+# selector_type -> Playwright selector engine prefix (anything else is CSS)
+_SELECTOR_PREFIX = {"css": "", "xpath": "xpath="}
+
+
+def _locate(page, selector: str, selector_type: str):
+    """First match of `selector` as a Playwright locator."""
+    return page.locator(_SELECTOR_PREFIX.get(selector_type, "") + selector).first
+
+
 async def start(
     headless: bool = False,
     locale: str = "de-DE",
@@ -87,10 +96,7 @@ async def screenshot(session_id: str) -> str:
 async def click(session_id: str, selector: str, selector_type: str = "css") -> dict:
     sess = _get_session(session_id)
     page = sess["page"]
-    if selector_type == "xpath":
-        loc = page.locator(f"xpath={selector}").first
-    else:
-        loc = page.locator(selector).first
+    loc = _locate(page, selector, selector_type)
     await loc.click(timeout=10_000)
     await page.wait_for_load_state("domcontentloaded", timeout=15_000)
     title = await page.title()
@@ -100,10 +106,7 @@ async def click(session_id: str, selector: str, selector_type: str = "css") -> d
 async def fill_text(session_id: str, selector: str, text: str, selector_type: str = "css") -> dict:
     sess = _get_session(session_id)
     page = sess["page"]
-    if selector_type == "xpath":
-        loc = page.locator(f"xpath={selector}").first
-    else:
-        loc = page.locator(selector).first
+    loc = _locate(page, selector, selector_type)
     await loc.fill(text, timeout=10_000)
     title = await page.title()
     return {"url": page.url, "title": title}
@@ -112,10 +115,7 @@ async def fill_text(session_id: str, selector: str, text: str, selector_type: st
 async def wait_for_element(session_id: str, selector: str, timeout: int = 10, selector_type: str = "css") -> dict:
     sess = _get_session(session_id)
     page = sess["page"]
-    if selector_type == "xpath":
-        loc = page.locator(f"xpath={selector}").first
-    else:
-        loc = page.locator(selector).first
+    loc = _locate(page, selector, selector_type)
     await loc.wait_for(state="visible", timeout=timeout * 1000)
     return {"found": True, "selector": selector}
 
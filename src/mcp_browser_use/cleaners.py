@@ -12,7 +12,12 @@ HIDDEN_CLASS_PAT = re.compile(r"(sr-only|visually-hidden|offscreen)", re.I)
 
 def approx_token_count(text: str) -> int:
     # Fast heuristic: ~4 chars per token
-    return max(0, (len(text) // 4))
+    return approx_token_count_of_len(len(text))
+
+
+def approx_token_count_of_len(n_chars: int) -> int:
+    """approx_token_count() for a text of `n_chars` characters."""
+    return max(0, n_chars // 4)
 
 
 # CDN detection and cleanup helpers
@@ -119,25 +124,126 @@ def _remove_scripts_and_styles(soup, pruned_counts: Dict[str, int]) -> None:
         soup: BeautifulSoup object to modify in-place
         pruned_counts: Dictionary to update with removal counts
     """
-    # Remove scripts/styles/noscript/template/svg/canvas/meta/source/track
-    for tag_name in ["script", "style", "noscript", "template", "canvas", "svg", "meta", "source", "track"]:
-        removed = soup.find_all(tag_name)
-        key = tag_name if tag_name in ["script", "style"] else "noise"
-        pruned_counts[key] = pruned_counts.get(key, 0) + len(removed)
-        for t in removed:
-            t.decompose()
-
-    # Remove <link> except canonical (robust to str vs list)
-    for link in soup.find_all("link"):
-        rel = link.get("rel")
-        rels = [s.lower() for s in rel] if isinstance(rel, (list, tuple)) else ([str(rel).lower()] if rel else [])
-        if "canonical" in rels:
-            continue
-        pruned_counts["noise"] += 1
-        link.decompose()
+    # Scripts/styles/noscript/template/svg/canvas/meta/source/track, and <link>
+    # except canonical (robust to str vs list), found in one tree walk
+    removed = []
+    for t in soup.find_all(_NOISE_TAG_NAMES):
+        name = t.name
+        if name == "link":
+            rel = t.get("rel")
+            rels = [s.lower() for s in rel] if isinstance(rel, (list, tuple)) else ([str(rel).lower()] if rel else [])
+            if "canonical" in rels:
+                continue
+            key = "noise"
+        else:
+            key = name if name in ("script", "style") else "noise"
+        pruned_counts[key] = pruned_counts.get(key, 0) + 1
+        removed.append(t)
+    # Innermost first, so no tag is removed after its ancestor
+    for t in reversed(removed):
+        t.decompose()
+
+
+# Tags _remove_scripts_and_styles() drops (script/style counted by name, the rest as noise)
+_NOISE_TAGS = frozenset({"script", "style", "noscript", "template", "canvas", "svg", "meta", "source", "track"})
+# ...plus <link>: the name list _remove_scripts_and_styles() matches in one find_all
+_NOISE_TAG_NAMES = sorted(_NOISE_TAGS | {"link"})
+
+# Pages at least this long get their comments and noise tags stripped by the
+# lexbor parser (pip install mcp-browser-use[speedups]) before BeautifulSoup sees them
+_FAST_STRIP_MIN_CHARS = 32 * 1024
+
+
+def _strip_noise_fast(html: str, pruned_counts: Dict[str, int], containers: bool = False,
+                      prune_hidden: bool = True) -> Optional[str]:
+    """
+    Phases 0 and 1 of basic_prune() (comments, scripts, styles, non-content tags
+    and non-canonical <link>s) in selectolax's C parser, so the slower
+    BeautifulSoup tree is only built for what remains. With `containers`, the
+    noise-container and hidden-element pass of phase 2 runs here as well (see
+    _remove_noise_containers).
+
+    Returns the stripped HTML, or None when selectolax is not installed or
+    fails (the caller then runs the BeautifulSoup phases).
+    """
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+    except ImportError:
+        return None
+
+    try:
+        tree = LexborHTMLParser(html)
+        removed = []
+        for node in tree.root.traverse(include_text=True):
+            tag = node.tag
+            if tag == "-comment":
+                pruned_counts["comments_removed"] += 1
+            elif tag in _NOISE_TAGS:
+                key = tag if tag in ("script", "style") else "noise"
+                pruned_counts[key] += 1
+            elif tag == "link" and "canonical" not in (node.attributes.get("rel") or "").lower().split():
+                pruned_counts["noise"] += 1
+            else:
+                continue
+            removed.append(node)
+        # Innermost first, so no node is removed after its ancestor
+        for node in reversed(removed):
+            node.decompose()
+        if containers:
+            _strip_containers_fast(tree, pruned_counts, prune_hidden)
+        return tree.html
+    except Exception:
+        return None
+
+
+def _strip_containers_fast(tree, pruned_counts: Dict[str, int], prune_hidden: bool) -> None:
+    """
+    The element loop and hidden-input pass of _remove_noise_containers() on a
+    selectolax tree. Like the BeautifulSoup loop, elements inside a removed
+    element are neither checked nor counted.
+    """
+    removed = []
+    stack = [tree.root] if tree.root is not None else []
+    while stack:
+        node = stack.pop()
+        attrs = node.attributes
+        classv = " ".join((attrs.get("class") or "").split())
+        noise, hidden = _container_removal(
+            attrs.get("id") or "", classv,
+            "hidden" in attrs, attrs.get("aria-hidden") or "", attrs.get("style") or "",
+        )
+        if noise or (prune_hidden and hidden):
+            if noise:
+                pruned_counts["noise"] += 1
+            if prune_hidden and hidden:
+                pruned_counts["hidden_removed"] += 1
+            removed.append(node)
+        elif prune_hidden and node.tag == "input" and (attrs.get("type") or "").lower() == "hidden":
+            pruned_counts["hidden_removed"] += 1
+            removed.append(node)
+        else:
+            stack.extend(reversed(list(node.iter(include_text=False))))
+    for node in removed:
+        node.decompose()
+
+
+def _container_removal(idv: str, classv: str, hidden_attr: bool, aria_hidden: str, style_val: str) -> Tuple[bool, bool]:
+    """(remove as noise, remove as hidden) for an element's id, joined classes and visibility attributes."""
+    style_hidden = False
+    if style_val:
+        sv = style_val.lower()
+        if re.search(r"display\s*:\s*none\b", sv) or re.search(r"visibility\s*:\s*hidden\b", sv):
+            style_hidden = True
+    hidden_attr = hidden_attr or aria_hidden.strip().lower() == "true" or style_hidden
+
+    # Requires NOISE_ID_CLASS_PAT / HIDDEN_CLASS_PAT to be defined at module scope
+    remove_for_noise = bool(NOISE_ID_CLASS_PAT.search(idv) or NOISE_ID_CLASS_PAT.search(classv))
+    remove_for_hidden = bool(hidden_attr or HIDDEN_CLASS_PAT.search(classv))
+    return remove_for_noise, remove_for_hidden
 
 
-def _remove_noise_containers(soup, pruned_counts: Dict[str, int], prune_hidden: bool) -> None:
+def _remove_noise_containers(soup, pruned_counts: Dict[str, int], prune_hidden: bool,
+                             containers: bool = True) -> None:
     """
     Remove ads, trackers, hidden elements, and oversized dropdowns.
 
@@ -145,32 +251,23 @@ def _remove_noise_containers(soup, pruned_counts: Dict[str, int], prune_hidden:
         soup: BeautifulSoup object to modify in-place
         pruned_counts: Dictionary to update with removal counts
         prune_hidden: If True, remove hidden elements and hidden inputs
+        containers: If False, only remove oversized dropdowns (the rest was
+            already done by _strip_noise_fast)
     """
     removed_noise = 0
     removed_hidden = 0
 
-    for el in soup.find_all(True):
+    for el in soup.find_all(True) if containers else ():
         if el.attrs is None:
             continue
 
-        idv = el.get("id") or ""
         classes = el.get("class") or []
         classv = " ".join(classes) if isinstance(classes, (list, tuple)) else str(classes)
-
-        aria_hidden = str(el.get("aria-hidden", "")).strip().lower() == "true"
         style_val = el.get("style")
-
-        style_hidden = False
-        if isinstance(style_val, str):
-            sv = style_val.lower()
-            if re.search(r"display\s*:\s*none\b", sv) or re.search(r"visibility\s*:\s*hidden\b", sv):
-                style_hidden = True
-
-        hidden_attr = el.has_attr("hidden") or aria_hidden or style_hidden
-
-        # Requires NOISE_ID_CLASS_PAT / HIDDEN_CLASS_PAT to be defined at module scope
-        remove_for_noise = bool(NOISE_ID_CLASS_PAT.search(idv) or NOISE_ID_CLASS_PAT.search(classv))
-        remove_for_hidden = bool(hidden_attr or HIDDEN_CLASS_PAT.search(classv))
+        remove_for_noise, remove_for_hidden = _container_removal(
+            el.get("id") or "", classv, el.has_attr("hidden"),
+            str(el.get("aria-hidden", "")), style_val if isinstance(style_val, str) else "",
+        )
 
         if remove_for_noise or (prune_hidden and remove_for_hidden):
             if remove_for_noise:
@@ -183,7 +280,7 @@ def _remove_noise_containers(soup, pruned_counts: Dict[str, int], prune_hidden:
     pruned_counts["hidden_removed"] += removed_hidden
 
     # Remove hidden inputs explicitly
-    if prune_hidden:
+    if prune_hidden and containers:
         hidden_inputs_removed = 0
         for inp in soup.find_all("input"):
             typ = str(inp.get("type", "")).lower()
@@ -469,17 +566,27 @@ def basic_prune(
     }
 
     import bs4
-    soup = bs4.BeautifulSoup(html or "", "html.parser")
-
-    # Phase 0: Remove HTML comments
-    _remove_comments(soup=soup, pruned_counts=pruned_counts)
-
-    # Phase 1: Remove scripts, styles, and non-content tags
-    _remove_scripts_and_styles(soup=soup, pruned_counts=pruned_counts)
+    from .constants import FAST_CLEAN
+    stripped = None
+    if FAST_CLEAN and html and len(html) >= _FAST_STRIP_MIN_CHARS:
+        counts = dict(pruned_counts)
+        stripped = _strip_noise_fast(html, counts, containers=level >= 1, prune_hidden=prune_hidden)
+        if stripped is not None:
+            pruned_counts = counts
+    soup = bs4.BeautifulSoup(stripped if stripped is not None else html or "", "html.parser")
+
+    if stripped is None:
+        # Phase 0: Remove HTML comments
+        _remove_comments(soup=soup, pruned_counts=pruned_counts)
+
+        # Phase 1: Remove scripts, styles, and non-content tags
+        _remove_scripts_and_styles(soup=soup, pruned_counts=pruned_counts)
 
     # Phase 2: Remove noise containers and hidden elements (if level >= 1)
     if level >= 1:
-        _remove_noise_containers(soup=soup, pruned_counts=pruned_counts, prune_hidden=prune_hidden)
+        _remove_noise_containers(
+            soup=soup, pruned_counts=pruned_counts, prune_hidden=prune_hidden, containers=stripped is None,
+        )
 
     # Phase 2.5: Strip CDN links (if enabled)
     if remove_cdn_links:
@@ -501,7 +608,21 @@ def basic_prune(
 
     return html_out, pruned_counts
 
-def extract_outline(html: str, max_items: int = 64):
+def extract_outline(html: str, max_items: int = 64, normalized: bool = False):
+    """
+    Headings h1-h4 of `html` with their text and a rough css_path.
+
+    `normalized` marks HTML that came out of basic_prune(), whose large inputs
+    lexbor has already parsed and re-serialized (_strip_noise_fast); only then
+    are large pages read with selectolax, since for raw or misnested markup
+    lexbor's tree (implied html/body, closed <p>s, ...) differs from
+    BeautifulSoup's.
+    """
+    from .constants import FAST_CLEAN
+    if normalized and FAST_CLEAN and html and len(html) >= _FAST_STRIP_MIN_CHARS:
+        outline = _extract_outline_fast(html, max_items)
+        if outline is not None:
+            return outline
     import bs4
     soup = bs4.BeautifulSoup(html or "", "html.parser")
     outline = []
@@ -528,3 +649,101 @@ def extract_outline(html: str, max_items: int = 64):
                 return outline
     return outline
 
+
+
+def _extract_outline_fast(html: str, max_items: int) -> Optional[list]:
+    """
+    extract_outline() on selectolax's parser: the headings are all the outline
+    needs, so the page is not built into a BeautifulSoup tree just to find them.
+    Only for HTML lexbor already normalized in _strip_noise_fast (see
+    extract_outline's `normalized`): on that both parsers see the same structure.
+
+    Returns None when selectolax is not installed or fails.
+    """
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+    except ImportError:
+        return None
+
+    try:
+        tree = LexborHTMLParser(html)
+        outline = []
+        for level, tag in [(1, "h1"), (2, "h2"), (3, "h3"), (4, "h4")]:
+            for el in tree.css(tag):
+                # get_text(" ", strip=True): stripped, non-empty text nodes joined by spaces
+                parts = (n.text_content.strip() for n in el.traverse(include_text=True) if n.tag == "-text")
+                text = " ".join(p for p in parts if p)
+                parts = []
+                cur = el
+                while cur is not None and cur.tag and not cur.tag.startswith("-"):
+                    attrs = cur.attributes
+                    idp = ("#" + (attrs["id"] or "")) if "id" in attrs else ""
+                    cls = "." + ".".join((attrs["class"] or "").split()) if "class" in attrs else ""
+                    parts.append(f"{cur.tag}{idp}{cls}")
+                    cur = cur.parent
+                outline.append({
+                    "level": level, "text": text, "word_count": len(text.split()),
+                    "css_path": " > ".join(reversed(parts)), "subtree_id": None,
+                })
+                if len(outline) >= max_items:
+                    return outline
+        return outline
+    except Exception:
+        return None
+
+
+# Detail levels: "full" keeps the page as captured; "interactive" keeps full
+# attributes only on elements an agent can act on and summarizes long text
+# in subtrees that contain none of them; "minimal" drops the page body and
+# keeps only url and title (post-action acks).
+INTERACTIVE_TAGS = frozenset({"a", "button", "input", "select", "option", "textarea", "form"})
+_LANDMARK_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
+DETAIL_LEVELS = ("full", "interactive", "minimal")
+_SUMMARY_KEEP_CHARS = 80
+
+
+def _is_interactive(el) -> bool:
+    return el.name in INTERACTIVE_TAGS or el.has_attr("role") or el.has_attr("onclick")
+
+
+def interactive_prune(html: str) -> str:
+    """
+    Reduce HTML to its interactive skeleton.
+
+    - Interactive elements (a, button, input, select, option, textarea, form,
+      [role], [onclick]) keep all attributes and content.
+    - Other elements keep only their id.
+    - Headings are kept so outline mode still has its landmarks.
+    - Maximal subtrees without any interactive element keep short text as-is;
+      longer text is replaced by its first chars plus a size marker,
+      e.g. ``<div>Lorem ipsum…(1.2kB)</div>``.
+    """
+    import bs4
+    soup = bs4.BeautifulSoup(html or "", "html.parser")
+    for t in soup(["script", "style", "noscript", "template", "svg"]):
+        t.decompose()
+
+    elements = soup.find_all(True)
+
+    # Bottom-up: mark every element that is or contains an interactive element or heading
+    live = set()
+    for el in reversed(elements):
+        if id(el) in live or el.name in _LANDMARK_TAGS or _is_interactive(el):
+            live.add(id(el))
+            if el.parent is not None:
+                live.add(id(el.parent))
+
+    for el in elements:
+        if id(el) in live:
+            if not _is_interactive(el):
+                el.attrs = {k: v for k, v in el.attrs.items() if k == "id"}
+            continue
+        parent = el.parent
+        if parent is not None and parent.name != "[document]" and id(parent) not in live:
+            continue  # inside a subtree that was already summarized
+        el.attrs = {k: v for k, v in el.attrs.items() if k == "id"}
+        text = el.get_text(" ", strip=True)
+        if len(text) > _SUMMARY_KEEP_CHARS:
+            el.clear()
+            el.append(f"{text[:_SUMMARY_KEEP_CHARS]}…({len(text) / 1024:.1f}kB)")
+    return str(soup)
@@ -2,6 +2,7 @@
 
 from .environment import (
     get_env_config,
+    invalidate_env_config,
     profile_key,
     is_default_user_data_dir,
 )
@@ -18,6 +19,7 @@ from .paths import (
 
 __all__ = [
     "get_env_config",
+    "invalidate_env_config",
     "profile_key",
     "is_default_user_data_dir",
     "get_lock_dir",
@@ -2,6 +2,7 @@
 
 import os
 import hashlib
+import functools
 from pathlib import Path
 from typing import Optional
 
@@ -13,6 +14,9 @@ def get_env_config() -> dict:
     """
     Read environment variables and validate required ones.
 
+    The environment is read once and cached; each call returns a fresh shallow copy.
+    Call invalidate_env_config() after changing the environment (e.g. in tests).
+
     Prioritizes Chrome Beta over Chrome Canary over Chrome. This is to free the Chrome instance. Chrome is likely
     used by the user already. It is easier to separate the executables. If a user already has the Chrome executable open,
     the MCP will not work properly as the Chrome DevTool Debug mode will not open when Chrome is already open in normal mode.
@@ -32,6 +36,16 @@ def get_env_config() -> dict:
                 CANARY_PROFILE_USER_DATA_DIR
                 CANARY_PROFILE_NAME
     """
+    return dict(_read_env_config())
+
+
+def invalidate_env_config() -> None:
+    """Drop the cached environment config so the next get_env_config() re-reads os.environ."""
+    _read_env_config.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
+def _read_env_config() -> dict:
     # Base (generic) config
     user_data_dir = (os.getenv("CHROME_PROFILE_USER_DATA_DIR") or "").strip()
     if not user_data_dir and not os.getenv("BETA_PROFILE_USER_DATA_DIR") and not os.getenv("CANARY_PROFILE_USER_DATA_DIR"):
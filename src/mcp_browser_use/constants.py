@@ -12,7 +12,7 @@ import os
 # ============================================================================
 
 ACTION_LOCK_TTL_SECS = int(os.getenv("MCP_ACTION_LOCK_TTL", "30"))
-"""Time-to-live for action locks in seconds."""
+"""Time-to-live for action locks in seconds (read once at process start, like every constant here)."""
 
 ACTION_LOCK_WAIT_SECS = int(os.getenv("MCP_ACTION_LOCK_WAIT", "60"))
 """Maximum time to wait for action lock acquisition in seconds."""
@@ -20,6 +20,16 @@ ACTION_LOCK_WAIT_SECS = int(os.getenv("MCP_ACTION_LOCK_WAIT", "60"))
 FILE_MUTEX_STALE_SECS = int(os.getenv("MCP_FILE_MUTEX_STALE_SECS", "60"))
 """Consider file mutex stale after this many seconds."""
 
+RELEASE_LOCK_ON_SUCCESS = os.getenv("MCP_RELEASE_LOCK_ON_SUCCESS", "1") == "1"
+"""Release the action lock when a tool succeeds instead of renewing it for another TTL."""
+
+ACTION_LOCK_SCOPE = (os.getenv("MCP_ACTION_LOCK_SCOPE", "profile") or "profile").strip().lower()
+"""
+"profile": one action lock shared by every agent on the Chrome profile (actions are serialized).
+"window": one action lock per agent window, so agents in different windows act in parallel.
+Browser startup and window allocation stay serialized per profile either way.
+"""
+
 
 # ============================================================================
 # Window Registry Configuration
@@ -28,6 +38,9 @@ FILE_MUTEX_STALE_SECS = int(os.getenv("MCP_FILE_MUTEX_STALE_SECS", "60"))
 WINDOW_REGISTRY_STALE_THRESHOLD = int(os.getenv("MCP_WINDOW_REGISTRY_STALE_SECS", "300"))
 """Consider window registry entry stale after this many seconds."""
 
+WINDOW_POOL_MAX = int(os.getenv("MCP_WINDOW_POOL_MAX", "1"))
+"""Idle windows kept (blanked) after close_browser for reuse by the next start_browser. 0 disables pooling."""
+
 
 # ============================================================================
 # Rendering Configuration
@@ -36,6 +49,27 @@ WINDOW_REGISTRY_STALE_THRESHOLD = int(os.getenv("MCP_WINDOW_REGISTRY_STALE_SECS"
 MAX_SNAPSHOT_CHARS = int(os.getenv("MCP_MAX_SNAPSHOT_CHARS", "10000"))
 """Maximum characters in HTML snapshots."""
 
+SNAPSHOT_DIFF = os.getenv("MCP_SNAPSHOT_DIFF", "0") == "1"
+"""Replace top-level <body> subtrees unchanged since the previous html-mode snapshot with hash stubs."""
+
+DEFAULT_DETAIL_LEVEL = (os.getenv("MCP_DEFAULT_DETAIL_LEVEL", "full") or "full").strip().lower()
+"""Snapshot detail level when a tool does not pass one: "full" or "interactive"."""
+
+PACK_OFFLOAD_MIN_CHARS = int(os.getenv("MCP_PACK_OFFLOAD_MIN_CHARS", "500000") or "0")
+"""Raw page size (chars) from which snapshots are packed in a worker process. 0 packs everything inline."""
+
+FAST_CLEAN = os.getenv("MCP_FAST_CLEAN", "1") != "0"
+"""Run the script/comment/noise-container passes of page cleaning in selectolax when it is installed."""
+
+CLEANED_CACHE_MAX_CHARS = int(os.getenv("MCP_CLEANED_CACHE_MAX_CHARS", "32000000") or "0")
+"""Total size (chars) of cleaned pages kept for reuse across tool calls and pagination. 0 keeps only the latest."""
+
+try:
+    SNAPSHOT_SETTLE_MS = max(0, int(os.getenv("SNAPSHOT_SETTLE_MS", "200") or "0"))
+except ValueError:
+    SNAPSHOT_SETTLE_MS = 0
+"""Fixed delay (ms) before a snapshot is taken, once the document is ready. 0 disables."""
+
 
 # ============================================================================
 # Chrome Startup Configuration
@@ -55,14 +89,31 @@ RENDEZVOUS_TTL_SEC = 24 * 3600
 ALLOW_ATTACH_ANY = os.getenv("MCP_ATTACH_ANY_PROFILE", "0") == "1"
 """Allow attaching to any Chrome profile, not just the configured one."""
 
+SNAPSHOT_ON_ERROR = os.getenv("MCP_SNAPSHOT_ON_ERROR", "0") == "1"
+"""Capture a page snapshot in tool error responses (off by default; the driver may be unhealthy)."""
+
+ERROR_DIAGNOSTICS_TIMEOUT_SECS = float(os.getenv("MCP_ERROR_DIAGNOSTICS_TIMEOUT", "2.0"))
+"""How long get_diagnostics waits for a queued post-mortem that is still being collected."""
+
 
 __all__ = [
     "ACTION_LOCK_TTL_SECS",
     "ACTION_LOCK_WAIT_SECS",
     "FILE_MUTEX_STALE_SECS",
+    "RELEASE_LOCK_ON_SUCCESS",
+    "ACTION_LOCK_SCOPE",
     "WINDOW_REGISTRY_STALE_THRESHOLD",
+    "WINDOW_POOL_MAX",
     "MAX_SNAPSHOT_CHARS",
+    "DEFAULT_DETAIL_LEVEL",
+    "SNAPSHOT_DIFF",
+    "SNAPSHOT_SETTLE_MS",
+    "PACK_OFFLOAD_MIN_CHARS",
+    "CLEANED_CACHE_MAX_CHARS",
+    "FAST_CLEAN",
     "START_LOCK_WAIT_SEC",
     "RENDEZVOUS_TTL_SEC",
     "ALLOW_ATTACH_ANY",
+    "SNAPSHOT_ON_ERROR",
+    "ERROR_DIAGNOSTICS_TIMEOUT_SECS",
 ]
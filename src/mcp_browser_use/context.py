@@ -17,7 +17,8 @@ Usage:
         ctx.driver = create_driver()
 """
 
-from typing import Optional
+from collections import deque
+from typing import Deque, Optional, Tuple
 from selenium import webdriver
 from dataclasses import dataclass, field
 import asyncio
@@ -42,6 +43,11 @@ class BrowserContext:
         config: Environment configuration dictionary
         lock_dir: Directory for lock files
         intra_process_lock: Asyncio lock for serializing operations within this process
+        snapshot_cache: Last raw page snapshot and the DOM mutation signature it was taken at
+        last_url: URL seen by the most recent page snapshot
+        defer_snapshots: Skip page capture (placeholder snapshot) for intermediate batch steps
+        window_pool: Idle (target_id, window_id) pairs kept open for reuse after close
+        verified_window: (id(driver), target_id) last confirmed usable; lets tools skip the window check
     """
 
     # Driver state
@@ -65,6 +71,21 @@ class BrowserContext:
     # Intra-process lock
     intra_process_lock: Optional[asyncio.Lock] = None
 
+    # Snapshot cache: (mutation signature, snapshot dict)
+    snapshot_cache: Optional[Tuple[tuple, dict]] = None
+
+    # URL of the most recent page snapshot (no WebDriver round-trip to read it)
+    last_url: Optional[str] = None
+
+    # Set while a batch runs steps whose snapshot nobody will read
+    defer_snapshots: bool = False
+
+    # Idle windows from close_browser, reused by the next start_browser
+    window_pool: Deque[Tuple[str, Optional[int]]] = field(default_factory=deque)
+
+    # Driver/window pair confirmed usable; cleared when a tool call fails
+    verified_window: Optional[Tuple[int, str]] = None
+
     def is_driver_initialized(self) -> bool:
         """Check if driver is initialized."""
         return self.driver is not None
@@ -86,6 +107,13 @@ class BrowserContext:
         """Reset window state (useful after window close)."""
         self.target_id = None
         self.window_id = None
+        self.verified_window = None
+        self.snapshot_cache = None
+        self.last_url = None
+
+    def invalidate_snapshot(self) -> None:
+        """Drop the cached page snapshot (call after actions that change the page)."""
+        self.snapshot_cache = None
 
     def get_intra_process_lock(self) -> asyncio.Lock:
         """Get or create the intra-process asyncio lock."""
@@ -1,6 +1,6 @@
 # mcp_browser_use/context_pack.py
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, asdict, is_dataclass
 from typing import List, Dict, Optional, Any
 
 
@@ -12,6 +12,7 @@ class ReturnMode:
     MIXED = "mixed"
 
 class CleaningLevel:
+    RAW = -1  # no cleaning pass: the page as captured
     RAW_VISIBLE = 0
     LIGHT = 1
     DEFAULT = 2
@@ -47,8 +48,12 @@ class CatalogInteractive:
     clickable: Optional[bool]
     enabled: Optional[bool]
 
-@dataclass
+@dataclass(slots=True)
 class ContextPack:
+    # The tool call's own success (the action result's "ok"), encoded first so
+    # callers can read it off the start of the JSON
+    ok: bool = field(default=True, kw_only=True)
+
     # meta
     window_tag: Optional[str]
     url: Optional[str]
@@ -82,4 +87,16 @@ class ContextPack:
     forms: Optional[Dict[str, Any]] = None
     iframe_index: Optional[List[IframeInfo]] = None
 
-    errors: List[Dict[str, Any]] = field(default_factory=list)
\ No newline at end of file
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict of all fields, ready for a JSON encoder without a `default` hook."""
+        d = {name: getattr(self, name) for name in _CONTEXT_PACK_FIELDS}
+        for name in ("outline", "iframe_index"):
+            items = d[name]
+            if items and any(is_dataclass(i) for i in items):
+                d[name] = [asdict(i) if is_dataclass(i) else i for i in items]
+        return d
+
+
+_CONTEXT_PACK_FIELDS = tuple(f.name for f in fields(ContextPack))
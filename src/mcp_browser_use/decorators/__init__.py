@@ -3,11 +3,15 @@
 # Re-exports decorators from their respective modules.
 
 from .ensure import ensure_driver_ready
-from .locking import exclusive_browser_access
-from .envelope import tool_envelope
+from .locking import exclusive_browser_access, shared_browser_access
+from .envelope import tool_envelope, fast_path
+from .tool import browser_tool
 
 __all__ = [
     "ensure_driver_ready",
     "exclusive_browser_access",
+    "shared_browser_access",
     "tool_envelope",
+    "fast_path",
+    "browser_tool",
 ]
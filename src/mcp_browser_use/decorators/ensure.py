@@ -3,82 +3,81 @@ import json
 import inspect
 import functools
 
+
+def driver_not_ready_payload(include_snapshot=False, include_diagnostics=False):
+    """
+    Check that a driver is running and its window is usable.
+
+    Returns None when the tool may proceed, otherwise the JSON error to return.
+    """
+    import mcp_browser_use.helpers as helpers  # module import, not from-import
+
+    ctx = helpers.get_context()
+    driver = ctx.driver
+    # Fast path: this driver/window pair passed the check and no call has failed since
+    if driver is not None and ctx.verified_window == (id(driver), ctx.target_id):
+        return None
+
+    # Check if driver is already initialized, but don't auto-initialize
+    if driver is None:
+        payload = {
+            "ok": False,
+            "error": "browser_not_started",
+            "message": "Browser session not started. Please call 'start_browser' first before using browser actions."
+        }
+        if include_snapshot:
+            payload["snapshot"] = {"url": None, "title": None, "html": "", "truncated": False}
+        if include_diagnostics:
+            from mcp_browser_use.config.environment import get_env_config
+            from mcp_browser_use.utils.diagnostics import collect_diagnostics
+            try:
+                payload["diagnostics"] = collect_diagnostics(None, None, get_env_config())
+            except Exception:
+                pass
+        return json.dumps(payload)
+
+    # Ensure we have a valid window for this driver
+    try:
+        helpers._ensure_singleton_window(driver)
+    except Exception:
+        ctx.verified_window = None
+        payload = {
+            "ok": False,
+            "error": "browser_window_lost",
+            "message": "Browser window was lost. Please call 'start_browser' to create a new session."
+        }
+        if include_snapshot:
+            payload["snapshot"] = {"url": None, "title": None, "html": "", "truncated": False}
+        return json.dumps(payload)
+
+    if ctx.target_id:
+        ctx.verified_window = (id(driver), ctx.target_id)
+    return None
+
+
+def forget_verified_window() -> None:
+    """Make the next tool call re-check the window (after a failed call)."""
+    import mcp_browser_use.helpers as helpers
+
+    helpers.get_context().verified_window = None
+
+
 def ensure_driver_ready(_func=None, *, include_snapshot=False, include_diagnostics=False):
     def decorator(fn):
         if inspect.iscoroutinefunction(fn):
             @functools.wraps(fn)
             async def wrapper(*args, **kwargs):
-                import mcp_browser_use.helpers as helpers  # module import, not from-import
-                from mcp_browser_use.config.environment import get_env_config
-                from mcp_browser_use.utils.diagnostics import collect_diagnostics
-
-                # Check if driver is already initialized, but don't auto-initialize
-                if helpers.get_context().driver is None:
-                    payload = {
-                        "ok": False, 
-                        "error": "browser_not_started",
-                        "message": "Browser session not started. Please call 'start_browser' first before using browser actions."
-                    }
-                    if include_snapshot:
-                        payload["snapshot"] = {"url": None, "title": None, "html": "", "truncated": False}
-                    if include_diagnostics:
-                        try:
-                            payload["diagnostics"] = collect_diagnostics(None, None, get_env_config())
-                        except Exception:
-                            pass
-                    return json.dumps(payload)
-
-                # Ensure we have a valid window for this driver
-                try:
-                    helpers._ensure_singleton_window(helpers.get_context().driver)
-                except Exception:
-                    payload = {
-                        "ok": False,
-                        "error": "browser_window_lost", 
-                        "message": "Browser window was lost. Please call 'start_browser' to create a new session."
-                    }
-                    if include_snapshot:
-                        payload["snapshot"] = {"url": None, "title": None, "html": "", "truncated": False}
-                    return json.dumps(payload)
-                
+                err = driver_not_ready_payload(include_snapshot, include_diagnostics)
+                if err:
+                    return err
                 return await fn(*args, **kwargs)
             return wrapper
         else:
             @functools.wraps(fn)
             def wrapper(*args, **kwargs):
-                import mcp_browser_use.helpers as helpers  # module import, not from-import
-                from mcp_browser_use.config.environment import get_env_config
-                from mcp_browser_use.utils.diagnostics import collect_diagnostics
-
-                # Check if driver is already initialized, but don't auto-initialize
-                if helpers.get_context().driver is None:
-                    payload = {
-                        "ok": False, 
-                        "error": "browser_not_started",
-                        "message": "Browser session not started. Please call 'start_browser' first before using browser actions."
-                    }
-                    if include_snapshot:
-                        payload["snapshot"] = {"url": None, "title": None, "html": "", "truncated": False}
-                    if include_diagnostics:
-                        try:
-                            payload["diagnostics"] = collect_diagnostics(None, None, get_env_config())
-                        except Exception:
-                            pass
-                    return json.dumps(payload)
-
-                # Ensure we have a valid window for this driver
-                try:
-                    helpers._ensure_singleton_window(helpers.get_context().driver)
-                except Exception:
-                    payload = {
-                        "ok": False,
-                        "error": "browser_window_lost", 
-                        "message": "Browser window was lost. Please call 'start_browser' to create a new session."
-                    }
-                    if include_snapshot:
-                        payload["snapshot"] = {"url": None, "title": None, "html": "", "truncated": False}
-                    return json.dumps(payload)
-                
+                err = driver_not_ready_payload(include_snapshot, include_diagnostics)
+                if err:
+                    return err
                 return fn(*args, **kwargs)
             return wrapper
-    return decorator if _func is None else decorator(_func)
\ No newline at end of file
+    return decorator if _func is None else decorator(_func)
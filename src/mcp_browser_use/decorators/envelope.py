@@ -9,60 +9,96 @@ import functools
 import traceback
 from typing import Any, Callable
 
+from ..helpers_context import reset_page_meta
+
 
 __all__ = [
     "tool_envelope",
+    "fast_path",
+    "is_fast_path",
 ]
 
 
+def fast_path(func: Callable) -> Callable:
+    """
+    Mark a synchronous helper as cheap enough to run inline on the event loop.
+
+    Decorators that would otherwise hand a sync callable to a worker thread
+    (or wrap it in a thread-based heartbeat) run fast-path helpers directly and
+    expose them as coroutine functions instead. Use only for trivial work such
+    as pure introspection or removing a lock file.
+    """
+    func.__mbu_fast_path__ = True
+    return func
+
+
+def is_fast_path(func: Callable) -> bool:
+    return bool(getattr(func, "__mbu_fast_path__", False))
+
+
+def _include_traceback() -> bool:
+    return os.getenv("MBU_TOOL_ERRORS_TRACEBACK", "1") not in ("0", "false", "False")
+
+
+def normalize_result(value: Any) -> str:
+    """Coerce a tool return value to the string FastMCP sends back."""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bytes):
+        try:
+            return value.decode("utf-8")
+        except Exception:
+            return value.decode("utf-8", "replace")
+    try:
+        return json.dumps(value, ensure_ascii=False, default=lambda o: getattr(o, "__dict__", repr(o)))
+    except Exception:
+        # Fallback to a best-effort string
+        try:
+            return str(value)
+        except Exception:
+            return ""
+
+
+def error_payload(err: Exception, include_tb: bool) -> str:
+    """Uniform JSON error for an exception that escaped a tool."""
+    tb = traceback.format_exc() if include_tb else None
+    payload = {
+        "ok": False,
+        "summary": f"{err.__class__.__name__}: {err}",
+        "error": {
+            "type": err.__class__.__name__,
+            "message": str(err),
+        },
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+    }
+    if tb:
+        payload["error"]["traceback"] = tb
+    return json.dumps(payload, ensure_ascii=False)
+
+
 def tool_envelope(func: Callable):
     """
     Minimal decorator for MCP tool functions:
       - Works with both async and sync callables.
+      - Sync callables marked with @fast_path are exposed as coroutine functions
+        and invoked inline, without a thread hop.
       - On success: ensures the return value is a string (json.dumps for non-strings).
       - On error: returns a uniform JSON string with a summary and optional traceback.
+      - Async wrappers reset the per-invocation page meta memo used by to_context_pack.
     Environment:
       - Set MBU_TOOL_ERRORS_TRACEBACK=0 to suppress traceback in error payloads.
     """
-    include_tb = os.getenv("MBU_TOOL_ERRORS_TRACEBACK", "1") not in ("0", "false", "False")
-
-    def _normalize(value: Any) -> str:
-        if value is None:
-            return ""
-        if isinstance(value, str):
-            return value
-        if isinstance(value, bytes):
-            try:
-                return value.decode("utf-8")
-            except Exception:
-                return value.decode("utf-8", "replace")
-        try:
-            return json.dumps(value, ensure_ascii=False, default=lambda o: getattr(o, "__dict__", repr(o)))
-        except Exception:
-            # Fallback to a best-effort string
-            try:
-                return str(value)
-            except Exception:
-                return ""
+    include_tb = _include_traceback()
 
     def _error_payload(err: Exception) -> str:
-        tb = traceback.format_exc() if include_tb else None
-        payload = {
-            "ok": False,
-            "summary": f"{err.__class__.__name__}: {err}",
-            "error": {
-                "type": err.__class__.__name__,
-                "message": str(err),
-            },
-            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
-        }
-        if tb:
-            payload["error"]["traceback"] = tb
-        return json.dumps(payload, ensure_ascii=False)
+        return error_payload(err, include_tb)
 
     if inspect.iscoroutinefunction(func):
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
+            reset_page_meta()
             try:
                 result = await func(*args, **kwargs)
             except asyncio.CancelledError:
@@ -70,7 +106,17 @@ def tool_envelope(func: Callable):
                 raise
             except Exception as e:
                 return _error_payload(e)
-            return _normalize(result)
+            return normalize_result(result)
+        return wrapper
+    elif is_fast_path(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            reset_page_meta()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                return _error_payload(e)
+            return normalize_result(result)
         return wrapper
     else:
         @functools.wraps(func)
@@ -79,5 +125,5 @@ def tool_envelope(func: Callable):
                 result = func(*args, **kwargs)
             except Exception as e:
                 return _error_payload(e)
-            return _normalize(result)
+            return normalize_result(result)
         return wrapper
@@ -23,11 +23,14 @@ import functools
 import contextlib
 import threading
 import time as _time
-from typing import Callable
+from typing import Callable, Optional
+
+from .envelope import is_fast_path
 
 
 __all__ = [
     "exclusive_browser_access",
+    "shared_browser_access",
 ]
 
 
@@ -54,15 +57,121 @@ def _validate_config_or_error():
         return json.dumps(error_payload)
 
 
+# Every tool response is a JSON object that starts with its top-level "ok"
+# (action results, error payloads and ContextPacks alike)
+_OK_FALSE_PREFIXES = ('{"ok":false', '{"ok": false')
+_OK_FALSE_PREFIXES_B = tuple(p.encode() for p in _OK_FALSE_PREFIXES)
+
+
+def _result_ok(result) -> bool:
+    """
+    Success check on a tool result (dict, JSON str or bytes) without parsing it.
+
+    Only the top-level "ok" counts, read off the start of the payload: a
+    failed batch step or the details of an earlier error nested inside a
+    successful result do not make the call a failure.
+    """
+    if isinstance(result, dict):
+        return result.get("ok") is not False
+    if isinstance(result, str):
+        return not result.startswith(_OK_FALSE_PREFIXES)
+    if isinstance(result, (bytes, bytearray)):
+        return not result.startswith(_OK_FALSE_PREFIXES_B)
+    return result is not None
+
+
+def _finish_action_lock(owner: str, result, ok: Optional[bool] = None) -> None:
+    """
+    Release the action lock after a successful call (MCP_RELEASE_LOCK_ON_SUCCESS=1),
+    otherwise renew it so the agent can retry without another agent cutting in.
+    `ok` overrides the success check on `result`.
+    """
+    from mcp_browser_use.constants import ACTION_LOCK_TTL_SECS, RELEASE_LOCK_ON_SUCCESS
+    from mcp_browser_use.locking.action_lock import _release_action_lock, _renew_action_lock
+
+    if ok is None:
+        ok = _result_ok(result)
+    with contextlib.suppress(Exception):
+        if RELEASE_LOCK_ON_SUCCESS and ok:
+            _release_action_lock(owner)
+        else:
+            _renew_action_lock(owner, ttl=ACTION_LOCK_TTL_SECS)
+
+
+def _finish_shared_or_exclusive(lock, shared: bool, owner: str, result, ok: Optional[bool] = None) -> None:
+    """
+    _finish_action_lock() for a caller about to leave `lock`. Readers share
+    the softlock, so on the reader side only the last one out releases or
+    renews it (as failed if any reader of the group failed).
+    """
+    if ok is None:
+        ok = _result_ok(result)
+    if shared:
+        ok = lock.reader_done(ok)
+        if ok is None:
+            return
+    _finish_action_lock(owner, result, ok=ok)
+
+
+class _Heartbeat:
+    """
+    Renew the action lock every second until stop() is called.
+
+    Runs off event-loop timers rather than a task: starting one costs a single
+    call_later, with no Task, Event or wait_for per tool call, and stopping it
+    needs no await.
+    """
+
+    __slots__ = ("owner", "_loop", "_handle")
+
+    def __init__(self, owner: str):
+        self.owner = owner
+        self._loop = asyncio.get_running_loop()
+        self._handle = self._loop.call_later(1.0, self._tick)
+
+    def _tick(self) -> None:
+        from mcp_browser_use.constants import ACTION_LOCK_TTL_SECS
+        from mcp_browser_use.locking.action_lock import _renew_action_lock
+
+        try:
+            _renew_action_lock(self.owner, ttl=ACTION_LOCK_TTL_SECS)
+        except Exception:
+            pass
+        if self._handle is not None:
+            self._handle = self._loop.call_later(1.0, self._tick)
+
+    def stop(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+
 def exclusive_browser_access(_func=None):
     """
     Acquire the action lock, keep it alive with a heartbeat while the function runs,
-    and renew once on exit. Also serializes calls within this process.
+    and release it on success (renew on failure). Also serializes calls within this process.
     Use on tools that mutate or depend on exclusive browser access.
+
+    Sync functions marked with @fast_path are run inline under the async lock
+    rather than through the thread-based heartbeat path.
     """
+    return _browser_access(_func, shared=False)
 
+
+def shared_browser_access(_func=None):
+    """
+    Like exclusive_browser_access, but takes the in-process lock on its reader
+    side: read-only tools may run alongside each other, never alongside a
+    tool holding exclusive access.
+    """
+    return _browser_access(_func, shared=True)
+
+
+def _browser_access(_func, shared: bool):
     def decorator(func):
-        if inspect.iscoroutinefunction(func):
+        if inspect.iscoroutinefunction(func) or is_fast_path(func):
+            inline = not inspect.iscoroutinefunction(func)
+
             @functools.wraps(func)
             async def wrapper(*args, **kwargs):
                 # Early config validation to prevent race condition
@@ -71,11 +180,9 @@ def exclusive_browser_access(_func=None):
                     return config_error
 
                 # Import lazily to avoid cycles at module import time
-                from mcp_browser_use.constants import ACTION_LOCK_TTL_SECS
                 from mcp_browser_use.locking.action_lock import (
                     get_intra_process_lock,
                     _acquire_action_lock_or_error,
-                    _renew_action_lock,
                 )
                 from mcp_browser_use.browser.process import ensure_process_tag
 
@@ -84,40 +191,28 @@ def exclusive_browser_access(_func=None):
 
                 # In-process serialization across tools
                 lock = get_intra_process_lock()
-                async with lock:
+                async with (lock.reader if shared else lock):
                     # Acquire cross-process action lock (waits up to ACTION_LOCK_WAIT_SECS)
                     err = _acquire_action_lock_or_error(owner)
                     if err:
                         # err is already a JSON string; let your tool_envelope pass it through
                         return err
 
-                    stop = asyncio.Event()
-
-                    async def _beater():
+                    result = None
+                    if inline:
                         try:
-                            while not stop.is_set():
-                                try:
-                                    await asyncio.wait_for(stop.wait(), timeout=1.0)
-                                    break
-                                except asyncio.TimeoutError:
-                                    pass
-                                try:
-                                    _renew_action_lock(owner, ttl=ACTION_LOCK_TTL_SECS)
-                                except Exception:
-                                    pass
-                        except asyncio.CancelledError:
-                            pass
-
-                    task = asyncio.create_task(_beater())
+                            result = func(*args, **kwargs)
+                            return result
+                        finally:
+                            _finish_shared_or_exclusive(lock, shared, owner, result)
+
+                    beat = _Heartbeat(owner)
                     try:
-                        return await func(*args, **kwargs)
+                        result = await func(*args, **kwargs)
+                        return result
                     finally:
-                        stop.set()
-                        task.cancel()
-                        with contextlib.suppress(asyncio.CancelledError, Exception):
-                            await task
-                        with contextlib.suppress(Exception):
-                            _renew_action_lock(owner, ttl=ACTION_LOCK_TTL_SECS)
+                        beat.stop()
+                        _finish_shared_or_exclusive(lock, shared, owner, result)
             return wrapper
 
         # Optional sync path (rare in your code); no asyncio.Lock here.
@@ -156,14 +251,15 @@ def exclusive_browser_access(_func=None):
 
             t = threading.Thread(target=_beater, daemon=True)
             t.start()
+            result = None
             try:
-                return func(*args, **kwargs)
+                result = func(*args, **kwargs)
+                return result
             finally:
                 stop = True
                 with contextlib.suppress(Exception):
                     t.join(timeout=0.5)
-                with contextlib.suppress(Exception):
-                    _renew_action_lock(owner, ttl=ACTION_LOCK_TTL_SECS)
+                _finish_action_lock(owner, result)
 
         return wrapper
 
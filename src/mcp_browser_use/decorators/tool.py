@@ -0,0 +1,81 @@
+# mcp_browser_use/decorators/tool.py
+#
+# The tool_envelope + exclusive_browser_access + ensure_driver_ready stack,
+# composed into a single wrapper.
+
+import asyncio
+import inspect
+import functools
+from typing import Callable, Optional
+
+from .envelope import _include_traceback, error_payload, normalize_result
+from .ensure import driver_not_ready_payload, forget_verified_window
+from .locking import _validate_config_or_error, _finish_action_lock, _Heartbeat, _result_ok
+from ..helpers_context import reset_page_meta
+from ..locking.action_lock import get_intra_process_lock, _acquire_action_lock_or_error
+from ..browser.process import ensure_process_tag
+
+
+__all__ = [
+    "browser_tool",
+]
+
+
+def browser_tool(func: Optional[Callable] = None, *, shared: bool = False):
+    """
+    Equivalent to stacking @tool_envelope, @exclusive_browser_access and
+    @ensure_driver_ready on an async tool, in that order, but as one wrapper:
+    one coroutine frame per call instead of three, with the lock helpers bound
+    at import time rather than imported on every call.
+
+    With shared=True (read-only tools) the in-process lock is taken on its
+    reader side, so inspections can run alongside each other while actions
+    still run alone.
+    """
+    def decorator(func: Callable):
+        if not inspect.iscoroutinefunction(func):
+            raise TypeError("browser_tool requires an async function")
+
+        include_tb = _include_traceback()
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            reset_page_meta()
+            try:
+                config_error = _validate_config_or_error()
+                if config_error:
+                    return config_error
+
+                owner = ensure_process_tag()
+                lock = get_intra_process_lock()
+                async with (lock.reader if shared else lock):
+                    err = _acquire_action_lock_or_error(owner)
+                    if err:
+                        return err
+
+                    result = None
+                    beat = _Heartbeat(owner)
+                    try:
+                        result = driver_not_ready_payload()
+                        if result is None:
+                            result = normalize_result(await func(*args, **kwargs))
+                        return result
+                    finally:
+                        ok = _result_ok(result)
+                        if not ok:
+                            forget_verified_window()
+                        beat.stop()
+                        if shared:
+                            # Readers share the softlock: the last one out finishes it
+                            ok = lock.reader_done(ok)
+                        if ok is not None:
+                            _finish_action_lock(owner, result, ok=ok)
+            except asyncio.CancelledError:
+                # Preserve cooperative cancellation semantics
+                raise
+            except Exception as e:
+                return error_payload(e, include_tb)
+
+        return wrapper
+
+    return decorator if func is None else decorator(func)
@@ -72,7 +72,13 @@ from .constants import (
     RENDEZVOUS_TTL_SEC as _RENDEZVOUS_TTL_SEC,
     ALLOW_ATTACH_ANY as _ALLOW_ATTACH_ANY,
 )
-from .config.environment import get_env_config as _get_env_config, profile_key as _profile_key
+from .config.environment import (
+    get_env_config as _get_env_config,
+    invalidate_env_config,
+    profile_key as _profile_key,
+)
+# .env may have overridden values cached by an earlier import
+invalidate_env_config()
 from .config.paths import get_lock_dir as _get_lock_dir
 #endregion
 
@@ -143,6 +149,9 @@ __all__ = [
     'RENDEZVOUS_TTL_SEC',
     'ALLOW_ATTACH_ANY',
 
+    # Config
+    'invalidate_env_config',
+
     # ===== Core Functions (Internal but needed by decorators/tools) =====
     # Locking
     'get_intra_process_lock',
@@ -1,11 +1,34 @@
 # mcp_browser_use/helpers_context.py
 import os
 import time
-import json as _json
-from typing import Optional
+import functools
+import dataclasses
+import asyncio
+import contextvars
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
 from selenium.webdriver.support.ui import WebDriverWait
-from .context_pack import ContextPack, ReturnMode
-from .cleaners import basic_prune, approx_token_count, extract_outline
+from .context_pack import CleaningLevel, ContextPack, ReturnMode
+from .cleaners import basic_prune, approx_token_count, approx_token_count_of_len, extract_outline
+from .utils.jsonio import dumps, dumps_record, loads
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - optional dependency
+    xxhash = None
+
+
+def _content_hash(data: bytes) -> bytes:
+    """
+    8-byte non-cryptographic hash for cache keys and subtree hashes: xxh3 when
+    xxhash is installed (an order of magnitude faster on large pages),
+    blake2b otherwise. Only ever compared within one process.
+    """
+    if xxhash is not None:
+        return xxhash.xxh3_64_digest(data)
+    return hashlib.blake2b(data, digest_size=8).digest()
 
 
 def _wait_for_dom_ready(driver, timeout=15):
@@ -14,7 +37,7 @@ def _wait_for_dom_ready(driver, timeout=15):
     )
 
 def _apply_snapshot_settle():
-    settle_ms = int(os.getenv("SNAPSHOT_SETTLE_MS", "200"))  # 0 disables
+    from .constants import SNAPSHOT_SETTLE_MS as settle_ms  # 0 disables
     if settle_ms > 0:
         time.sleep(settle_ms / 1000.0)
 
@@ -29,6 +52,306 @@ def take_screenshot(driver, path: str):
     _apply_snapshot_settle()
     driver.save_screenshot(path)
 
+# Per owner (window tag): (url, {DOM path of a <body> descendant: subtree hash})
+_subtree_hashes: Dict[str, Tuple[Optional[str], Dict[Tuple[int, ...], str]]] = {}
+# Large diff-mode packs run on worker threads; each diff must see the hashes
+# its predecessor recorded
+_SUBTREE_LOCK = threading.Lock()
+
+# How far below <body> changed subtrees are searched for unchanged children
+_DIFF_MAX_DEPTH = 3
+
+
+def invalidate_subtree_hashes(owner: Optional[str] = None) -> None:
+    """Forget recorded subtree hashes for `owner` (all owners if None)."""
+    if owner is None:
+        _subtree_hashes.clear()
+    else:
+        _subtree_hashes.pop(owner, None)
+
+
+def elide_unchanged_subtrees(html: str, owner: str, url: Optional[str]) -> Tuple[str, int]:
+    """
+    Replace <body> subtrees that are identical to the previous snapshot for the
+    same owner and URL with `<section data-mcp="unchanged" hash="..."></section>`.
+
+    Subtrees are matched by DOM path (child positions from <body>). A changed
+    subtree is searched for unchanged children, down to _DIFF_MAX_DEPTH levels,
+    so a small edit inside a large container only resends the edited branch.
+
+    Returns (html, number of subtrees elided). The first snapshot after a URL change
+    is returned in full and only records hashes.
+    """
+    with _SUBTREE_LOCK:
+        return _elide_unchanged_subtrees(html, owner, url)
+
+
+def _elide_unchanged_subtrees(html: str, owner: str, url: Optional[str]) -> Tuple[str, int]:
+    from bs4 import BeautifulSoup, Tag
+
+    soup = BeautifulSoup(html, "html.parser")
+    root = soup.body or soup
+    prev_url, prev = _subtree_hashes.get(owner, (None, {}))
+    if prev_url != url:
+        prev = {}
+
+    current: Dict[Tuple[int, ...], str] = {}
+    elided = 0
+
+    def walk(parent, path: Tuple[int, ...]) -> None:
+        nonlocal elided
+        children = [c for c in parent.children if isinstance(c, Tag)]
+        for pos, el in enumerate(children):
+            key = path + (pos,)
+            digest = _content_hash(str(el).encode("utf-8")).hex()
+            current[key] = digest
+            if prev.get(key) == digest:
+                el.replace_with(soup.new_tag("section", attrs={"data-mcp": "unchanged", "hash": digest}))
+                elided += 1
+            elif len(key) < _DIFF_MAX_DEPTH:
+                walk(el, key)
+
+    walk(root, ())
+
+    _subtree_hashes[owner] = (url, current)
+    return (str(soup) if elided else html), elided
+
+
+# Scalar field defaults of ContextPack, for resetting a reused instance
+_PACK_DEFAULTS = tuple(
+    (f.name, f.default) for f in dataclasses.fields(ContextPack) if f.default is not dataclasses.MISSING
+)
+_PACK_FIELDS = tuple(f.name for f in dataclasses.fields(ContextPack))
+
+# window_tag -> ContextPack reused by to_context_pack. An instance is only valid
+# until the next to_context_pack call for the same window (it is serialized
+# immediately, with no await in between).
+_CP_POOL: Dict[Optional[str], ContextPack] = {}
+
+
+def _pooled_pack(window_tag: Optional[str]) -> ContextPack:
+    cp = _CP_POOL.get(window_tag)
+    if cp is None:
+        cp = _CP_POOL[window_tag] = ContextPack(window_tag=window_tag, url=None, title=None)
+    return cp
+
+
+def _reset_pack(cp: ContextPack, **fields) -> ContextPack:
+    """Reset a reused ContextPack to defaults plus `fields`, keeping its errors list."""
+    errors = cp.errors
+    errors.clear()
+    for name, value in _PACK_DEFAULTS:
+        setattr(cp, name, value)
+    cp.pruned_counts = {}
+    cp.outline = []
+    for name, value in fields.items():
+        setattr(cp, name, value)
+    return cp
+
+
+def _fill_pack(cp: ContextPack, source: ContextPack) -> ContextPack:
+    """Copy every field of `source` into the reused `cp`, keeping cp's own (cleared) errors list."""
+    errors = cp.errors
+    for name in _PACK_FIELDS:
+        setattr(cp, name, getattr(source, name))
+    errors.clear()
+    cp.errors = errors
+    return cp
+
+
+# Raw HTML chars cleaned per needed output char on the first pass, and the
+# smallest raw prefix worth cutting to
+_RAW_PER_OUTPUT_CHAR = 4
+_MIN_RAW_PREFIX = 64 * 1024
+
+
+def _visible_text(cleaned_html: str) -> str:
+    # Very naive visible text extraction through soup.get_text()
+    try:
+        from bs4 import BeautifulSoup
+        return BeautifulSoup(cleaned_html, "html.parser").get_text("\n", strip=True)
+    except Exception:
+        return ""
+
+
+def _clean_within_budget(html: str, cleaning_level: int, return_mode: str, need_chars: int):
+    """
+    Clean only as much of the raw page as it takes to produce `need_chars` of
+    output (offset + budget) instead of cleaning the whole page and slicing.
+
+    Starts from a raw prefix of `need_chars * _RAW_PER_OUTPUT_CHAR` chars, cut
+    at a tag boundary, and grows it 4x until the cleaned output is long enough
+    or the whole page has been used. The leading output matches cleaning the
+    full page; pruned_counts then cover the processed prefix only.
+
+    Returns (cleaned_html, pruned_counts, visible_text or None, whole page cleaned).
+    """
+    from .utils.html_utils import _pretruncate_html
+
+    limit = max(need_chars * _RAW_PER_OUTPUT_CHAR, _MIN_RAW_PREFIX)
+    while True:
+        part = _pretruncate_html(html, limit)
+        cleaned_html, pruned_counts = basic_prune(html=part, level=cleaning_level)
+        text = _visible_text(cleaned_html) if return_mode == ReturnMode.TEXT else None
+        if len(part) == len(html):
+            return cleaned_html, pruned_counts, text, True
+        produced = len(text) if text is not None else len(cleaned_html)
+        if produced > need_chars:
+            return cleaned_html, pruned_counts, text, False
+        limit *= 4
+
+
+# The last page digested and its digest: the pack cache key and the cleaning
+# cache key hash the same string within one call
+_LAST_DIGEST: Tuple[Optional[str], bytes] = (None, b"")
+
+
+def html_digest(html: str) -> bytes:
+    """Content digest of a page, as used by the pack and cleaning caches."""
+    return _content_hash(html.encode("utf-8"))
+
+
+def _html_digest(html: str) -> bytes:
+    global _LAST_DIGEST
+    last_html, digest = _LAST_DIGEST
+    if html is not last_html:
+        digest = html_digest(html)
+        _LAST_DIGEST = (html, digest)
+    return digest
+
+
+def _snapshot_digest(snapshot: dict) -> bytes:
+    """
+    Digest of the snapshot html. Snapshots served from the capture cache carry
+    the digest taken at capture time ("html_digest"), so an unchanged page is
+    not hashed again on every tool call. A Snapshot handed over unencoded
+    carries it as its `digest` attribute instead.
+    """
+    global _LAST_DIGEST
+    html = snapshot.get("html") or ""
+    carried = snapshot.get("html_digest") or getattr(snapshot, "digest", None)
+    if isinstance(carried, str) and html is not _LAST_DIGEST[0]:
+        try:
+            _LAST_DIGEST = (html, bytes.fromhex(carried))
+        except ValueError:
+            pass
+    return _html_digest(html)
+
+
+# (raw html digest, cleaning_level) -> [cleaned_html, pruned_counts, whole page cleaned, visible text or None].
+# Lets html_offset/text_offset pagination over one page, and repeat calls on an
+# unchanged page from any window, reuse a single cleaning pass. Bounded by entry
+# count and by total cleaned chars (CLEANED_CACHE_MAX_CHARS).
+_CLEANED_CACHE: "OrderedDict[tuple, list]" = OrderedDict()
+_CLEANED_CACHE_MAX = 64
+# Packs of mid-sized pages run on worker threads (see _offload_target)
+_CLEANED_LOCK = threading.Lock()
+
+
+def _clean_cached(html: str, cleaning_level: int, return_mode: str, need_chars: Optional[int]):
+    """
+    basic_prune() (need_chars=None) or _clean_within_budget() memoized on the raw
+    page content. A cached prefix is reused while it covers `need_chars`; a
+    request reaching past it cleans a longer prefix and replaces the entry.
+
+    Returns (cleaned_html, pruned_counts, visible_text or None).
+    """
+    want_text = return_mode == ReturnMode.TEXT
+    key = (_html_digest(html), cleaning_level)
+    with _CLEANED_LOCK:
+        entry = _CLEANED_CACHE.get(key)
+        if entry is not None:
+            _CLEANED_CACHE.move_to_end(key)
+    if entry is not None:
+        cleaned_html, pruned_counts, complete, text = entry
+        if want_text and text is None:
+            text = entry[3] = _visible_text(cleaned_html)
+        produced = len(text) if want_text else len(cleaned_html)
+        if complete or (need_chars is not None and produced > need_chars):
+            return cleaned_html, pruned_counts, (text if want_text else None)
+
+    if need_chars is None:
+        cleaned_html, pruned_counts = basic_prune(html=html, level=cleaning_level)
+        text, complete = None, True
+    else:
+        cleaned_html, pruned_counts, text, complete = _clean_within_budget(
+            html, cleaning_level, return_mode, need_chars,
+        )
+    with _CLEANED_LOCK:
+        _CLEANED_CACHE[key] = [cleaned_html, pruned_counts, complete, text]
+        _CLEANED_CACHE.move_to_end(key)
+        _trim_cleaned_cache()
+    return cleaned_html, pruned_counts, text
+
+
+def _has_cleaned(html: str, cleaning_level: int) -> bool:
+    with _CLEANED_LOCK:
+        return (_html_digest(html), cleaning_level) in _CLEANED_CACHE
+
+
+def _remember_cleaned(key: tuple, entry: list) -> None:
+    """Adopt a cleaning produced elsewhere (a pack worker process)."""
+    with _CLEANED_LOCK:
+        _CLEANED_CACHE[key] = entry
+        _CLEANED_CACHE.move_to_end(key)
+        _trim_cleaned_cache()
+
+
+def _trim_cleaned_cache() -> None:
+    """Evict least recently used cleaned pages over the count or size bound; the newest always stays."""
+    from .constants import CLEANED_CACHE_MAX_CHARS
+    while len(_CLEANED_CACHE) > _CLEANED_CACHE_MAX:
+        _CLEANED_CACHE.popitem(last=False)
+    size = sum(len(e[0]) + len(e[3] or "") for e in _CLEANED_CACHE.values())
+    while len(_CLEANED_CACHE) > 1 and size > CLEANED_CACHE_MAX_CHARS:
+        _, e = _CLEANED_CACHE.popitem(last=False)
+        size -= len(e[0]) + len(e[3] or "")
+
+
+def _page_window(cp: ContextPack, content: str, offset: Optional[int], token_budget: Optional[int]) -> str:
+    """content[offset:offset + token_budget * 4], flagging cp.hard_capped if it was cut short."""
+    start = offset if offset and offset > 0 else 0
+    if token_budget:
+        end = start + token_budget * 4
+        if len(content) > end:
+            cp.hard_capped = True
+            return content[start:end]
+    return content[start:] if start else content
+
+
+# Rough serialized size of one outline entry (level, text, css_path) in tokens
+_OUTLINE_ITEM_TOKENS = 40
+_OUTLINE_MAX_ITEMS = 64
+
+
+def _outline_within_budget(cp: ContextPack, cleaned_html: str, token_budget: Optional[int]) -> list:
+    """Extract only as many headings as ``token_budget`` can carry.
+
+    extract_outline stops walking the tree once it has ``max_items``, so a
+    small budget also means less work; one extra item tells us whether the
+    page had more and the pack was capped.
+    """
+    # Raw html never went through basic_prune's lexbor pass
+    normalized = cp.cleaning_level_applied > CleaningLevel.RAW
+    if not token_budget:
+        return extract_outline(html=cleaned_html, normalized=normalized)
+    cap = min(_OUTLINE_MAX_ITEMS, max(8, token_budget // _OUTLINE_ITEM_TOKENS))
+    if cap >= _OUTLINE_MAX_ITEMS:
+        return extract_outline(html=cleaned_html, normalized=normalized)
+    outline = extract_outline(html=cleaned_html, max_items=cap + 1, normalized=normalized)
+    if len(outline) > cap:
+        cp.hard_capped = True
+        del outline[cap:]
+    return outline
+
+
+def _outline_tokens(outline: list) -> int:
+    """approx_token_count() of the headings joined by spaces, without building the string."""
+    if not outline:
+        return 0
+    return approx_token_count_of_len(sum(len(o["text"]) for o in outline) + len(outline) - 1)
+
+
 def pack_snapshot(
     *,
     window_tag: Optional[str],
@@ -40,8 +363,10 @@ def pack_snapshot(
     token_budget: Optional[int],
     text_offset: Optional[int] = None,
     html_offset: Optional[int] = None,
+    diff_mode: bool = False,
+    into: Optional[ContextPack] = None,
 ) -> ContextPack:
-    cp = ContextPack(
+    fields = dict(
         window_tag=window_tag,
         url=url,
         title=title,
@@ -49,63 +374,59 @@ def pack_snapshot(
         snapshot_mode=return_mode,
         tokens_budget=token_budget,
     )
+    cp = ContextPack(**fields) if into is None else _reset_pack(into, **fields)
 
     html = raw_html or ""
-    cleaned_html, pruned_counts = basic_prune(html=html, level=cleaning_level)
+    visible_text = None
+    if cleaning_level <= CleaningLevel.RAW:
+        # The page as captured: no cleaning pass (and nothing to cache)
+        cleaned_html, pruned_counts = html, {}
+    elif token_budget and return_mode in (ReturnMode.HTML, ReturnMode.TEXT) and not diff_mode:
+        offset = (html_offset if return_mode == ReturnMode.HTML else text_offset) or 0
+        cleaned_html, pruned_counts, visible_text = _clean_cached(
+            html, cleaning_level, return_mode, offset + token_budget * 4,
+        )
+    else:
+        cleaned_html, pruned_counts, visible_text = _clean_cached(html, cleaning_level, return_mode, None)
     cp.pruned_counts = pruned_counts
 
     if return_mode == ReturnMode.OUTLINE:
-        outline = extract_outline(html=cleaned_html)
+        outline = _outline_within_budget(cp, cleaned_html, token_budget)
         cp.outline_present = True
         cp.outline = [
             # convert dict -> dataclass-ish dict; leaving as dict is fine for now
             o for o in outline
         ]
-        cp.approx_tokens = approx_token_count(text=" ".join([o["text"] for o in outline]))
+        cp.approx_tokens = _outline_tokens(outline)
         return cp
 
     if return_mode == ReturnMode.HTML:
-        # Apply html_offset if specified (for pagination through large HTML content)
-        if html_offset and html_offset > 0:
-            cleaned_html = cleaned_html[html_offset:]
-
-        # Respect token budget by truncating cleaned_html conservatively
-        if token_budget:
-            # Convert tokens -> chars budget ~4 chars/token
-            char_budget = token_budget * 4
-            if len(cleaned_html) > char_budget:
-                cleaned_html = cleaned_html[:char_budget]
-                cp.hard_capped = True
+        # Elide subtrees unchanged since the last snapshot (offsets would no longer line up, so not when paginating)
+        if diff_mode and not html_offset and cleaned_html:
+            cleaned_html, elided = elide_unchanged_subtrees(cleaned_html, owner=window_tag or "default", url=url)
+            cp.diff_present = elided > 0
+
+        # Apply html_offset (pagination through large HTML content) and the token
+        # budget (~4 chars/token) as one slice, so only the returned window is copied
+        cleaned_html = _page_window(cp, cleaned_html, html_offset, token_budget)
         cp.html = cleaned_html
         cp.approx_tokens = approx_token_count(text=cleaned_html)
         return cp
 
     if return_mode == ReturnMode.TEXT:
-        # Very naive visible text extraction through soup.get_text()
-        try:
-            from bs4 import BeautifulSoup
-            txt = BeautifulSoup(cleaned_html, "html.parser").get_text("\n", strip=True)
-        except Exception:
-            txt = ""
+        txt = visible_text if visible_text is not None else _visible_text(cleaned_html)
 
-        # Apply text_offset if specified (for pagination through large content)
-        if text_offset and text_offset > 0:
-            txt = txt[text_offset:]
-
-        if token_budget:
-            char_budget = token_budget * 4
-            if len(txt) > char_budget:
-                txt = txt[:char_budget]
-                cp.hard_capped = True
+        # Apply text_offset (pagination through large content) and the token budget
+        txt = _page_window(cp, txt, text_offset, token_budget)
         cp.text = txt
         cp.approx_tokens = approx_token_count(text=txt)
         return cp
 
     # Fallback to outline
-    outline = extract_outline(html=cleaned_html)
+    outline = _outline_within_budget(cp, cleaned_html, token_budget)
     cp.outline_present = True
     cp.outline = [o for o in outline]
-    cp.approx_tokens = approx_token_count(text=" ".join([o["text"] for o in outline]))
+    cp.approx_tokens = _outline_tokens(outline)
     return cp
 
 
@@ -118,6 +439,8 @@ def pack_from_snapshot_dict(
     token_budget: Optional[int],
     text_offset: Optional[int] = None,
     html_offset: Optional[int] = None,
+    diff_mode: bool = False,
+    into: Optional[ContextPack] = None,
 ):
     """
     Build a ContextPack object from a raw snapshot dict and packing controls.
@@ -137,6 +460,9 @@ def pack_from_snapshot_dict(
             Only used when return_mode="text".
         html_offset: Optional character offset to skip at the start of HTML (for pagination).
             Only used when return_mode="html".
+        diff_mode: Replace top-level subtrees unchanged since the previous html-mode
+            snapshot for this window with `data-mcp="unchanged"` stubs.
+        into: Existing ContextPack to reset and fill instead of allocating a new one.
 
     Returns:
         ContextPack: The structured envelope ready for JSON serialization.
@@ -166,10 +492,472 @@ def pack_from_snapshot_dict(
         token_budget=token_budget,
         text_offset=text_offset,
         html_offset=html_offset,
+        diff_mode=diff_mode,
+        into=into,
+    )
+
+
+def _empty_pack(
+    window_tag: Optional[str],
+    url: Optional[str],
+    title: Optional[str],
+    return_mode: str,
+    cleaning_level: int,
+    token_budget: Optional[int],
+) -> ContextPack:
+    """The ContextPack pack_snapshot() would build for empty HTML, without running the pipeline."""
+    cp = _reset_pack(
+        _pooled_pack(window_tag),
+        window_tag=window_tag,
+        url=url,
+        title=title,
+        cleaning_level_applied=cleaning_level,
+        snapshot_mode=return_mode,
+        tokens_budget=token_budget,
     )
+    if return_mode == ReturnMode.HTML:
+        cp.html = ""
+    elif return_mode == ReturnMode.TEXT:
+        cp.text = ""
+    else:
+        cp.outline_present = True
+    return cp
+
+
+def _budget_warning(token_budget: int) -> dict:
+    return {
+        "type": "warning",
+        "summary": "High token budget detected",
+        "details": {
+            "requested_token_budget": token_budget,
+            "message": (
+                f"You requested a token budget of {token_budget} tokens, which may clog your context. "
+                "Consider using the extract_elements tool with structured extraction (MODE 2) "
+                "to extract only the specific data you need. This can reduce token usage by 90%+ "
+                "while getting more precise results. "
+                "Example: extract_elements(container_selector='div.product', fields=[...], max_items=50)"
+            ),
+            "recommendation": "Use extract_elements tool for targeted data extraction instead of large snapshots"
+        }
+    }
 
 
-async def to_context_pack(result_json: str, return_mode: str, cleaning_level: int, token_budget=1000, text_offset: Optional[int] = None, html_offset: Optional[int] = None) -> str:
+# (return_mode, cleaning_level, token_budget) -> the encoded empty pack split
+# around its variable fields (window_tag, url, title, mixed)
+_EMPTY_TEMPLATES: Dict[tuple, Tuple[str, ...]] = {}
+_TEMPLATE_SLOTS = ("window_tag", "url", "title", "mixed")
+
+
+def _empty_pack_template(return_mode: str, cleaning_level: int, token_budget: Optional[int]) -> Tuple[str, ...]:
+    """
+    Encode the empty pack for these controls once, with marker strings in the
+    variable slots, and split it there; callers join the pieces around their
+    own encoded values.
+    """
+    key = (return_mode, cleaning_level, token_budget)
+    parts = _EMPTY_TEMPLATES.get(key)
+    if parts is None:
+        markers = {name: f"\x00{name}\x00" for name in _TEMPLATE_SLOTS}
+        cp = ContextPack(window_tag=None, url=None, title=None)
+        _reset_pack(cp, cleaning_level_applied=cleaning_level, snapshot_mode=return_mode,
+                    tokens_budget=token_budget, **markers)
+        if return_mode == ReturnMode.HTML:
+            cp.html = ""
+        elif return_mode == ReturnMode.TEXT:
+            cp.text = ""
+        else:
+            cp.outline_present = True
+        if token_budget and token_budget > 10_000:
+            cp.errors.append(_budget_warning(token_budget))
+        rest = dumps_record(cp, default=_encode_fallback)
+        pieces = []
+        for name in _TEMPLATE_SLOTS:
+            head, rest = rest.split(dumps(markers[name]), 1)
+            pieces.append(head)
+        pieces.append(rest)
+        parts = _EMPTY_TEMPLATES[key] = tuple(pieces)
+    return parts
+
+
+# (window_tag, url, title, html digest, packing controls) -> packed ContextPack.
+# Keyed by page content, so it never needs explicit invalidation.
+_PACK_CACHE: "OrderedDict[tuple, ContextPack]" = OrderedDict()
+_PACK_CACHE_MAX = 32
+
+
+def _pack_key(snapshot: dict, window_tag, return_mode, cleaning_level, token_budget,
+              text_offset, html_offset, detail_level) -> tuple:
+    return (
+        window_tag, snapshot.get("url"), snapshot.get("title"),
+        _snapshot_digest(snapshot),
+        return_mode, cleaning_level, token_budget, text_offset, html_offset,
+        detail_level,
+    )
+
+
+def _pack_uncached(
+    snapshot: dict,
+    window_tag: Optional[str],
+    return_mode: str,
+    cleaning_level: int,
+    token_budget: Optional[int],
+    text_offset: Optional[int],
+    html_offset: Optional[int],
+    detail_level: Optional[str] = None,
+    diff_mode: bool = False,
+    into: Optional[ContextPack] = None,
+) -> ContextPack:
+    """pack_from_snapshot_dict() after applying detail_level (module-level so worker processes can run it)."""
+    if detail_level == "interactive":
+        snapshot = _interactive_snapshot(snapshot)
+    return pack_from_snapshot_dict(
+        snapshot=snapshot, window_tag=window_tag, return_mode=return_mode,
+        cleaning_level=cleaning_level, token_budget=token_budget,
+        text_offset=text_offset, html_offset=html_offset, diff_mode=diff_mode,
+        into=into,
+    )
+
+
+def _remember_pack(key: tuple, cp: ContextPack) -> None:
+    _PACK_CACHE[key] = cp
+    if len(_PACK_CACHE) > _PACK_CACHE_MAX:
+        _PACK_CACHE.popitem(last=False)
+
+
+# (pack key, encoded leftovers) -> the serialized ContextPack to_context_pack()
+# returned. An idempotent call on an unchanged page (wait_for_element,
+# debug_element, no-op scrolls, ...) gets the same string back without
+# copying and re-encoding the cached pack.
+_PACK_JSON_CACHE: "OrderedDict[tuple, str]" = OrderedDict()
+
+
+def _remember_pack_json(key: tuple, out: str) -> None:
+    _PACK_JSON_CACHE[key] = out
+    if len(_PACK_JSON_CACHE) > _PACK_CACHE_MAX:
+        _PACK_JSON_CACHE.popitem(last=False)
+
+
+def _pack_cached(
+    snapshot: dict,
+    window_tag: Optional[str],
+    return_mode: str,
+    cleaning_level: int,
+    token_budget: Optional[int],
+    text_offset: Optional[int],
+    html_offset: Optional[int],
+    diff_mode: bool,
+    detail_level: Optional[str] = None,
+    key: Optional[tuple] = None,
+) -> ContextPack:
+    """
+    pack_from_snapshot_dict() memoized on the snapshot content and packing controls.
+
+    Repeated tool calls on an unchanged page (debug_element, no-op scrolls, ...)
+    skip cleaning, outline/text extraction and truncation. The cached fields are
+    copied into the window's pooled ContextPack, which has its own `errors`
+    list. Diff-mode html packs depend on the previous snapshot and are never
+    cached. detail_level "interactive" prunes the HTML to its interactive
+    skeleton before packing (see cleaners.interactive_prune). `key`, when the
+    caller already computed it, is the _pack_key() of these arguments.
+    """
+    args = (snapshot, window_tag, return_mode, cleaning_level, token_budget, text_offset, html_offset, detail_level)
+    if diff_mode and return_mode == ReturnMode.HTML:
+        return _pack_uncached(*args, diff_mode=True, into=_pooled_pack(window_tag))
+
+    if key is None:
+        key = _pack_key(*args)
+    cached = _PACK_CACHE.get(key)
+    if cached is None:
+        cached = _pack_uncached(*args)
+        _remember_pack(key, cached)
+    else:
+        _PACK_CACHE.move_to_end(key)
+
+    return _fill_pack(_pooled_pack(window_tag), cached)
+
+
+# Pages this large (raw chars), or budgets this high, are packed in a worker
+# process so the event loop keeps serving other agents; at most
+# _PACK_CONCURRENCY such packs run at once.
+_PACK_CONCURRENCY = min(4, os.cpu_count() or 1)
+_OFFLOAD_MIN_BUDGET = 20_000
+_PACK_EXECUTOR = None
+_PACK_SEMAPHORE: Optional[asyncio.Semaphore] = None
+
+
+def _pack_executor():
+    global _PACK_EXECUTOR
+    if _PACK_EXECUTOR is None:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        # spawn: forking a process that runs the Selenium worker thread is unsafe
+        _PACK_EXECUTOR = ProcessPoolExecutor(
+            max_workers=_PACK_CONCURRENCY, mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _PACK_EXECUTOR
+
+
+def _pack_semaphore() -> asyncio.Semaphore:
+    global _PACK_SEMAPHORE
+    if _PACK_SEMAPHORE is None:
+        _PACK_SEMAPHORE = asyncio.Semaphore(_PACK_CONCURRENCY)
+    return _PACK_SEMAPHORE
+
+
+# Pages this large that stay in-process are packed on a worker thread (same
+# semaphore), so cleaning does not block the event loop for other agents
+_THREAD_PACK_MIN_CHARS = 64 * 1024
+
+
+def _offload_target(html: str, return_mode: str, token_budget: Optional[int], diff_mode: bool,
+                    cleaning_level: Optional[int] = None) -> Optional[str]:
+    """"process", "thread" or None (pack inline on the event loop)."""
+    from .constants import PACK_OFFLOAD_MIN_CHARS
+    if diff_mode and return_mode == ReturnMode.HTML:
+        # Reads and updates this process's subtree hashes: never a worker process
+        return "thread" if len(html) >= _THREAD_PACK_MIN_CHARS else None
+    if PACK_OFFLOAD_MIN_CHARS and (len(html) >= PACK_OFFLOAD_MIN_CHARS or (token_budget or 0) > _OFFLOAD_MIN_BUDGET):
+        # Already cleaned here (e.g. a later page of an html/text_offset walk):
+        # what is left is slicing, not worth shipping the raw page to a worker
+        if cleaning_level is not None and _has_cleaned(html, cleaning_level):
+            return "thread"
+        return "process"
+    if len(html) >= _THREAD_PACK_MIN_CHARS:
+        return "thread"
+    return None
+
+
+def _pack_in_worker(*args) -> Tuple[ContextPack, Optional[tuple]]:
+    """
+    Worker-process entry: the pack, plus the (key, entry) of the cleaning it
+    used, so the parent can serve further offsets into the same page by
+    slicing instead of sending it back to the pool.
+    """
+    cp = _pack_uncached(*args)
+    with _CLEANED_LOCK:
+        # The pack just cleaned (or hit) this entry, moving it to the end
+        cleaned = next(reversed(_CLEANED_CACHE.items()), None)
+    return cp, cleaned
+
+
+async def _pack_offloaded(
+    snapshot: dict,
+    window_tag: Optional[str],
+    return_mode: str,
+    cleaning_level: int,
+    token_budget: Optional[int],
+    text_offset: Optional[int],
+    html_offset: Optional[int],
+    detail_level: Optional[str] = None,
+    in_process: bool = True,
+    diff_mode: bool = False,
+    key: Optional[tuple] = None,
+) -> ContextPack:
+    """
+    Like _pack_cached(), but a cache miss is packed in a worker process (or,
+    with in_process=False, on a worker thread) under the packing semaphore.
+    Falls back to packing inline if the pool is unavailable. Diff-mode html
+    packs are never cached and only run on threads (see _offload_target).
+    """
+    args = (dict(snapshot), window_tag, return_mode, cleaning_level, token_budget, text_offset, html_offset, detail_level)
+    if diff_mode and return_mode == ReturnMode.HTML:
+        async with _pack_semaphore():
+            packed = await asyncio.get_running_loop().run_in_executor(
+                None, functools.partial(_pack_uncached, *args, diff_mode=True),
+            )
+        return _fill_pack(_pooled_pack(window_tag), packed)
+
+    # Keyed on the snapshot as given: a Snapshot's carried digest does not survive dict()
+    if key is None:
+        key = _pack_key(snapshot, *args[1:])
+    cached = _PACK_CACHE.get(key)
+    if cached is None:
+        async with _pack_semaphore():
+            try:
+                loop = asyncio.get_running_loop()
+                if in_process:
+                    cached, cleaned = await loop.run_in_executor(
+                        _pack_executor(), functools.partial(_pack_in_worker, *args),
+                    )
+                    if cleaned is not None:
+                        _remember_cleaned(*cleaned)
+                else:
+                    cached = await loop.run_in_executor(None, functools.partial(_pack_uncached, *args))
+            except Exception:
+                cached = _pack_uncached(*args)
+        _remember_pack(key, cached)
+    else:
+        _PACK_CACHE.move_to_end(key)
+
+    # Filled after the await, so concurrent calls never share the pooled pack mid-fill
+    return _fill_pack(_pooled_pack(window_tag), cached)
+
+
+_INTERACTIVE_CACHE: "OrderedDict[bytes, str]" = OrderedDict()
+_INTERACTIVE_CACHE_MAX = 16
+
+
+def _interactive_snapshot(snapshot: dict) -> dict:
+    """
+    Copy of `snapshot` with its HTML reduced to the interactive skeleton.
+    The pruned HTML is cached by page digest, so an unchanged page is not
+    pruned again for every return mode or budget.
+    """
+    from .cleaners import interactive_prune
+    key = _snapshot_digest(snapshot)
+    html = _INTERACTIVE_CACHE.get(key)
+    if html is None:
+        try:
+            html = interactive_prune(snapshot.get("html") or "")
+        except Exception:
+            return snapshot
+        _INTERACTIVE_CACHE[key] = html
+        if len(_INTERACTIVE_CACHE) > _INTERACTIVE_CACHE_MAX:
+            _INTERACTIVE_CACHE.popitem(last=False)
+    else:
+        _INTERACTIVE_CACHE.move_to_end(key)
+    return {**snapshot, "html": html}
+
+
+@dataclasses.dataclass(slots=True)
+class ShapeOpts:
+    """
+    Snapshot shaping controls for to_context_pack(), built once per tool call.
+
+    Treat as read-only (batch shares one across steps). Not frozen: a frozen
+    dataclass sets every field through object.__setattr__, which doubles the
+    construction cost on each tool call.
+    """
+    return_mode: str = "outline"
+    cleaning_level: int = 2
+    token_budget: Optional[int] = 1000
+    text_offset: Optional[int] = None
+    html_offset: Optional[int] = None
+    diff_mode: Optional[bool] = None
+    detail_level: Optional[str] = None
+
+
+_VALID_MODES = frozenset({"html", "text", "outline", "dompaths", "mixed"})
+
+# Page meta for the current tool invocation; reset by @tool_envelope on entry.
+_PAGE_META: contextvars.ContextVar[Optional[dict]] = contextvars.ContextVar("mcp_page_meta", default=None)
+
+
+def reset_page_meta() -> None:
+    """Forget the memoized page meta (called at the start of each tool call)."""
+    _PAGE_META.set(None)
+
+
+async def _current_page_meta() -> dict:
+    """Page meta, looked up at most once per tool invocation."""
+    meta = _PAGE_META.get()
+    if meta is None:
+        # Import here to avoid circular dependency at module load time
+        import mcp_browser_use.helpers as helpers
+
+        try:
+            meta = await helpers.get_current_page_meta()
+        except Exception:
+            meta = {"url": None, "title": None, "window_tag": None}
+        _PAGE_META.set(meta)
+    return meta
+
+
+# Set once the cleaning stack has been imported and exercised in this process
+_PREWARMED = False
+
+
+def _warm_packing() -> None:
+    global _PREWARMED
+    try:
+        import bs4  # noqa: F401
+        try:
+            from selectolax.lexbor import LexborHTMLParser  # noqa: F401
+        except ImportError:
+            pass
+        basic_prune(html="<html><body><p>warm</p></body></html>", level=2)
+        extract_outline(html="<h1>warm</h1>")
+    except Exception:
+        pass
+    _PREWARMED = True
+
+
+def prewarm_packing() -> Optional[asyncio.Future]:
+    """
+    Import and exercise the cleaning stack on a worker thread, so a tool can
+    overlap that one-time cost with its browser action instead of paying it
+    in its first to_context_pack(). Returns the future to await before
+    packing, or None once the process is warm.
+    """
+    if _PREWARMED:
+        return None
+    return asyncio.ensure_future(asyncio.to_thread(_warm_packing))
+
+
+# Below this size parsing inline is cheaper than a thread hop
+_PARALLEL_PARSE_MIN_CHARS = 16 * 1024
+
+
+def _parse_result(result_json):
+    """Parse a tool result; returns the exception instead of raising (for gather)."""
+    if isinstance(result_json, dict):
+        # Already parsed: copy, since the snapshot is popped off the result
+        return dict(result_json)
+    try:
+        return loads(result_json)
+    except Exception as e:
+        return e
+
+
+def _encode_fallback(o):
+    # Only reached for odd objects in a tool's non-snapshot fields
+    return getattr(o, "__dict__", repr(o))
+
+
+# Packs whose html/text is at least this long are encoded in slices of this
+# many chars, handing the event loop back between slices
+_STREAM_MIN_CHARS = 64 * 1024
+_STREAM_CHUNK_CHARS = 64 * 1024
+
+
+async def _stream_context_pack(cp: ContextPack):
+    """
+    Yield the JSON encoding of `cp` as str fragments. The large snapshot field
+    (html or text) is escaped one slice at a time, with an await between
+    slices, instead of inside one encoder call over the whole pack; the
+    other fields are encoded together around a marker in its place.
+    """
+    name = "html" if len(cp.html or "") >= len(cp.text or "") else "text"
+    value = getattr(cp, name) or ""
+    marker = f"\x00{name}\x00"
+    setattr(cp, name, marker)
+    try:
+        head, tail = dumps_record(cp, default=_encode_fallback).split(dumps(marker), 1)
+    finally:
+        setattr(cp, name, value)
+    yield head
+    yield '"'
+    for start in range(0, len(value), _STREAM_CHUNK_CHARS):
+        yield dumps(value[start:start + _STREAM_CHUNK_CHARS])[1:-1]
+        await asyncio.sleep(0)
+    yield '"'
+    yield tail
+
+
+def metadata_pack(result_json) -> str:
+    """
+    Minimal ContextPack-shaped envelope for results that carry no page content
+    (diagnostics, session management): the result goes under `mixed`, with no
+    page meta lookup and no packing.
+    """
+    obj = loads(result_json)
+    payload = {"ok": obj.get("ok") is not False, "url": None, "title": None, "mixed": obj}
+    if obj.get("ok") is False:
+        payload["errors"] = [{"type": obj.get("error") or "error", "summary": obj.get("summary"), "details": obj}]
+    return dumps(payload)
+
+
+async def to_context_pack(result_json: str, return_mode: str = "outline", cleaning_level: int = 2, token_budget=1000, text_offset: Optional[int] = None, html_offset: Optional[int] = None, diff_mode: Optional[bool] = None, detail_level: Optional[str] = None, opts: Optional[ShapeOpts] = None) -> str:
     """
     Convert a helper's raw JSON result into a JSON-serialized ContextPack envelope.
 
@@ -180,12 +968,20 @@ async def to_context_pack(result_json: str, return_mode: str, cleaning_level: in
     ok=false) are surfaced in `errors`.
     
     Args:
-        result_json: JSON string returned by a helper call (must parse to a dict).
+        result_json: JSON str or bytes returned by a helper call (must parse to a dict),
+            or an already-parsed dict.
         return_mode: Desired snapshot representation {"outline","text","html","dompaths","mixed"}.
         cleaning_level: Structural/content cleaning intensity (0–3).
         token_budget: Approximate token cap for the returned snapshot. Should usually be 5_000 or lower.
+            None means uncapped; 0 or less returns no page content at all (as detail_level="minimal").
         text_offset: Optional character offset for text mode pagination.
         html_offset: Optional character offset for html mode pagination.
+        diff_mode: Elide unchanged top-level subtrees in html mode (defaults to MCP_SNAPSHOT_DIFF).
+        detail_level: Cleaning profile applied before packing: "full" (as captured),
+            "interactive" (actionable elements only, long text summarized) or
+            "minimal" (url and title only). Defaults to MCP_DEFAULT_DETAIL_LEVEL.
+        opts: ShapeOpts carrying all of the above; when given it takes precedence
+            over the individual keyword arguments.
 
     Returns:
         str: JSON-serialized ContextPack.
@@ -194,55 +990,129 @@ async def to_context_pack(result_json: str, return_mode: str, cleaning_level: in
         TypeError: If `result_json` is not valid JSON or is not a dict after parsing.
         ValueError: If `return_mode` is invalid (normalized internally to a default).
     """
-    # Import here to avoid circular dependency at module load time
-    import mcp_browser_use.helpers as helpers
+    if opts is not None:
+        return_mode, cleaning_level, token_budget = opts.return_mode, opts.cleaning_level, opts.token_budget
+        text_offset, html_offset = opts.text_offset, opts.html_offset
+        diff_mode, detail_level = opts.diff_mode, opts.detail_level
 
-    try:
-        obj = _json.loads(result_json)
-    except Exception:
+    # Large results are parsed on a worker thread while the page meta is looked up
+    if isinstance(result_json, (str, bytes)) and len(result_json) > _PARALLEL_PARSE_MIN_CHARS:
+        parsed, meta = await asyncio.gather(
+            asyncio.to_thread(_parse_result, result_json),
+            _current_page_meta(),
+        )
+    else:
+        parsed, meta = _parse_result(result_json), None
+    if isinstance(parsed, Exception):
         raise TypeError(f"helper returned non-JSON: {type(result_json)}")
+    obj = parsed
 
-    # Normalize/validate return_mode
-    mode = (return_mode or "outline").lower()
-    if mode not in {"html", "text", "outline", "dompaths", "mixed"}:
-        mode = "outline"
+    # Normalize/validate return_mode (lowercase inputs, the usual case, skip .lower())
+    mode = return_mode
+    if mode not in _VALID_MODES:
+        mode = mode.lower() if mode else "outline"
+        if mode not in _VALID_MODES:
+            mode = "outline"
 
-    try:
-        meta = await helpers.get_current_page_meta()
-    except Exception:
-        meta = {"url": None, "title": None, "window_tag": None}
+    if meta is None:
+        meta = await _current_page_meta()
 
-    snap = obj.get("snapshot")
+    # `obj` was just parsed and is ours: popping the snapshot leaves exactly the
+    # leftovers for `errors`/`mixed` without copying the other fields
+    snap = obj.pop("snapshot", None)
     if not isinstance(snap, dict):
         snap = {"url": meta.get("url"), "title": meta.get("title"), "html": ""}
 
-    cp = pack_from_snapshot_dict(
-        snapshot=snap,
-        window_tag=meta.get("window_tag"),
-        return_mode=mode,
-        cleaning_level=cleaning_level,
-        token_budget=token_budget,
-        text_offset=text_offset,
-        html_offset=html_offset,
-    )
+    if diff_mode is None:
+        from .constants import SNAPSHOT_DIFF
+        diff_mode = SNAPSHOT_DIFF
+
+    if not detail_level:
+        from .constants import DEFAULT_DETAIL_LEVEL
+        detail_level = DEFAULT_DETAIL_LEVEL
+    level = detail_level.lower()
+    if token_budget is not None and token_budget <= 0:
+        # No room for page content: skip cleaning and packing altogether
+        level = "minimal"
+    html = snap.get("html")
+    pack_key = json_key = None
+    # Raw html: the pack is one slice of the captured page, with nothing to
+    # clean, hash, cache or offload
+    raw = (bool(html) and mode == ReturnMode.HTML and cleaning_level <= CleaningLevel.RAW
+           and not diff_mode and level == "full")
+    target = _offload_target(html, mode, token_budget, diff_mode, cleaning_level) if html and level != "minimal" and not raw else None
+    if target is not None or (html and level != "minimal" and not raw):
+        if not (diff_mode and mode == ReturnMode.HTML):
+            # Same page, controls and leftovers as a recent call: same pack
+            pack_key = _pack_key(snap, meta.get("window_tag"), mode, cleaning_level, token_budget,
+                                 text_offset, html_offset, level)
+            json_key = (pack_key, dumps(obj, default=_encode_fallback))
+            out = _PACK_JSON_CACHE.get(json_key)
+            if out is not None:
+                _PACK_JSON_CACHE.move_to_end(json_key)
+                return out
+    if raw:
+        cp = pack_snapshot(
+            window_tag=meta.get("window_tag"), url=snap.get("url"), title=snap.get("title"),
+            raw_html=html, return_mode=mode, cleaning_level=cleaning_level,
+            token_budget=token_budget, html_offset=html_offset,
+            into=_pooled_pack(meta.get("window_tag")),
+        )
+    elif target is not None:
+        cp = await _pack_offloaded(
+            snapshot=snap,
+            window_tag=meta.get("window_tag"),
+            return_mode=mode,
+            cleaning_level=cleaning_level,
+            token_budget=token_budget,
+            text_offset=text_offset,
+            html_offset=html_offset,
+            detail_level=level,
+            in_process=target == "process",
+            diff_mode=diff_mode,
+            key=pack_key,
+        )
+    elif html and level != "minimal":
+        cp = _pack_cached(
+            snapshot=snap,
+            window_tag=meta.get("window_tag"),
+            return_mode=mode,
+            cleaning_level=cleaning_level,
+            token_budget=token_budget,
+            text_offset=text_offset,
+            html_offset=html_offset,
+            diff_mode=diff_mode,
+            detail_level=level,
+            key=pack_key,
+        )
+    elif obj.get("ok") is not False:
+        # Nothing to clean (diagnostics, session tools, deferred batch steps,
+        # detail_level="minimal"): only url/title/window_tag and the leftovers
+        # vary, everything else comes pre-encoded
+        parts = _empty_pack_template(mode, cleaning_level, token_budget)
+        return "".join((
+            parts[0], dumps(meta.get("window_tag")),
+            parts[1], dumps(snap.get("url")),
+            parts[2], dumps(snap.get("title")),
+            parts[3], dumps(obj, default=_encode_fallback),
+            parts[4],
+        ))
+    else:
+        cp = _empty_pack(
+            window_tag=meta.get("window_tag"),
+            url=snap.get("url"),
+            title=snap.get("title"),
+            return_mode=mode,
+            cleaning_level=cleaning_level,
+            token_budget=token_budget,
+        )
 
     # Add warning if token budget is too high
     if token_budget and token_budget > 10_000:
-        cp.errors.append({
-            "type": "warning",
-            "summary": "High token budget detected",
-            "details": {
-                "requested_token_budget": token_budget,
-                "message": (
-                    f"You requested a token budget of {token_budget} tokens, which may clog your context. "
-                    "Consider using the extract_elements tool with structured extraction (MODE 2) "
-                    "to extract only the specific data you need. This can reduce token usage by 90%+ "
-                    "while getting more precise results. "
-                    "Example: extract_elements(container_selector='div.product', fields=[...], max_items=50)"
-                ),
-                "recommendation": "Use extract_elements tool for targeted data extraction instead of large snapshots"
-            }
-        })
+        cp.errors.append(_budget_warning(token_budget))
+
+    # Everything but the snapshot (popped above), shared by `errors` and `mixed`
+    leftovers = obj
 
     # Surface errors in a first-class place
     if obj.get("ok") is False:
@@ -250,12 +1120,20 @@ async def to_context_pack(result_json: str, return_mode: str, cleaning_level: in
             cp.errors.append({
                 "type": obj.get("error") or "error",
                 "summary": obj.get("summary"),
-                "details": {k: v for k, v in obj.items() if k != "snapshot"},
+                "details": leftovers,
             })
         except Exception:
             pass
 
-    leftovers = {k: v for k, v in obj.items() if k != "snapshot"}
     cp.mixed = leftovers
+    cp.ok = obj.get("ok") is not False
 
-    return _json.dumps(cp, default=lambda o: getattr(o, "__dict__", repr(o)), ensure_ascii=False)
\ No newline at end of file
+    if max(len(cp.html or ""), len(cp.text or "")) >= _STREAM_MIN_CHARS:
+        # The MCP transport takes one result string, so the fragments are
+        # joined here; encoding them still leaves the event loop responsive
+        out = "".join([fragment async for fragment in _stream_context_pack(cp)])
+    else:
+        out = dumps_record(cp, default=_encode_fallback)
+    if json_key is not None:
+        _remember_pack_json(json_key, out)
+    return out
\ No newline at end of file
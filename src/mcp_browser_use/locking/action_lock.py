@@ -6,15 +6,104 @@ import time
 import asyncio
 from typing import Dict, Any, Optional
 
+class _LockSide:
+    """One side (reader or writer) of a BrowserRWLock, usable with `async with`."""
+
+    __slots__ = ("_acquire", "_release")
+
+    def __init__(self, acquire, release):
+        self._acquire = acquire
+        self._release = release
+
+    async def __aenter__(self):
+        await self._acquire()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._release()
+
+
+class BrowserRWLock:
+    """
+    Reader/writer lock for in-process tool serialization.
+
+    Any number of read-only tools may hold `reader` together; `writer` is
+    exclusive. Waiting writers block new readers, so a stream of inspections
+    cannot starve actions. `async with lock` takes the writer side, so callers
+    that treat it as a plain asyncio.Lock stay exclusive.
+    """
+
+    def __init__(self):
+        self._cond = asyncio.Condition()
+        self._readers = 0
+        self._readers_failed = False
+        self._writer = False
+        self._writers_waiting = 0
+        self.reader = _LockSide(self._acquire_read, self._release_read)
+        self.writer = _LockSide(self._acquire_write, self._release_write)
+
+    def locked(self) -> bool:
+        return self._writer or self._readers > 0
+
+    def reader_done(self, ok: bool) -> Optional[bool]:
+        """
+        Record the outcome of a reader about to release its side.
+
+        Returns None while other readers still hold the lock, and for the last
+        one out whether every reader of the group succeeded: only that reader
+        may release or renew the cross-process softlock they share.
+        """
+        if not ok:
+            self._readers_failed = True
+        if self._readers > 1:
+            return None
+        ok, self._readers_failed = not self._readers_failed, False
+        return ok
+
+    async def _acquire_read(self):
+        async with self._cond:
+            await self._cond.wait_for(lambda: not self._writer and not self._writers_waiting)
+            self._readers += 1
+
+    async def _release_read(self):
+        async with self._cond:
+            self._readers -= 1
+            if not self._readers:
+                self._cond.notify_all()
+
+    async def _acquire_write(self):
+        async with self._cond:
+            self._writers_waiting += 1
+            try:
+                await self._cond.wait_for(lambda: not self._writer and not self._readers)
+            finally:
+                self._writers_waiting -= 1
+                # Wake readers held back by this writer if it gave up waiting
+                self._cond.notify_all()
+            self._writer = True
+
+    async def _release_write(self):
+        async with self._cond:
+            self._writer = False
+            self._cond.notify_all()
+
+    async def __aenter__(self):
+        await self._acquire_write()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._release_write()
+
+
 # Global intra-process lock
-MCP_INTRA_PROCESS_LOCK: Optional[asyncio.Lock] = None
+MCP_INTRA_PROCESS_LOCK: Optional[BrowserRWLock] = None
 
 
-def get_intra_process_lock() -> asyncio.Lock:
-    """Get or create the intra-process asyncio lock."""
+def get_intra_process_lock() -> BrowserRWLock:
+    """Get or create the intra-process reader/writer lock."""
     global MCP_INTRA_PROCESS_LOCK
     if MCP_INTRA_PROCESS_LOCK is None:
-        MCP_INTRA_PROCESS_LOCK = asyncio.Lock()
+        MCP_INTRA_PROCESS_LOCK = BrowserRWLock()
     return MCP_INTRA_PROCESS_LOCK
 
 
@@ -37,10 +126,62 @@ def _write_softlock(path: str, state: Dict[str, Any]):
     os.replace(tmp, path)
 
 
+def _create_softlock(path: str, state: Dict[str, Any]) -> bool:
+    """
+    Atomically create the softlock file with `state`.
+
+    This is the compare-and-swap for the free lock: it only succeeds if no
+    softlock file exists. The state is written to a private temp file first
+    and hard-linked into place (os.link fails if the target exists), so the
+    file is never visible half-written. Returns False if someone else created
+    it first.
+    """
+    import tempfile
+
+    fd, tmp = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp",
+                               dir=os.path.dirname(path) or None)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        try:
+            os.link(tmp, path)
+        except FileExistsError:
+            return False
+        except OSError:
+            # No hard links on this filesystem: exclusive create, then write
+            try:
+                fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+            except FileExistsError:
+                return False
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+        return True
+    finally:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+
+def _unreadable_softlock_held(path: str, stale_secs: float) -> bool:
+    """
+    True if `path` exists but holds no readable state and is younger than
+    `stale_secs`: it may be a softlock being created, so it counts as held.
+    """
+    try:
+        return time.time() - os.path.getmtime(path) < stale_secs
+    except OSError:
+        return False
+
+
 def _acquire_softlock(owner: str, ttl: int, wait: bool = True, wait_timeout: float = None) -> Dict[str, Any]:
     """
     Acquire a softlock for the given owner.
 
+    A free lock (no softlock file) is taken with a single exclusive create,
+    without touching the mutex. The mutex is only needed to re-enter, renew
+    or steal an existing (possibly expired) lock.
+
     Args:
         owner: Identifier of the lock owner
         ttl: Time to live in seconds
@@ -56,27 +197,36 @@ def _acquire_softlock(owner: str, ttl: int, wait: bool = True, wait_timeout: flo
     if wait_timeout is None:
         wait_timeout = ACTION_LOCK_WAIT_SECS
 
-    softlock_json, softlock_mutex, _ = _lock_paths()
+    softlock_json, softlock_mutex, _ = _lock_paths(owner)
     deadline = _now() + max(0.0, wait_timeout)
 
     while True:
+        new_exp = _now() + ttl
+        if _create_softlock(softlock_json, {"owner": owner, "expires_at": new_exp}):
+            return {"acquired": True, "owner": owner, "expires_at": new_exp}
+
         try:
             with _file_mutex(softlock_mutex, stale_secs=FILE_MUTEX_STALE_SECS, wait_timeout=min(5.0, max(0.1, deadline - _now()))):
                 state = _read_softlock(softlock_json)
                 cur_owner = state.get("owner")
                 expires_at = float(state.get("expires_at", 0.0))
 
-                if not cur_owner or expires_at <= _now() or cur_owner == owner:
+                if not cur_owner and _unreadable_softlock_held(softlock_json, FILE_MUTEX_STALE_SECS):
+                    result = {"acquired": False, "owner": None, "expires_at": None, "message": "busy"}
+                elif not cur_owner or expires_at <= _now() or cur_owner == owner:
                     new_exp = _now() + ttl
-                    _write_softlock(softlock_json, {"owner": owner, "expires_at": new_exp})
-                    return {"acquired": True, "owner": owner, "expires_at": new_exp}
-
-                result = {
-                    "acquired": False,
-                    "owner": cur_owner,
-                    "expires_at": float(expires_at),
-                    "message": "busy",
-                }
+                    # Only overwrite a file that exists; a released lock goes back through the CAS
+                    if os.path.exists(softlock_json):
+                        _write_softlock(softlock_json, {"owner": owner, "expires_at": new_exp})
+                        return {"acquired": True, "owner": owner, "expires_at": new_exp}
+                    continue
+                else:
+                    result = {
+                        "acquired": False,
+                        "owner": cur_owner,
+                        "expires_at": float(expires_at),
+                        "message": "busy",
+                    }
         except TimeoutError:
             if not wait or _now() >= deadline:
                 # Best-effort read without mutex for context
@@ -106,11 +256,15 @@ def _release_action_lock(owner: str) -> bool:
     from .file_mutex import _lock_paths, _file_mutex
     from ..constants import FILE_MUTEX_STALE_SECS
 
-    softlock_json, softlock_mutex, _ = _lock_paths()
+    softlock_json, softlock_mutex, _ = _lock_paths(owner)
     with _file_mutex(softlock_mutex, stale_secs=FILE_MUTEX_STALE_SECS, wait_timeout=5.0):
         state = _read_softlock(softlock_json)
         if state.get("owner") == owner:
-            _write_softlock(softlock_json, {})
+            # Remove the file so the next acquirer can take it with a single exclusive create
+            try:
+                os.unlink(softlock_json)
+            except FileNotFoundError:
+                pass
             return True
         return False
 
@@ -131,7 +285,7 @@ def _renew_action_lock(owner: str, ttl: int) -> bool:
     from .window_registry import _update_window_heartbeat
     from ..constants import FILE_MUTEX_STALE_SECS
 
-    softlock_json, softlock_mutex, _ = _lock_paths()
+    softlock_json, softlock_mutex, _ = _lock_paths(owner)
     try:
         with _file_mutex(softlock_mutex, stale_secs=FILE_MUTEX_STALE_SECS, wait_timeout=1.0):
             state = _read_softlock(softlock_json)
@@ -140,7 +294,13 @@ def _renew_action_lock(owner: str, ttl: int) -> bool:
 
             if cur_owner == owner or expires_at <= _now():
                 new_exp = _now() + int(ttl)
-                _write_softlock(softlock_json, {"owner": owner, "expires_at": new_exp})
+                new_state = {"owner": owner, "expires_at": new_exp}
+                if not os.path.exists(softlock_json):
+                    # Released (no file): recreate via CAS so we never clobber a concurrent acquirer
+                    if not _create_softlock(softlock_json, new_state):
+                        return False
+                else:
+                    _write_softlock(softlock_json, new_state)
 
                 # Piggyback: update window heartbeat while we're renewing the lock
                 try:
@@ -180,9 +340,11 @@ def _acquire_action_lock_or_error(owner: str) -> Optional[str]:
 
 
 __all__ = [
+    'BrowserRWLock',
     'get_intra_process_lock',
     '_read_softlock',
     '_write_softlock',
+    '_create_softlock',
     '_acquire_softlock',
     '_release_action_lock',
     '_renew_action_lock',
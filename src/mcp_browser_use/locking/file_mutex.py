@@ -1,6 +1,7 @@
 """File-based mutex and startup lock implementation."""
 
 import os
+import re
 import time
 import shutil
 import tempfile
@@ -14,22 +15,30 @@ def _now() -> float:
     return time.time()
 
 
-def _lock_paths():
+def _lock_paths(owner: str = None):
     """
     Get paths for lock files based on profile key.
 
+    With MCP_ACTION_LOCK_SCOPE=window and an `owner` (the agent's process tag,
+    i.e. its window), the softlock files are per owner; the startup mutex is
+    always per profile.
+
     Returns:
         Tuple of (softlock_json, softlock_mutex, startup_mutex) paths
     """
     # Import here to avoid circular dependency
     from ..config.environment import profile_key, get_env_config
     from ..config.paths import get_lock_dir
+    from ..constants import ACTION_LOCK_SCOPE
 
     key = profile_key(get_env_config())  # stable across processes; independent of port
     base = Path(get_lock_dir())
     base.mkdir(parents=True, exist_ok=True)
-    softlock_json = base / f"{key}.softlock.json"
-    softlock_mutex = base / f"{key}.softlock.mutex"
+    lock_key = key
+    if owner and ACTION_LOCK_SCOPE == "window":
+        lock_key = f"{key}.{re.sub(r'[^A-Za-z0-9_-]', '_', owner)}"
+    softlock_json = base / f"{lock_key}.softlock.json"
+    softlock_mutex = base / f"{lock_key}.softlock.mutex"
     startup_mutex = base / f"{key}.startup.mutex"
     return str(softlock_json), str(softlock_mutex), str(startup_mutex)
 
@@ -18,6 +18,8 @@ from .browser_management import (
 
 from .navigation import (
     navigate_to_url,
+    navigate_and_wait_idle,
+    navigate_and_wait,
     scroll,
 )
 
@@ -26,10 +28,13 @@ from .interaction import (
     click_element,
     send_keys,
     wait_for_element,
+    click_and_wait,
+    fill_text_and_submit,
 )
 
 from .debugging import (
     get_debug_diagnostics_info,
+    get_diagnostics,
     debug_element,
 )
 
@@ -37,6 +42,10 @@ from .screenshots import (
     take_screenshot,
 )
 
+from .batch import (
+    run_batch,
+)
+
 __all__ = [
     # Browser management
     'start_browser',
@@ -45,15 +54,22 @@ __all__ = [
     'force_close_all_chrome',
     # Navigation
     'navigate_to_url',
+    'navigate_and_wait_idle',
+    'navigate_and_wait',
     'scroll',
     # Interaction
     'fill_text',
     'click_element',
     'send_keys',
     'wait_for_element',
+    'click_and_wait',
+    'fill_text_and_submit',
     # Debugging
     'get_debug_diagnostics_info',
+    'get_diagnostics',
     'debug_element',
     # Screenshots
     'take_screenshot',
+    # Batch
+    'run_batch',
 ]
@@ -0,0 +1,113 @@
+"""Run several tool steps under one browser lock acquisition."""
+
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+from ..context import get_context
+from ..utils.jsonio import dumps, loads
+from . import navigation, interaction
+
+
+_SELECTOR_DEFAULTS = {
+    "selector_type": "css",
+    "timeout": 10.0,
+    "iframe_selector": None,
+    "iframe_selector_type": "css",
+    "shadow_root_selector": None,
+    "shadow_root_selector_type": "css",
+}
+
+# step name -> (tools-layer coroutine function, defaults for its required args)
+_BATCH_STEPS: Dict[str, Tuple[Callable[..., Awaitable[Union[dict, str, bytes]]], Dict[str, Any]]] = {
+    "navigate_to_url": (navigation.navigate_to_url, {}),
+    "navigate_and_wait_idle": (navigation.navigate_and_wait_idle, {}),
+    "navigate_and_wait": (navigation.navigate_and_wait, {}),
+    "scroll": (navigation.scroll, {"x": 0, "y": 0}),
+    "fill_text": (interaction.fill_text, {**_SELECTOR_DEFAULTS, "clear_first": True}),
+    "click_element": (interaction.click_element, {**_SELECTOR_DEFAULTS, "force_js": False}),
+    "send_keys": (interaction.send_keys, {}),
+    "wait_for_element": (interaction.wait_for_element, {}),
+    "click_and_wait": (interaction.click_and_wait, {}),
+    "fill_text_and_submit": (interaction.fill_text_and_submit, {}),
+}
+
+_TOOL_PREFIX = "mcp_browser_use__"
+
+
+def _step_error(index: int, tool: Any, error: str) -> str:
+    return dumps({"ok": False, "error": error, "step": index, "tool": tool})
+
+
+async def run_batch(
+    steps: List[dict],
+    stop_on_error: bool = True,
+    render: Optional[Callable[[Union[dict, str, bytes]], Awaitable[str]]] = None,
+) -> str:
+    """
+    Run `steps` ({"tool", "args", "expectation"}) back to back.
+
+    Only steps with expectation=True, and the last step that runs, capture a
+    page snapshot; the others return a placeholder and are reported as short
+    acks. `render` (e.g. a bound to_context_pack) is applied to the results of
+    intermediate expectation steps. The caller holds the browser lock for the
+    whole batch.
+
+    Returns:
+        JSON string: the last step's result with a "steps" list of per-step
+        acks (and "stopped_at" if stop_on_error ended the batch early).
+    """
+    ctx = get_context()
+
+    if not isinstance(steps, list) or not steps:
+        return dumps({"ok": False, "error": "steps must be a non-empty list"})
+
+    acks: List[dict] = []
+    final: dict = {}
+    stopped_at: Optional[int] = None
+
+    for index, step in enumerate(steps):
+        is_last = index == len(steps) - 1
+        tool = step.get("tool") if isinstance(step, dict) else None
+        name = tool[len(_TOOL_PREFIX):] if isinstance(tool, str) and tool.startswith(_TOOL_PREFIX) else tool
+        spec = _BATCH_STEPS.get(name)
+
+        if spec is None:
+            result = _step_error(index, tool, f"unsupported batch tool: {tool!r}")
+            want_snapshot = False
+        else:
+            func, defaults = spec
+            args = step.get("args") or {}
+            want_snapshot = is_last or bool(step.get("expectation", False))
+            ctx.defer_snapshots = not want_snapshot
+            try:
+                result = await func(**{**defaults, **args})
+            except TypeError as e:
+                result = _step_error(index, tool, f"invalid args: {e}")
+            finally:
+                ctx.defer_snapshots = False
+
+        try:
+            # Step results are dicts (handed over as is) or JSON str/bytes
+            data = result if isinstance(result, dict) else loads(result)
+        except Exception:
+            data = {"ok": False, "error": "invalid step result"}
+        ok = bool(data.get("ok", True))
+
+        ack = {"step": index, "tool": name, "ok": ok}
+        if not ok:
+            ack["error"] = data.get("error")
+        if want_snapshot and not is_last and render is not None:
+            ack["pack"] = loads(await render(result))
+        acks.append(ack)
+        final = data
+
+        if not ok and stop_on_error and not is_last:
+            stopped_at = index
+            break
+
+    final["steps"] = acks
+    if stopped_at is not None:
+        final["stopped_at"] = stopped_at
+    return dumps(final)
+
+
+__all__ = ['run_batch']
@@ -1,12 +1,13 @@
 """Browser lifecycle management tool implementations."""
 
-import json
 import psutil
 from pathlib import Path
 from ..context import get_context, reset_context
 from ..config import get_env_config, profile_key
 from ..constants import ACTION_LOCK_TTL_SECS
-from ..utils.diagnostics import collect_diagnostics
+from ..utils.diagnostics import collect_diagnostics, error_response
+from ..utils.jsonio import respond
+from ..utils.executor import selenium_thread
 
 # Import specific functions we need
 from ..browser.driver import (
@@ -15,12 +16,13 @@ from ..browser.driver import (
     _close_extra_blank_windows_safe,
     ensure_process_tag,
 )
-from ..actions.navigation import _wait_document_ready
 from ..actions.screenshots import _make_page_snapshot
 from ..locking.action_lock import _release_action_lock
+from ..decorators.envelope import fast_path
 
 
-async def start_browser():
+@selenium_thread
+def start_browser():
     """
     Start browser session or open new window in existing session.
 
@@ -45,7 +47,7 @@ async def start_browser():
             if isinstance(diag, str):
                 diag = {"summary": diag}
 
-            return json.dumps({
+            return respond({
                 "ok": False,
                 "error": "driver_not_initialized",
                 "driver_initialized": False,
@@ -64,8 +66,7 @@ async def start_browser():
         except Exception:
             pass
 
-        # Wait for page ready and get snapshot
-        _wait_document_ready(timeout=5.0)
+        # Snapshot waits for page readiness itself (same script, one round-trip)
         try:
             snapshot = _make_page_snapshot()
         except Exception:
@@ -93,25 +94,14 @@ async def start_browser():
             "message": msg,
         }
 
-        return json.dumps(payload)
+        return respond(payload)
 
     except Exception as e:
-        diag = collect_diagnostics(ctx.driver, e, ctx.config)
-        snapshot = _make_page_snapshot() or {
-            "url": "about:blank",
-            "title": "",
-            "html": "",
-            "truncated": False,
-        }
-        return json.dumps({
-            "ok": False,
-            "error": str(e),
-            "diagnostics": diag,
-            "snapshot": snapshot
-        })
+        return error_response(e)
 
 
-async def unlock_browser():
+@fast_path
+def unlock_browser():
     """Release the action lock for this process."""
     ctx = get_context()
 
@@ -121,12 +111,13 @@ async def unlock_browser():
     owner = ctx.process_tag
     released = _release_action_lock(owner)
 
-    return json.dumps({
+    return respond({
         "ok": True,
         "released": bool(released)
     })
 
-async def close_browser() -> str:
+@selenium_thread
+def close_browser() -> str:
     """Close the browser window for this session."""
     ctx = get_context()
 
@@ -134,7 +125,7 @@ async def close_browser() -> str:
         closed = close_singleton_window()
         msg = "Browser window closed successfully" if closed else "No window to close"
 
-        return json.dumps({
+        return respond({
             "ok": True,
             "closed": bool(closed),
             "message": msg
@@ -142,13 +133,14 @@ async def close_browser() -> str:
 
     except Exception as e:
         diag = collect_diagnostics(ctx.driver, e, ctx.config)
-        return json.dumps({
+        return respond({
             "ok": False,
             "error": str(e),
             "diagnostics": diag
         })
 
-async def force_close_all_chrome() -> str:
+@selenium_thread
+def force_close_all_chrome() -> str:
     """
     Force close all Chrome processes, quit driver, and clean up all state.
     Use this to recover from stuck Chrome instances.
@@ -215,6 +207,7 @@ async def force_close_all_chrome() -> str:
         ctx.debugger_host = None
         ctx.debugger_port = None
         ctx.reset_window_state()
+        ctx.window_pool.clear()
 
         # 6. Release locks
         try:
@@ -241,7 +234,7 @@ async def force_close_all_chrome() -> str:
         if errors:
             msg += f" Errors: {'; '.join(errors)}"
 
-        return json.dumps({
+        return respond({
             "ok": True,
             "killed_processes": killed_processes,
             "errors": errors,
@@ -249,7 +242,7 @@ async def force_close_all_chrome() -> str:
         })
 
     except Exception as e:
-        return json.dumps({
+        return respond({
             "ok": False,
             "error": str(e),
             "killed_processes": killed_processes,
@@ -1,18 +1,35 @@
 """Debugging and diagnostic tool implementations."""
 
-import json
+import itertools
+import os
 from pathlib import Path
 from typing import Dict, Any
 from selenium.common.exceptions import TimeoutException
 from ..context import get_context
-from ..utils.diagnostics import collect_diagnostics
+from ..utils.diagnostics import collect_diagnostics, error_response, get_queued_diagnostics
+from ..utils.jsonio import respond
+from ..utils.executor import selenium_thread
 from ..actions.elements import find_element, _wait_clickable_element
 from ..actions.screenshots import _make_page_snapshot
+from ..browser.process import chromedriver_log_path
 from ..utils.retry import retry_op
+from ..decorators.envelope import fast_path
 
 
-async def get_debug_diagnostics_info() -> str:
-    """Get debug diagnostics using context."""
+_PROBE_ELEMENT_JS = """
+var e = arguments[0], r = e.getBoundingClientRect(), s = getComputedStyle(e);
+return {
+  displayed: !!(e.offsetParent || s.position === 'fixed') && s.visibility !== 'hidden' && s.display !== 'none',
+  enabled: !e.disabled,
+  rect: {x: r.x, y: r.y, width: r.width, height: r.height},
+  outerHTML: arguments[1] ? e.outerHTML : null
+};
+"""
+
+
+@fast_path
+def get_debug_diagnostics_info() -> str:
+    """Get debug diagnostics using context (metadata only, no page snapshot)."""
     ctx = get_context()
 
     try:
@@ -54,16 +71,85 @@ async def get_debug_diagnostics_info() -> str:
             }
         }
 
-        snapshot = (_make_page_snapshot()
-                    if ctx.is_driver_initialized()
-                    else {"url": None, "title": None, "html": "", "truncated": False})
-        return json.dumps({"ok": True, "diagnostics": diagnostics, "snapshot": snapshot})
+        return respond({"ok": True, "diagnostics": diagnostics})
 
     except Exception as e:
         diag = collect_diagnostics(driver=ctx.driver, exc=e, config=ctx.config)
-        return json.dumps({"ok": False, "error": str(e), "diagnostics": {"summary": diag}})
+        return respond({"ok": False, "error": str(e), "diagnostics": {"summary": diag}})
+
+
+def _tail_lines(path: str, lines: int) -> list:
+    """
+    Return the last `lines` lines of `path`, scanning backwards for newlines
+    through an mmap so only the tail is ever materialized.
+    """
+    import mmap
+
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = len(mm)
+            # A trailing newline terminates the last line; it does not start a new one
+            if mm[end - 1:end] == b"\n":
+                end -= 1
+            start = end
+            for _ in range(lines):
+                nl = mm.rfind(b"\n", 0, start)
+                if nl < 0:
+                    start = 0
+                    break
+                start = nl
+            else:
+                start += 1
+            chunk = mm[start:end]
+    return chunk.decode("utf-8", errors="replace").splitlines()
+
+
+def read_chromedriver_log(lines: int = 50, from_top: bool = False) -> str:
+    """
+    Read the Chromedriver log of this process: the last `lines` lines by
+    default, or the first `lines` lines with `from_top`.
+
+    Does not touch the browser; blocking file I/O, run it off the event loop.
+    """
+    ctx = get_context()
+    log_path = chromedriver_log_path(ctx.config)
+    lines = max(int(lines), 0)
+
+    try:
+        if not os.path.exists(log_path):
+            return respond({"ok": False, "error": "log_not_found", "log_path": log_path})
+        if from_top:
+            with open(log_path, "r", encoding="utf-8", errors="replace") as f:
+                content = [line.rstrip("\r\n") for line in itertools.islice(f, lines)]
+        else:
+            content = _tail_lines(log_path, lines) if lines else []
+    except Exception as e:
+        return respond({"ok": False, "error": str(e), "log_path": log_path})
+
+    return respond({
+        "ok": True,
+        "log_path": log_path,
+        "from_top": from_top,
+        "lines_read": len(content),
+        "has_errors": any("ERROR" in line for line in content),
+        "content": "\n".join(content),
+    })
 
-async def debug_element(
+
+def get_diagnostics(diagnostics_id: str) -> str:
+    """
+    Fetch the post-mortem queued under `diagnostics_id` by a failed tool call.
+
+    Blocks briefly while the post-mortem is still being collected; run it off
+    the event loop.
+    """
+    return respond(get_queued_diagnostics(diagnostics_id))
+
+
+@selenium_thread
+def debug_element(
     selector,
     selector_type,
     timeout,
@@ -122,14 +208,13 @@ async def debug_element(
             ))
             info["exists"] = True
 
+            # displayed/enabled/rect/outerHTML in one round-trip; only the
+            # clickable check keeps WebDriver semantics as a separate call.
+            probe = None
             try:
-                info["displayed"] = bool(el.is_displayed())
-            except Exception:
-                info["displayed"] = None
-            try:
-                info["enabled"] = bool(el.is_enabled())
-            except Exception:
-                info["enabled"] = None
+                probe = ctx.driver.execute_script(_PROBE_ELEMENT_JS, el, bool(include_html))
+            except Exception as e:
+                info["notes"].append(f"Could not probe element: {str(e)}")
 
             try:
                 _wait_clickable_element(el=el, driver=ctx.driver, timeout=timeout)
@@ -137,21 +222,15 @@ async def debug_element(
             except Exception:
                 info["clickable"] = False
 
-            try:
-                r = el.rect
-                info["rect"] = {
-                    "x": r.get("x"),
-                    "y": r.get("y"),
-                    "width": r.get("width"),
-                    "height": r.get("height"),
-                }
-            except Exception:
-                info["rect"] = None
+            if probe:
+                info["displayed"] = probe.get("displayed")
+                info["enabled"] = probe.get("enabled")
+                info["rect"] = probe.get("rect")
 
             # Get HTML if requested
             if include_html:
-                try:
-                    html = ctx.driver.execute_script("return arguments[0].outerHTML;", el)
+                html = (probe or {}).get("outerHTML")
+                if html is not None:
                     # Clean invalid characters
                     html = html.replace('\x00', '').encode('utf-8', errors='ignore').decode('utf-8')
 
@@ -165,9 +244,6 @@ async def debug_element(
                     else:
                         info["outerHTML"] = html
                         info["truncated"] = False
-                except Exception as e:
-                    info["outerHTML"] = None
-                    info["notes"].append(f"Could not get HTML: {str(e)}")
             else:
                 info["notes"].append("HTML omitted (include_html=False)")
 
@@ -177,19 +253,18 @@ async def debug_element(
             info["notes"].append(f"Error while probing element: {repr(e)}")
 
         snapshot = _make_page_snapshot()
-        return json.dumps({"ok": True, "debug": info, "snapshot": snapshot})
+        return respond({"ok": True, "debug": info, "snapshot": snapshot})
 
     except Exception as e:
-        diag = collect_diagnostics(driver=ctx.driver, exc=e, config=ctx.config)
-        snapshot = _make_page_snapshot()
-        return json.dumps({"ok": False, "error": str(e), "diagnostics": diag, "snapshot": snapshot})
+        return error_response(e)
 
     finally:
-        try:
-            if ctx.is_driver_initialized():
-                ctx.driver.switch_to.default_content()
-        except Exception:
-            pass
+        if iframe_selector is not None:
+            try:
+                if ctx.is_driver_initialized():
+                    ctx.driver.switch_to.default_content()
+            except Exception:
+                pass
 
 
-__all__ = ['get_debug_diagnostics_info', 'debug_element']
+__all__ = ['get_debug_diagnostics_info', 'get_diagnostics', 'debug_element']
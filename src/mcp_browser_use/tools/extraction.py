@@ -1,7 +1,10 @@
 """Element extraction tool implementations."""
 
-from typing import Optional, List, Dict
-from ..actions.extraction import extract_elements as _extract_elements_action
+from typing import Any, Optional, List, Dict
+from ..actions.extraction import (
+    extract_elements as _extract_elements_action,
+    extract_elements_data as _extract_elements_data_action,
+)
 
 
 async def extract_elements(
@@ -55,4 +58,36 @@ async def extract_elements(
     )
 
 
-__all__ = ['extract_elements']
+
+async def extract_elements_data(
+    selectors: Optional[List[Dict[str, str]]] = None,
+    container_selector: Optional[str] = None,
+    fields: Optional[List[Dict[str, str]]] = None,
+    selector_type: Optional[str] = None,
+    wait_for_visible: bool = False,
+    timeout: int = 10,
+    max_items: Optional[int] = None,
+    offset: Optional[int] = None,
+    discover_containers: bool = False,
+    wait_for_content_loaded: Optional[Dict[str, any]] = None,
+) -> Dict[str, Any]:
+    """
+    Like extract_elements(), but returns the result dict itself, for in-process
+    callers that would only parse the JSON again. The dict may be shared with
+    the extraction cache: do not modify it.
+    """
+    return await _extract_elements_data_action(
+        selectors=selectors,
+        container_selector=container_selector,
+        fields=fields,
+        selector_type=selector_type,
+        wait_for_visible=wait_for_visible,
+        timeout=timeout,
+        max_items=max_items,
+        offset=offset,
+        discover_containers=discover_containers,
+        wait_for_content_loaded=wait_for_content_loaded
+    )
+
+
+__all__ = ['extract_elements', 'extract_elements_data']
@@ -1,73 +1,389 @@
 """Element interaction tool implementations."""
 
-import json
 import time
-from typing import Optional
+import functools
+from typing import Dict, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
 from selenium.common.exceptions import (
     TimeoutException,
     StaleElementReferenceException,
     ElementClickInterceptedException,
 )
 from ..context import get_context
-from ..utils.diagnostics import collect_diagnostics
+from ..utils.diagnostics import error_response
+from ..utils.jsonio import respond
+from ..utils.executor import selenium_thread
 from ..actions.elements import find_element, _wait_clickable_element
-from ..actions.navigation import _wait_document_ready
 from ..actions.screenshots import _make_page_snapshot
 from ..utils.retry import retry_op
 
 
-async def fill_text(
+@functools.lru_cache(maxsize=1)
+def _key_mapping() -> Dict[str, str]:
+    """Key name -> Selenium Keys value, built once on first use."""
+    from selenium.webdriver.common.keys import Keys
+
+    return {
+        "ENTER": Keys.ENTER,
+        "RETURN": Keys.RETURN,
+        "TAB": Keys.TAB,
+        "ESCAPE": Keys.ESCAPE,
+        "ESC": Keys.ESCAPE,
+        "SPACE": Keys.SPACE,
+        "BACKSPACE": Keys.BACKSPACE,
+        "DELETE": Keys.DELETE,
+        "ARROW_UP": Keys.ARROW_UP,
+        "ARROW_DOWN": Keys.ARROW_DOWN,
+        "ARROW_LEFT": Keys.ARROW_LEFT,
+        "ARROW_RIGHT": Keys.ARROW_RIGHT,
+        "PAGE_UP": Keys.PAGE_UP,
+        "PAGE_DOWN": Keys.PAGE_DOWN,
+        "HOME": Keys.HOME,
+        "END": Keys.END,
+        "F1": Keys.F1,
+        "F2": Keys.F2,
+        "F3": Keys.F3,
+        "F4": Keys.F4,
+        "F5": Keys.F5,
+        "F6": Keys.F6,
+        "F7": Keys.F7,
+        "F8": Keys.F8,
+        "F9": Keys.F9,
+        "F10": Keys.F10,
+        "F11": Keys.F11,
+        "F12": Keys.F12,
+    }
+
+
+def _selenium_key(key: str) -> str:
+    """Map a key name (ENTER, TAB, ARROW_DOWN, ...) to its Selenium Keys value."""
+    return _key_mapping().get(key.upper(), key)
+
+
+def _locate_interactable(
+    ctx,
     selector,
-    text,
     selector_type,
-    clear_first,
     timeout,
     iframe_selector,
     iframe_selector_type,
     shadow_root_selector,
     shadow_root_selector_type,
 ):
-    """Fill text into an element."""
-    ctx = get_context()
+    """Find a visible element and stay in its iframe context so it can be acted on."""
+    return retry_op(fn=lambda: find_element(
+        driver=ctx.driver,
+        selector=selector,
+        selector_type=selector_type,
+        timeout=int(timeout),
+        visible_only=True,
+        iframe_selector=iframe_selector,
+        iframe_selector_type=iframe_selector_type,
+        shadow_root_selector=shadow_root_selector,
+        shadow_root_selector_type=shadow_root_selector_type,
+        stay_in_context=True,
+    ))
+
+
+def _fill(ctx, selector, text, selector_type, clear_first, timeout,
+          iframe_selector, iframe_selector_type, shadow_root_selector, shadow_root_selector_type):
+    """Type `text` into the located element and return the element."""
+    el = _locate_interactable(
+        ctx, selector, selector_type, timeout,
+        iframe_selector, iframe_selector_type, shadow_root_selector, shadow_root_selector_type,
+    )
+    if clear_first:
+        try:
+            el.clear()
+        except Exception:
+            pass
+    el.send_keys(text)
+    ctx.invalidate_snapshot()
+    return el
+
+
+# (host, selector_type, selector) -> monotonic expiry. Selectors whose native
+# click was intercepted (overlays, sticky headers) go straight to a JS click.
+_JS_CLICK_HINTS: Dict[Tuple[str, str, str], float] = {}
+_JS_CLICK_HINT_TTL = 300.0
+_JS_CLICK_HINTS_MAX = 256
+
+
+def _js_click_key(ctx, selector, selector_type) -> Tuple[str, str, str]:
+    host = urlsplit(ctx.last_url).netloc if ctx.last_url else ""
+    return (host, selector_type, selector)
+
 
+def _js_click_hinted(key) -> bool:
+    expires = _JS_CLICK_HINTS.get(key)
+    if expires is None:
+        return False
+    if expires < time.monotonic():
+        _JS_CLICK_HINTS.pop(key, None)
+        return False
+    return True
+
+
+def _remember_js_click(key) -> None:
+    now = time.monotonic()
+    if len(_JS_CLICK_HINTS) >= _JS_CLICK_HINTS_MAX:
+        for k in [k for k, exp in _JS_CLICK_HINTS.items() if exp < now] or list(_JS_CLICK_HINTS)[:1]:
+            del _JS_CLICK_HINTS[k]
+    _JS_CLICK_HINTS[key] = now + _JS_CLICK_HINT_TTL
+
+
+def _click(ctx, selector, selector_type, timeout, force_js,
+           iframe_selector, iframe_selector_type, shadow_root_selector, shadow_root_selector_type):
+    """
+    Click the located element, falling back to a JS click when the native click fails.
+
+    A selector whose native click was intercepted on this host is clicked via JS
+    directly for the next few minutes, skipping the failing native attempt.
+    """
+    el = _locate_interactable(
+        ctx, selector, selector_type, timeout,
+        iframe_selector, iframe_selector_type, shadow_root_selector, shadow_root_selector_type,
+    )
+
+    _wait_clickable_element(el=el, driver=ctx.driver, timeout=timeout)
+
+    hint_key = _js_click_key(ctx, selector, selector_type)
+    if force_js or _js_click_hinted(hint_key):
+        ctx.driver.execute_script("arguments[0].click();", el)
+    else:
+        try:
+            el.click()
+        except (ElementClickInterceptedException, StaleElementReferenceException) as e:
+            if isinstance(e, ElementClickInterceptedException):
+                _remember_js_click(hint_key)
+            el = _locate_interactable(
+                ctx, selector, selector_type, timeout,
+                iframe_selector, iframe_selector_type, shadow_root_selector, shadow_root_selector_type,
+            )
+            ctx.driver.execute_script("arguments[0].click();", el)
+    ctx.invalidate_snapshot()
+
+
+# Resolves true once the element meets the condition, false on timeout and
+# "error:..." if the selector cannot be evaluated. A MutationObserver reacts to
+# DOM changes; the interval catches style/layout-only changes it cannot see.
+_WAIT_FOR_ELEMENT_JS = """
+var sel = arguments[0], kind = arguments[1], cond = arguments[2], ms = arguments[3];
+// Optional CSS selectors of (same-origin) iframes to search side by side;
+// the result is then the index of the first frame whose element qualifies
+var frames = arguments.length > 5 ? arguments[4] : null;
+var done = arguments[arguments.length - 1];
+var xps = [];
+function docs() {
+  if (!frames) return [document];
+  return frames.map(function (f) {
+    var el = document.querySelector(f);
+    if (el && !el.contentDocument) throw new Error('cross-origin frame ' + f);
+    return el ? el.contentDocument : null;
+  });
+}
+function find(doc, i) {
+  if (kind === 'xpath') {
+    // Compiled once per document, re-evaluated on every check
+    if (!xps[i] || xps[i].doc !== doc) xps[i] = {doc: doc, xp: doc.createExpression(sel, null)};
+    return xps[i].xp.evaluate(doc, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+  }
+  return kind === 'id' ? doc.getElementById(sel) : doc.querySelector(sel);
+}
+function ok(e) {
+  if (!e) return false;
+  if (cond === 'present') return true;
+  var r = e.getBoundingClientRect(), s = e.ownerDocument.defaultView.getComputedStyle(e);
+  var visible = r.width > 0 && r.height > 0 && s.visibility !== 'hidden' && s.display !== 'none';
+  return cond === 'clickable' ? visible && !e.disabled : visible;
+}
+var finished = false, mo = null, iv = null, to = null;
+function finish(v) {
+  if (finished) return;
+  finished = true;
+  if (mo) mo.disconnect();
+  clearInterval(iv);
+  clearTimeout(to);
+  done(v);
+}
+function check() {
+  try {
+    var ds = docs();
+    for (var i = 0; i < ds.length; i++) {
+      if (ds[i] && ok(find(ds[i], i))) { finish(frames ? i : true); return; }
+    }
+  } catch (err) { finish('error:' + err.message); }
+}
+check();
+if (!finished) {
+  mo = new MutationObserver(check);
+  mo.observe(document, {subtree: true, childList: true, attributes: true});
+  iv = setInterval(check, 100);
+  to = setTimeout(function () { finish(false); }, ms);
+}
+"""
+
+WAIT_CONDITIONS = frozenset({"present", "visible", "clickable"})
+_VISIBLE_CONDITIONS = frozenset({"visible", "clickable"})
+
+# Selector types the in-page wait understands, and the longest wait it is used
+# for (stays under WebDriver's default 30s async script timeout)
+_IN_PAGE_WAIT_TYPES = frozenset({"css", "xpath", "id"})
+_IN_PAGE_WAIT_MAX_SECS = 25.0
+
+
+def _wait_in_page(driver, selector, selector_type, timeout, condition) -> Optional[bool]:
+    """
+    Wait for the condition inside the page in one async script round trip.
+
+    Returns True/False (met / timed out), or None if the script could not decide
+    (invalid selector, page navigated away, ...) and the caller should poll.
+    """
+    try:
+        res = driver.execute_async_script(
+            _WAIT_FOR_ELEMENT_JS, selector, selector_type, condition, int(timeout * 1000),
+        )
+    except Exception:
+        return None
+    return res if isinstance(res, bool) else None
+
+
+def _wait_in_frames(driver, selector, selector_type, timeout, condition, iframe_selectors) -> Union[int, bool, None]:
+    """
+    Like _wait_in_page, but watches the element in several same-origin iframes
+    at once. Returns the index of the first frame that meets the condition,
+    False on timeout, or None if undecided (e.g. a cross-origin frame).
+    """
     try:
-        el = retry_op(fn=lambda: find_element(
-            driver=ctx.driver,
-            selector=selector,
-            selector_type=selector_type,
-            timeout=int(timeout),
-            visible_only=True,
-            iframe_selector=iframe_selector,
-            iframe_selector_type=iframe_selector_type,
-            shadow_root_selector=shadow_root_selector,
-            shadow_root_selector_type=shadow_root_selector_type,
-            stay_in_context=True,
-        ))
-
-        if clear_first:
+        res = driver.execute_async_script(
+            _WAIT_FOR_ELEMENT_JS, selector, selector_type, condition, int(timeout * 1000),
+            list(iframe_selectors),
+        )
+    except Exception:
+        return None
+    if res is False or (isinstance(res, int) and not isinstance(res, bool) and 0 <= res < len(iframe_selectors)):
+        return res
+    return None
+
+
+def _wait_for_condition(ctx, selector, selector_type, timeout, condition,
+                        iframe_selector, iframe_selector_type):
+    """Block until the element meets `condition`; raises TimeoutException otherwise."""
+    if condition not in WAIT_CONDITIONS:
+        condition = (condition or "").lower()
+        if condition not in WAIT_CONDITIONS:
+            raise ValueError(f"condition must be one of {sorted(WAIT_CONDITIONS)}, got {condition!r}")
+    kind = (selector_type or "css").lower()
+    if iframe_selector is None and kind in _IN_PAGE_WAIT_TYPES and 0 < timeout <= _IN_PAGE_WAIT_MAX_SECS:
+        started = time.monotonic()
+        met = _wait_in_page(ctx.driver, selector, kind, timeout, condition)
+        if met is True:
+            return
+        if met is False:
+            raise TimeoutException(f"Element '{selector}' did not become {condition} within {timeout}s")
+        # Undecided: poll through WebDriver for whatever time is left
+        timeout = max(0.0, timeout - (time.monotonic() - started))
+
+    visible_only = condition in _VISIBLE_CONDITIONS
+
+    el = find_element(
+        driver=ctx.driver,
+        selector=selector,
+        selector_type=selector_type,
+        timeout=int(timeout),
+        visible_only=visible_only,
+        iframe_selector=iframe_selector,
+        iframe_selector_type=iframe_selector_type,
+    )
+
+    if condition == "clickable":
+        _wait_clickable_element(el=el, driver=ctx.driver, timeout=timeout)
+
+
+def _wait_for_condition_in_frames(ctx, selector, selector_type, timeout, condition,
+                                  iframe_selectors, iframe_selector_type) -> str:
+    """
+    Block until the element meets `condition` inside any of `iframe_selectors`
+    and return the selector of that frame; raises TimeoutException otherwise.
+
+    Same-origin frames are watched together by one in-page script. WebDriver
+    can only be inside one frame at a time, so anything the script cannot
+    decide falls back to checking the frames in turn until the deadline.
+    """
+    if condition not in WAIT_CONDITIONS:
+        condition = (condition or "").lower()
+        if condition not in WAIT_CONDITIONS:
+            raise ValueError(f"condition must be one of {sorted(WAIT_CONDITIONS)}, got {condition!r}")
+    deadline = time.monotonic() + timeout
+    kind = (selector_type or "css").lower()
+    if ((iframe_selector_type or "css").lower() == "css" and kind in _IN_PAGE_WAIT_TYPES
+            and 0 < timeout <= _IN_PAGE_WAIT_MAX_SECS):
+        met = _wait_in_frames(ctx.driver, selector, kind, timeout, condition, iframe_selectors)
+        if met is False:
+            raise TimeoutException(f"Element '{selector}' did not become {condition} within {timeout}s")
+        if met is not None:
+            return iframe_selectors[met]
+
+    while True:
+        for frame_selector in iframe_selectors:
             try:
-                el.clear()
-            except Exception:
+                _wait_for_condition(
+                    ctx, selector, selector_type, 0, condition,
+                    frame_selector, iframe_selector_type,
+                )
+                return frame_selector
+            except TimeoutException:
                 pass
-        el.send_keys(text)
-        _wait_document_ready(timeout=5.0)
+            finally:
+                _restore_default_content(ctx, frame_selector)
+        if time.monotonic() >= deadline:
+            raise TimeoutException(f"Element '{selector}' did not become {condition} within {timeout}s")
+        time.sleep(0.1)
+
+
+def _restore_default_content(ctx, *iframe_selectors):
+    """Switch back to the top-level document, but only if one of the given iframe selectors was used."""
+    if all(s is None for s in iframe_selectors):
+        return
+    try:
+        if ctx.is_driver_initialized():
+            ctx.driver.switch_to.default_content()
+    except Exception:
+        pass
+
+
+@selenium_thread
+def fill_text(
+    selector,
+    text,
+    selector_type,
+    clear_first,
+    timeout,
+    iframe_selector,
+    iframe_selector_type,
+    shadow_root_selector,
+    shadow_root_selector_type,
+) -> Union[dict, bytes]:
+    """Fill text into an element; returns the result dict (JSON bytes on error)."""
+    ctx = get_context()
+
+    try:
+        _fill(
+            ctx, selector, text, selector_type, clear_first, timeout,
+            iframe_selector, iframe_selector_type, shadow_root_selector, shadow_root_selector_type,
+        )
 
         snapshot = _make_page_snapshot()
-        return json.dumps({"ok": True, "action": "fill_text", "selector": selector, "snapshot": snapshot})
+        return {"ok": True, "action": "fill_text", "selector": selector, "snapshot": snapshot}
 
     except Exception as e:
-        diag = collect_diagnostics(driver=ctx.driver, exc=e, config=ctx.config)
-        snapshot = _make_page_snapshot()
-        return json.dumps({"ok": False, "error": str(e), "diagnostics": diag, "snapshot": snapshot})
+        return error_response(e)
 
     finally:
-        try:
-            if ctx.is_driver_initialized():
-                ctx.driver.switch_to.default_content()
-        except Exception:
-            pass
+        _restore_default_content(ctx, iframe_selector)
 
-async def click_element(
+@selenium_thread
+def click_element(
     selector,
     selector_type,
     timeout,
@@ -76,139 +392,76 @@ async def click_element(
     iframe_selector_type,
     shadow_root_selector,
     shadow_root_selector_type,
-) -> str:
-    """Click an element."""
+) -> Union[dict, bytes]:
+    """Click an element; returns the result dict (JSON bytes on error)."""
     ctx = get_context()
 
     try:
-        el = retry_op(fn=lambda: find_element(
-            driver=ctx.driver,
-            selector=selector,
-            selector_type=selector_type,
-            timeout=int(timeout),
-            visible_only=True,
-            iframe_selector=iframe_selector,
-            iframe_selector_type=iframe_selector_type,
-            shadow_root_selector=shadow_root_selector,
-            shadow_root_selector_type=shadow_root_selector_type,
-            stay_in_context=True,
-        ))
-
-        _wait_clickable_element(el=el, driver=ctx.driver, timeout=timeout)
-
-        if force_js:
-            ctx.driver.execute_script("arguments[0].click();", el)
-        else:
-            try:
-                el.click()
-            except (ElementClickInterceptedException, StaleElementReferenceException):
-                el = retry_op(fn=lambda: find_element(
-                    driver=ctx.driver,
-                    selector=selector,
-                    selector_type=selector_type,
-                    timeout=int(timeout),
-                    visible_only=True,
-                    iframe_selector=iframe_selector,
-                    iframe_selector_type=iframe_selector_type,
-                    shadow_root_selector=shadow_root_selector,
-                    shadow_root_selector_type=shadow_root_selector_type,
-                    stay_in_context=True,
-                ))
-                ctx.driver.execute_script("arguments[0].click();", el)
-
-        _wait_document_ready(timeout=10.0)
+        _click(
+            ctx, selector, selector_type, timeout, force_js,
+            iframe_selector, iframe_selector_type, shadow_root_selector, shadow_root_selector_type,
+        )
 
-        snapshot = _make_page_snapshot()
-        return json.dumps({
+        snapshot = _make_page_snapshot(ready_timeout=10.0)
+        return {
             "ok": True,
             "action": "click",
             "selector": selector,
             "selector_type": selector_type,
             "snapshot": snapshot,
-        })
+        }
 
     except TimeoutException:
         snapshot = _make_page_snapshot()
-        return json.dumps({
+        return {
             "ok": False,
             "error": "timeout",
             "selector": selector,
             "selector_type": selector_type,
             "snapshot": snapshot,
-        })
+        }
 
     except Exception as e:
-        diag = collect_diagnostics(driver=ctx.driver, exc=e, config=ctx.config)
-        snapshot = _make_page_snapshot()
-        return json.dumps({"ok": False, "error": str(e), "diagnostics": diag, "snapshot": snapshot})
+        return error_response(e)
 
     finally:
-        try:
-            if ctx.is_driver_initialized():
-                ctx.driver.switch_to.default_content()
-        except Exception:
-            pass
+        _restore_default_content(ctx, iframe_selector)
 
 
-async def send_keys(
-    key: str,
+@selenium_thread
+def send_keys(
+    key: Union[str, List[str]],
     selector: Optional[str] = None,
     selector_type: str = "css",
     timeout: float = 10.0,
+    snapshot: bool = True,
 ) -> str:
     """
     Send keyboard keys to an element or to the active element.
 
     Args:
-        key: Key to send (ENTER, TAB, ESCAPE, ARROW_DOWN, etc.)
+        key: Key to send (ENTER, TAB, ESCAPE, ARROW_DOWN, etc.), or a list of keys
+            and text chunks sent in order with a single WebDriver command
         selector: Optional CSS selector, XPath, or ID of element to send keys to
         selector_type: Type of selector (css, xpath, id)
         timeout: Maximum time to wait for element in seconds
+        snapshot: Capture the page afterwards; False skips the settle pause and capture
 
     Returns:
-        JSON string with ok status, action, key sent, and page snapshot
+        JSON string with ok status, action, key sent, and page snapshot (if requested)
     """
     ctx = get_context()
 
     try:
-        from selenium.webdriver.common.keys import Keys
-
         if not ctx.is_driver_initialized():
-            return json.dumps({"ok": False, "error": "driver_not_initialized"})
-
-        # Map string key names to Selenium Keys
-        key_mapping = {
-            "ENTER": Keys.ENTER,
-            "RETURN": Keys.RETURN,
-            "TAB": Keys.TAB,
-            "ESCAPE": Keys.ESCAPE,
-            "ESC": Keys.ESCAPE,
-            "SPACE": Keys.SPACE,
-            "BACKSPACE": Keys.BACKSPACE,
-            "DELETE": Keys.DELETE,
-            "ARROW_UP": Keys.ARROW_UP,
-            "ARROW_DOWN": Keys.ARROW_DOWN,
-            "ARROW_LEFT": Keys.ARROW_LEFT,
-            "ARROW_RIGHT": Keys.ARROW_RIGHT,
-            "PAGE_UP": Keys.PAGE_UP,
-            "PAGE_DOWN": Keys.PAGE_DOWN,
-            "HOME": Keys.HOME,
-            "END": Keys.END,
-            "F1": Keys.F1,
-            "F2": Keys.F2,
-            "F3": Keys.F3,
-            "F4": Keys.F4,
-            "F5": Keys.F5,
-            "F6": Keys.F6,
-            "F7": Keys.F7,
-            "F8": Keys.F8,
-            "F9": Keys.F9,
-            "F10": Keys.F10,
-            "F11": Keys.F11,
-            "F12": Keys.F12,
-        }
+            return respond({"ok": False, "error": "driver_not_initialized"})
 
-        selenium_key = key_mapping.get(key.upper(), key)
+        if isinstance(key, str):
+            selenium_keys = (_selenium_key(key),)
+        elif isinstance(key, (list, tuple)) and key and all(isinstance(k, str) for k in key):
+            selenium_keys = tuple(_selenium_key(k) for k in key)
+        else:
+            return respond({"ok": False, "error": "invalid_key", "message": "key must be a string or a non-empty list of strings"})
 
         if selector:
             # Send keys to specific element
@@ -219,35 +472,37 @@ async def send_keys(
                 timeout=int(timeout),
                 visible_only=True,
             ))
-            el.send_keys(selenium_key)
+            el.send_keys(*selenium_keys)
         else:
             # Send keys to active element (usually body or focused element)
             from selenium.webdriver.common.action_chains import ActionChains
-            ActionChains(ctx.driver).send_keys(selenium_key).perform()
-
-        time.sleep(0.2)  # Brief pause
-        snapshot = _make_page_snapshot()
+            ActionChains(ctx.driver).send_keys(*selenium_keys).perform()
+        ctx.invalidate_snapshot()
 
-        return json.dumps({
+        result = {
             "ok": True,
             "action": "send_keys",
             "key": key,
             "selector": selector,
-            "snapshot": snapshot,
-        })
+        }
+        if snapshot:
+            time.sleep(0.2)  # Brief pause
+            result["snapshot"] = _make_page_snapshot()
+
+        return respond(result)
 
     except Exception as e:
-        diag = collect_diagnostics(driver=ctx.driver, exc=e, config=ctx.config)
-        snapshot = _make_page_snapshot()
-        return json.dumps({"ok": False, "error": str(e), "diagnostics": diag, "snapshot": snapshot})
+        return error_response(e)
 
-async def wait_for_element(
+@selenium_thread
+def wait_for_element(
     selector: str,
     selector_type: str = "css",
     timeout: float = 10.0,
     condition: str = "visible",
     iframe_selector: Optional[str] = None,
     iframe_selector_type: str = "css",
+    iframe_selectors: Optional[List[str]] = None,
 ) -> str:
     """
     Wait for an element to meet a specific condition.
@@ -258,7 +513,9 @@ async def wait_for_element(
         timeout: Maximum time to wait in seconds
         condition: Condition to wait for - 'present', 'visible', or 'clickable'
         iframe_selector: Optional selector for iframe containing the element
-        iframe_selector_type: Selector type for the iframe
+        iframe_selector_type: Selector type for the iframe(s)
+        iframe_selectors: Optional candidate iframes, searched together; the first
+            one whose element meets the condition is reported as "iframe_selector"
 
     Returns:
         JSON string with ok status, element found status, and page snapshot
@@ -267,25 +524,24 @@ async def wait_for_element(
 
     try:
         if not ctx.is_driver_initialized():
-            return json.dumps({"ok": False, "error": "driver_not_initialized"})
-
-        visible_only = condition in ("visible", "clickable")
-
-        el = find_element(
-            driver=ctx.driver,
-            selector=selector,
-            selector_type=selector_type,
-            timeout=int(timeout),
-            visible_only=visible_only,
-            iframe_selector=iframe_selector,
-            iframe_selector_type=iframe_selector_type,
-        )
-
-        if condition == "clickable":
-            _wait_clickable_element(el=el, driver=ctx.driver, timeout=timeout)
+            return respond({"ok": False, "error": "driver_not_initialized"})
+
+        if iframe_selectors:
+            candidates = list(iframe_selectors)
+            if iframe_selector and iframe_selector not in candidates:
+                candidates.insert(0, iframe_selector)
+            iframe_selector = _wait_for_condition_in_frames(
+                ctx, selector, selector_type, timeout, condition,
+                candidates, iframe_selector_type,
+            )
+        else:
+            _wait_for_condition(
+                ctx, selector, selector_type, timeout, condition,
+                iframe_selector, iframe_selector_type,
+            )
 
         snapshot = _make_page_snapshot()
-        return json.dumps({
+        result = {
             "ok": True,
             "action": "wait_for_element",
             "selector": selector,
@@ -293,11 +549,14 @@ async def wait_for_element(
             "found": True,
             "snapshot": snapshot,
             "message": f"Element '{selector}' is now {condition}"
-        })
+        }
+        if iframe_selectors:
+            result["iframe_selector"] = iframe_selector
+        return respond(result)
 
     except TimeoutException:
         snapshot = _make_page_snapshot()
-        return json.dumps({
+        return respond({
             "ok": False,
             "error": "timeout",
             "selector": selector,
@@ -308,16 +567,140 @@ async def wait_for_element(
         })
 
     except Exception as e:
-        diag = collect_diagnostics(driver=ctx.driver, exc=e, config=ctx.config)
+        return error_response(e)
+
+    finally:
+        _restore_default_content(ctx, iframe_selector)
+
+
+@selenium_thread
+def click_and_wait(
+    selector: str,
+    wait_selector: str,
+    selector_type: str = "css",
+    timeout: float = 10.0,
+    force_js: bool = False,
+    iframe_selector: Optional[str] = None,
+    iframe_selector_type: str = "css",
+    shadow_root_selector: Optional[str] = None,
+    shadow_root_selector_type: str = "css",
+    wait_selector_type: str = "css",
+    wait_condition: str = "visible",
+    wait_timeout: float = 10.0,
+    wait_iframe_selector: Optional[str] = None,
+    wait_iframe_selector_type: str = "css",
+) -> str:
+    """
+    Click an element, then wait for another element to meet a condition.
+
+    Both steps run back to back and only one snapshot is taken, after the wait.
+
+    Returns:
+        JSON string with ok status, found flag, and page snapshot
+    """
+    ctx = get_context()
+
+    try:
+        if not ctx.is_driver_initialized():
+            return respond({"ok": False, "error": "driver_not_initialized"})
+
+        _click(
+            ctx, selector, selector_type, timeout, force_js,
+            iframe_selector, iframe_selector_type, shadow_root_selector, shadow_root_selector_type,
+        )
+        _restore_default_content(ctx, iframe_selector)
+
+        _wait_for_condition(
+            ctx, wait_selector, wait_selector_type, wait_timeout, wait_condition,
+            wait_iframe_selector, wait_iframe_selector_type,
+        )
+
         snapshot = _make_page_snapshot()
-        return json.dumps({"ok": False, "error": str(e), "diagnostics": diag, "snapshot": snapshot})
+        return respond({
+            "ok": True,
+            "action": "click_and_wait",
+            "selector": selector,
+            "wait_selector": wait_selector,
+            "condition": wait_condition,
+            "found": True,
+            "snapshot": snapshot,
+        })
+
+    except TimeoutException:
+        snapshot = _make_page_snapshot()
+        return respond({
+            "ok": False,
+            "error": "timeout",
+            "selector": selector,
+            "wait_selector": wait_selector,
+            "condition": wait_condition,
+            "found": False,
+            "snapshot": snapshot,
+        })
+
+    except Exception as e:
+        return error_response(e)
 
     finally:
-        try:
-            if ctx.is_driver_initialized():
-                ctx.driver.switch_to.default_content()
-        except Exception:
-            pass
+        _restore_default_content(ctx, iframe_selector, wait_iframe_selector)
+
+
+@selenium_thread
+def fill_text_and_submit(
+    selector: str,
+    text: str,
+    selector_type: str = "css",
+    clear_first: bool = True,
+    timeout: float = 10.0,
+    iframe_selector: Optional[str] = None,
+    iframe_selector_type: str = "css",
+    shadow_root_selector: Optional[str] = None,
+    shadow_root_selector_type: str = "css",
+    submit_key: str = "ENTER",
+) -> str:
+    """
+    Fill text into an element and submit by sending `submit_key` to the same element.
+
+    The element is located once and only one snapshot is taken, after the submit.
+
+    Returns:
+        JSON string with ok status, action, and page snapshot
+    """
+    ctx = get_context()
+
+    try:
+        if not ctx.is_driver_initialized():
+            return respond({"ok": False, "error": "driver_not_initialized"})
+
+        el = _fill(
+            ctx, selector, text, selector_type, clear_first, timeout,
+            iframe_selector, iframe_selector_type, shadow_root_selector, shadow_root_selector_type,
+        )
+        el.send_keys(_selenium_key(submit_key))
+        ctx.invalidate_snapshot()
+        _restore_default_content(ctx, iframe_selector)
+
+        snapshot = _make_page_snapshot(ready_timeout=10.0)
+        return respond({
+            "ok": True,
+            "action": "fill_text_and_submit",
+            "selector": selector,
+            "key": submit_key,
+            "snapshot": snapshot,
+        })
+
+    except Exception as e:
+        return error_response(e)
+
+    finally:
+        _restore_default_content(ctx, iframe_selector)
 
 
-__all__ = ['fill_text', 'click_element', 'send_keys', 'wait_for_element']
+__all__ = [
+    'fill_text',
+    'click_element',
+    'send_keys',
+    'wait_for_element',
+    'click_and_wait',
+    'fill_text_and_submit',
+]
@@ -1,52 +1,173 @@
 """Navigation and scrolling tool implementations."""
 
-import json
 import time
+from typing import Optional, Union
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.support.ui import WebDriverWait
 from ..context import get_context
-from ..utils.diagnostics import collect_diagnostics
+from ..utils.diagnostics import error_response
+from ..utils.jsonio import respond
+from ..utils.executor import selenium_thread
 from ..actions.navigation import _wait_document_ready
 from ..actions.screenshots import _make_page_snapshot
+from ..helpers_context import invalidate_subtree_hashes
+from .interaction import _wait_for_condition, _restore_default_content
 
 
-async def navigate_to_url(
+def _load(ctx, url: str, wait_for: str, timeout_sec: int, wait_ready: bool = True) -> None:
+    """
+    Load `url` in the current window and wait for the requested readiness.
+
+    wait_ready=False skips the DOM-readiness poll for callers that take a
+    snapshot right away; _make_page_snapshot waits for readiness in the same
+    script that reads the page.
+    """
+    ctx.driver.get(url)
+    ctx.invalidate_snapshot()
+    invalidate_subtree_hashes()
+
+    # DOM readiness
+    if wait_ready:
+        try:
+            _wait_document_ready(timeout=min(max(timeout_sec, 0), 60))
+        except Exception:
+            pass
+
+    if (wait_for or "load").lower() == "complete":
+        try:
+            WebDriverWait(ctx.driver, timeout_sec).until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+            )
+        except Exception:
+            pass
+
+
+@selenium_thread
+def navigate_to_url(
     url: str,
     wait_for: str = "load",     # "load" or "complete"
     timeout_sec: int = 30,
+) -> Union[dict, bytes]:
+    """
+    Navigate to a URL and return the result dict with a raw snapshot (handed
+    to to_context_pack as is, never encoded here); errors are JSON bytes.
+    """
+    ctx = get_context()
+
+    try:
+        if not ctx.is_driver_initialized():
+            return {"ok": False, "error": "driver_not_initialized"}
+
+        _load(ctx, url, wait_for, timeout_sec, wait_ready=False)
+
+        snapshot = _make_page_snapshot(ready_timeout=min(max(timeout_sec, 0), 60))
+        return {"ok": True, "action": "navigate", "url": url, "snapshot": snapshot}
+
+    except Exception as e:
+        return error_response(e)
+
+
+@selenium_thread
+def navigate_and_wait_idle(
+    url: str,
+    idle_ms: int = 500,
+    timeout_sec: int = 30,
 ) -> str:
-    """Navigate to a URL and return JSON with a raw snapshot."""
+    """
+    Navigate to a URL and return a snapshot once the page is loaded and the
+    network has been quiet for `idle_ms`.
+
+    The load/idle wait and the page read happen in one async script after
+    driver.get(), instead of separate readiness polls and snapshot calls.
+    """
     ctx = get_context()
 
     try:
         if not ctx.is_driver_initialized():
-            return json.dumps({"ok": False, "error": "driver_not_initialized"})
+            return respond({"ok": False, "error": "driver_not_initialized"})
 
-        ctx.driver.get(url)
+        _load(ctx, url, "load", timeout_sec, wait_ready=False)
 
-        # DOM readiness
-        try:
-            _wait_document_ready(timeout=min(max(timeout_sec, 0), 60))
-        except Exception:
-            pass
+        snapshot = _make_page_snapshot(
+            ready_timeout=min(max(timeout_sec, 0), 60),
+            idle_ms=max(int(idle_ms), 1),
+        )
+        return respond({"ok": True, "action": "navigate_and_wait_idle", "url": url, "snapshot": snapshot})
+
+    except Exception as e:
+        return error_response(e)
+
+
+@selenium_thread
+def navigate_and_wait(
+    url: str,
+    selector: str,
+    selector_type: str = "css",
+    condition: str = "visible",
+    wait_for: str = "load",
+    timeout_sec: int = 30,
+    timeout: float = 10.0,
+    iframe_selector: Optional[str] = None,
+    iframe_selector_type: str = "css",
+) -> str:
+    """
+    Navigate to a URL, then wait for an element to meet a condition.
+
+    Skips the intermediate post-navigation snapshot; the page is captured
+    once, after the wait has finished.
+
+    Returns:
+        JSON string with ok status, found flag, and page snapshot
+    """
+    ctx = get_context()
+
+    try:
+        if not ctx.is_driver_initialized():
+            return respond({"ok": False, "error": "driver_not_initialized"})
 
-        if (wait_for or "load").lower() == "complete":
-            try:
-                WebDriverWait(ctx.driver, timeout_sec).until(
-                    lambda d: d.execute_script("return document.readyState") == "complete"
-                )
-            except Exception:
-                pass
+        _load(ctx, url, wait_for, timeout_sec)
+
+        _wait_for_condition(
+            ctx, selector, selector_type, timeout, condition,
+            iframe_selector, iframe_selector_type,
+        )
 
         snapshot = _make_page_snapshot()
-        return json.dumps({"ok": True, "action": "navigate", "url": url, "snapshot": snapshot})
+        return respond({
+            "ok": True,
+            "action": "navigate_and_wait",
+            "url": url,
+            "selector": selector,
+            "condition": condition,
+            "found": True,
+            "snapshot": snapshot,
+        })
 
-    except Exception as e:
-        diag = collect_diagnostics(driver=ctx.driver, exc=e, config=ctx.config)
+    except TimeoutException:
         snapshot = _make_page_snapshot()
-        return json.dumps({"ok": False, "error": str(e), "diagnostics": diag, "snapshot": snapshot})
+        return respond({
+            "ok": False,
+            "error": "timeout",
+            "url": url,
+            "selector": selector,
+            "condition": condition,
+            "found": False,
+            "snapshot": snapshot,
+            "message": f"Element '{selector}' did not become {condition} within {timeout}s"
+        })
+
+    except Exception as e:
+        return error_response(e)
+
+    finally:
+        _restore_default_content(ctx, iframe_selector)
 
 
-async def scroll(x: int, y: int) -> str:
+_SCROLL_BY_JS = "window.scrollBy(arguments[0], arguments[1]);"
+
+
+@selenium_thread
+def scroll(x: int, y: int) -> Union[dict, bytes]:
     """
     Scroll the page by the specified pixel amounts.
 
@@ -55,30 +176,32 @@ async def scroll(x: int, y: int) -> str:
         y: Vertical scroll amount in pixels (positive = down, negative = up)
 
     Returns:
-        JSON string with ok status, action, scroll amounts, and page snapshot
+        Result dict with ok status, action, scroll amounts, and page snapshot
+        (JSON bytes on error)
     """
     ctx = get_context()
 
     try:
         if not ctx.is_driver_initialized():
-            return json.dumps({"ok": False, "error": "driver_not_initialized"})
+            return {"ok": False, "error": "driver_not_initialized"}
 
-        ctx.driver.execute_script(f"window.scrollBy({int(x)}, {int(y)});")
+        ctx.driver.execute_script(_SCROLL_BY_JS, int(x), int(y))
+        # No invalidate_snapshot(): the scroll position is not part of the HTML,
+        # and content it lazy-loads bumps the mutation signature, so an
+        # unchanged page is served from the snapshot cache
         time.sleep(0.3)  # Brief pause to allow scroll to complete
 
         snapshot = _make_page_snapshot()
-        return json.dumps({
+        return {
             "ok": True,
             "action": "scroll",
             "x": int(x),
             "y": int(y),
             "snapshot": snapshot,
-        })
+        }
 
     except Exception as e:
-        diag = collect_diagnostics(driver=ctx.driver, exc=e, config=ctx.config)
-        snapshot = _make_page_snapshot()
-        return json.dumps({"ok": False, "error": str(e), "diagnostics": diag, "snapshot": snapshot})
+        return error_response(e)
 
 
-__all__ = ['navigate_to_url', 'scroll']
+__all__ = ['navigate_to_url', 'navigate_and_wait_idle', 'navigate_and_wait', 'scroll']
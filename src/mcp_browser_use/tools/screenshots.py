@@ -1,15 +1,42 @@
 """Screenshot capture tool implementations."""
 
 import io
-import json
-import base64
-from typing import Optional
+import binascii
+from typing import Optional, Union
 from ..context import get_context
-from ..utils.diagnostics import collect_diagnostics
+from ..utils.diagnostics import error_response
+from ..utils.jsonio import respond
+from ..utils.executor import selenium_thread
 from ..actions.screenshots import _make_page_snapshot
 
 
-async def take_screenshot(screenshot_path, return_base64, return_snapshot, thumbnail_width=None) -> str:
+# Pillow format name and mode to convert to, per thumbnail format
+_THUMBNAIL_FORMATS = {"webp": ("WEBP", None), "jpeg": ("JPEG", "RGB"), "png": ("PNG", None)}
+
+
+def _encode_thumbnail(img, thumbnail_format: str, quality: int):
+    """Encode a thumbnail image; returns (BytesIO, format actually used)."""
+    from PIL import features
+
+    if thumbnail_format not in _THUMBNAIL_FORMATS:
+        thumbnail_format = "webp"
+    fmt, mode = _THUMBNAIL_FORMATS[thumbnail_format]
+    if fmt == "WEBP" and not features.check("webp"):
+        # Pillow built without libwebp
+        fmt, mode, thumbnail_format = "PNG", None, "png"
+    if mode and img.mode != mode:
+        img = img.convert(mode)
+    buf = io.BytesIO()
+    if fmt == "PNG":
+        img.save(buf, format=fmt, optimize=True)
+    else:
+        img.save(buf, format=fmt, quality=quality, **({"method": 4} if fmt == "WEBP" else {}))
+    return buf, thumbnail_format
+
+
+@selenium_thread
+def take_screenshot(screenshot_path, return_base64, return_snapshot, thumbnail_width=None,
+                    thumbnail_format="webp", thumbnail_quality=80) -> Union[dict, bytes]:
     """
     Take a screenshot of the current page.
 
@@ -19,25 +46,39 @@ async def take_screenshot(screenshot_path, return_base64, return_snapshot, thumb
         return_snapshot: Whether to return page HTML snapshot
         thumbnail_width: Optional width in pixels for thumbnail (requires return_base64=True)
                         Default: 200px if return_base64 is True (accounts for MCP overhead)
+        thumbnail_format: "webp" (default), "jpeg" or "png"; WebP falls back to PNG
+                        when Pillow lacks WebP support
+        thumbnail_quality: WebP/JPEG quality (1-100)
 
     Returns:
-        JSON string with ok status, saved path, optional base64 thumbnail, and snapshot
+        Result dict with ok status, saved path, optional base64 thumbnail, and
+        snapshot. It goes to to_context_pack as is, so the thumbnail is encoded
+        to JSON once, in the pack, rather than encoded, parsed and encoded
+        again. Error payloads are JSON bytes, as from other tools.
     """
     ctx = get_context()
 
     try:
         if not ctx.is_driver_initialized():
-            return json.dumps({"ok": False, "error": "driver_not_initialized"})
+            return respond({"ok": False, "error": "driver_not_initialized"})
+
+        payload = {"ok": True, "saved_to": screenshot_path}
+
+        # Nothing would consume the image, so skip the capture round-trip entirely
+        if not screenshot_path and not return_base64:
+            payload["captured"] = False
+            payload["message"] = "No screenshot_path or return_base64 requested; screenshot not captured."
+            payload["snapshot"] = _make_page_snapshot() if return_snapshot else "Omitted to save tokens."
+            return payload
 
-        # Get full screenshot
+        # Single capture, reused for both the file on disk and the thumbnail
         png_bytes = ctx.driver.get_screenshot_as_png()
 
         # Save full screenshot to disk if path provided
         if screenshot_path:
             with open(screenshot_path, "wb") as f:
                 f.write(png_bytes)
-
-        payload = {"ok": True, "saved_to": screenshot_path}
+            payload["saved_bytes"] = len(png_bytes)
 
         # Handle base64 return with thumbnail
         if return_base64:
@@ -48,7 +89,7 @@ async def take_screenshot(screenshot_path, return_base64, return_snapshot, thumb
 
             # Validate thumbnail width
             if thumbnail_width < 50:
-                return json.dumps({
+                return respond({
                     "ok": False,
                     "error": "thumbnail_width_too_small",
                     "message": "thumbnail_width must be at least 50 pixels",
@@ -58,7 +99,7 @@ async def take_screenshot(screenshot_path, return_base64, return_snapshot, thumb
             try:
                 from PIL import Image
             except ImportError:
-                return json.dumps({
+                return respond({
                     "ok": False,
                     "error": "pillow_not_installed",
                     "message": "Pillow is required for thumbnails. Install with: pip install Pillow",
@@ -76,12 +117,13 @@ async def take_screenshot(screenshot_path, return_base64, return_snapshot, thumb
                 # Resize to thumbnail
                 img.thumbnail((thumbnail_width, thumb_height), Image.Resampling.LANCZOS)
 
-                # Encode thumbnail to base64
-                thumb_buffer = io.BytesIO()
-                img.save(thumb_buffer, format='PNG', optimize=True)
-                thumb_b64 = base64.b64encode(thumb_buffer.getvalue()).decode('utf-8')
+                # Encode thumbnail (WebP is several times smaller than PNG) to base64
+                thumb_buffer, used_format = _encode_thumbnail(img, thumbnail_format, thumbnail_quality)
+                # getbuffer(): no copy of the PNG, unlike getvalue()
+                thumb_b64 = binascii.b2a_base64(thumb_buffer.getbuffer(), newline=False).decode('ascii')
 
                 payload["base64"] = thumb_b64
+                payload["thumbnail_format"] = used_format
                 payload["thumbnail_width"] = thumbnail_width
                 payload["thumbnail_height"] = img.height
                 payload["original_width"] = original_size[0]
@@ -90,7 +132,7 @@ async def take_screenshot(screenshot_path, return_base64, return_snapshot, thumb
 
             except Exception as thumb_error:
                 # Thumbnail failed but full screenshot was saved
-                return json.dumps({
+                return respond({
                     "ok": True,
                     "saved_to": screenshot_path,
                     "thumbnail_error": str(thumb_error),
@@ -102,15 +144,10 @@ async def take_screenshot(screenshot_path, return_base64, return_snapshot, thumb
         else:
             payload["snapshot"] = "Omitted to save tokens."
 
-        return json.dumps(payload)
+        return payload
 
     except Exception as e:
-        diag = collect_diagnostics(ctx.driver, e, ctx.config)
-        if return_snapshot:
-            snapshot = _make_page_snapshot()
-        else:
-            snapshot = "Omitted to save tokens."
-        return json.dumps({"ok": False, "error": str(e), "diagnostics": diag, "snapshot": snapshot})
+        return error_response(e, allow_snapshot=return_snapshot)
 
 
 __all__ = ['take_screenshot']
@@ -1,15 +1,35 @@
 """Diagnostics and debugging information utility functions."""
 
+import os
 import sys
+import json
+import time
+import uuid
+import tempfile
 import platform
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from typing import Optional
 from selenium import webdriver
 import selenium
 
+from .jsonio import dumps, respond
 from ..context import get_context
 from ..browser.chrome_executable import get_chrome_binary_for_platform
 
 
+# Separate from the Selenium worker: error paths queue diagnostics here and
+# return immediately instead of waiting on a possibly broken driver.
+_DIAGNOSTICS_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="diagnostics")
+
+# diagnostics_id -> Future of the post-mortem record (most recent last)
+_QUEUED_DIAGNOSTICS: "OrderedDict[str, Future]" = OrderedDict()
+_QUEUED_DIAGNOSTICS_LOCK = threading.Lock()
+_MAX_PENDING_DIAGNOSTICS = 4
+_MAX_KEPT_DIAGNOSTICS = 32
+
+
 def collect_diagnostics(
     driver: Optional[webdriver.Chrome] = None,
     exc: Optional[Exception] = None,
@@ -82,4 +102,105 @@ def collect_diagnostics(
     return "\n".join(parts)
 
 
-__all__ = ['collect_diagnostics']
+def _diagnostics_path(diagnostics_id: str) -> str:
+    return os.path.join(tempfile.gettempdir(), f"mcp_diag_{diagnostics_id}.json")
+
+
+def _write_diagnostics(diagnostics_id: str, driver, exc: Optional[Exception], config: Optional[dict]) -> dict:
+    record = {
+        "diagnostics_id": diagnostics_id,
+        "error": str(exc) if exc else None,
+        "error_type": type(exc).__name__ if exc else None,
+        "created_at": time.time(),
+        "diagnostics": collect_diagnostics(driver, exc, config),
+    }
+    try:
+        with open(_diagnostics_path(diagnostics_id), "w", encoding="utf-8") as f:
+            f.write(dumps(record))
+    except Exception:
+        pass  # The in-memory record is still available
+    return record
+
+
+def queue_diagnostics(driver, exc: Optional[Exception], config: Optional[dict]) -> Optional[str]:
+    """
+    Collect diagnostics in the background and return an id for get_queued_diagnostics().
+
+    Returns None (nothing queued) if too many post-mortems are already pending,
+    e.g. while a hung driver keeps failing every call.
+    """
+    with _QUEUED_DIAGNOSTICS_LOCK:
+        pending = sum(1 for f in _QUEUED_DIAGNOSTICS.values() if not f.done())
+        if pending >= _MAX_PENDING_DIAGNOSTICS:
+            return None
+        diagnostics_id = uuid.uuid4().hex[:12]
+        _QUEUED_DIAGNOSTICS[diagnostics_id] = _DIAGNOSTICS_EXECUTOR.submit(
+            _write_diagnostics, diagnostics_id, driver, exc, config
+        )
+        while len(_QUEUED_DIAGNOSTICS) > _MAX_KEPT_DIAGNOSTICS:
+            _QUEUED_DIAGNOSTICS.popitem(last=False)
+    return diagnostics_id
+
+
+def get_queued_diagnostics(diagnostics_id: str, timeout: Optional[float] = None) -> dict:
+    """
+    Look up a queued post-mortem, waiting up to `timeout` seconds (default
+    MCP_ERROR_DIAGNOSTICS_TIMEOUT) if it is still being collected.
+    """
+    from ..constants import ERROR_DIAGNOSTICS_TIMEOUT_SECS
+
+    if timeout is None:
+        timeout = ERROR_DIAGNOSTICS_TIMEOUT_SECS
+
+    fut = _QUEUED_DIAGNOSTICS.get(diagnostics_id)
+    if fut is not None:
+        try:
+            return {"ok": True, **fut.result(timeout=timeout)}
+        except FutureTimeoutError:
+            return {"ok": False, "error": "pending", "diagnostics_id": diagnostics_id}
+        except Exception as e:
+            return {"ok": False, "error": f"Diagnostics failed: {e}", "diagnostics_id": diagnostics_id}
+
+    # Evicted from memory (or produced by another process): fall back to the file
+    try:
+        with open(_diagnostics_path(diagnostics_id), "r", encoding="utf-8") as f:
+            return {"ok": True, **json.load(f)}
+    except (FileNotFoundError, ValueError):
+        return {"ok": False, "error": "unknown_diagnostics_id", "diagnostics_id": diagnostics_id}
+
+
+def error_response(exc: Exception, allow_snapshot: bool = True, **extra) -> str:
+    """
+    Build the JSON error payload returned by tool implementations.
+
+    Diagnostics are not collected inline: they are queued for a background
+    post-mortem and the payload carries a `diagnostics_id` that can be passed
+    to the get_diagnostics tool.
+
+    A page snapshot is only attached when MCP_SNAPSHOT_ON_ERROR=1 and the
+    caller allows it.
+
+    Args:
+        exc: The exception that was raised
+        allow_snapshot: Set to False for tools that never return a snapshot
+        **extra: Additional fields merged into the payload
+
+    Returns:
+        str: JSON string with ok=False, error, diagnostics_id and optional snapshot
+    """
+    from ..constants import SNAPSHOT_ON_ERROR
+
+    ctx = get_context()
+    try:
+        diagnostics_id = queue_diagnostics(ctx.driver, exc, ctx.config)
+    except Exception:
+        diagnostics_id = None
+
+    payload = {"ok": False, "error": str(exc), "diagnostics_id": diagnostics_id, **extra}
+    if allow_snapshot and SNAPSHOT_ON_ERROR:
+        from ..actions.screenshots import _make_page_snapshot
+        payload["snapshot"] = _make_page_snapshot()
+    return respond(payload)
+
+
+__all__ = ['collect_diagnostics', 'error_response', 'queue_diagnostics', 'get_queued_diagnostics']
@@ -0,0 +1,29 @@
+"""Dedicated worker thread for blocking Selenium calls."""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+
+# WebDriver sessions are not thread-safe; one worker keeps every Selenium call
+# strictly ordered while the event loop stays free to accept other MCP requests.
+_SELENIUM_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="selenium")
+
+
+def selenium_thread(func: Callable) -> Callable:
+    """
+    Expose a blocking tool implementation as a coroutine function that runs on the
+    Selenium worker thread.
+
+    Callers keep awaiting the tool as before; the intra-process lock is acquired by
+    the decorators on the event loop *before* the work is handed to the thread.
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_SELENIUM_EXECUTOR, functools.partial(func, *args, **kwargs))
+    return wrapper
+
+
+__all__ = ['selenium_thread']
@@ -86,18 +86,47 @@ def remove_unwanted_tags(html_content: str, aggressive: bool = False) -> str:
     return str(soup)
 
 
-def get_cleaned_html(driver, aggressive: bool = False) -> str:
+def _pretruncate_html(raw: str, limit: int) -> str:
+    """
+    Cut raw HTML at the last tag boundary before `limit` chars.
+
+    The parser closes whatever is left open, so cleaning the prefix costs
+    O(limit) instead of O(page) and yields the same leading content.
+    """
+    if len(raw) <= limit:
+        return raw
+    cut = raw.rfind("<", 0, limit)
+    return raw[:cut if cut > 0 else limit]
+
+
+def get_cleaned_html(driver, aggressive: bool = False, max_chars: Optional[int] = None) -> str:
     """
     Get cleaned HTML from the current page.
 
     Args:
         driver: Selenium WebDriver instance
         aggressive: If True, applies aggressive HTML cleaning
+        max_chars: Cap on the returned HTML (defaults to MCP_MAX_SNAPSHOT_CHARS; 0 disables).
+            Pages over twice the cap are cut before parsing rather than after.
 
     Returns:
         Cleaned HTML string
     """
-    html_content = driver.page_source
+    if max_chars is None:
+        from ..constants import MAX_SNAPSHOT_CHARS
+        max_chars = MAX_SNAPSHOT_CHARS
+
+    try:
+        html_content = driver.execute_script("return document.documentElement.outerHTML") or ""
+    except Exception:
+        html_content = ""
+    if not html_content:
+        html_content = driver.page_source
+
+    if max_chars and max_chars > 0:
+        # Leave 2x headroom for markup the cleaner strips
+        html_content = _pretruncate_html(html_content, max_chars * 2)
+        return remove_unwanted_tags(html_content, aggressive=aggressive)[:max_chars]
     return remove_unwanted_tags(html_content, aggressive=aggressive)
 
 
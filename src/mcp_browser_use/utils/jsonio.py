@@ -0,0 +1,142 @@
+"""JSON encoding for tool payloads.
+
+Uses orjson when it is installed (pip install mcp-browser-use[speedups]) and the
+stdlib json module otherwise; dataclass records prefer msgspec when available. Page snapshots carry their own memoized encoding so a
+snapshot served from the cache is not re-escaped on every tool call.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+
+def _orjson_dumps(obj, default):
+    """
+    orjson.dumps, retried with OPT_NON_STR_KEYS when a dict has int/None/...
+    keys (the option costs a key check per dict, so it is only paid on retry).
+    Raises TypeError for objects orjson cannot encode at all.
+    """
+    try:
+        return orjson.dumps(obj, default=default)
+    except TypeError:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def dumps(obj, default=None) -> str:
+    """
+    Serialize `obj` to a JSON string (orjson if available).
+
+    `default` is called for objects neither encoder handles natively (orjson
+    also encodes dataclasses itself).
+    """
+    if orjson is not None:
+        try:
+            return _orjson_dumps(obj, default).decode("utf-8")
+        except TypeError:
+            # Unsupported types, ... - the stdlib encoder is more lenient
+            pass
+    if default is None:
+        return json.dumps(obj)
+    return json.dumps(obj, default=default, ensure_ascii=False)
+
+
+def dumps_bytes(obj, default=None) -> bytes:
+    """Like dumps(), but returns UTF-8 bytes (orjson's native output, no decode)."""
+    if orjson is not None:
+        try:
+            return _orjson_dumps(obj, default)
+        except TypeError:
+            pass
+    return dumps(obj, default=default).encode("utf-8")
+
+
+# enc_hook -> msgspec.json.Encoder. An Encoder keeps its output buffer and hook
+# between calls; msgspec.json.encode(..., enc_hook=) sets both up every time.
+_MSGSPEC_ENCODERS: dict = {}
+
+
+def _msgspec_encoder(enc_hook):
+    encoder = _MSGSPEC_ENCODERS.get(enc_hook)
+    if encoder is None:
+        encoder = _MSGSPEC_ENCODERS[enc_hook] = msgspec.json.Encoder(enc_hook=enc_hook)
+    return encoder
+
+
+def dumps_record(obj, default=None) -> str:
+    """
+    Serialize a dataclass instance that also offers `to_dict()` (e.g. ContextPack).
+
+    msgspec and orjson encode dataclasses natively, reading fields (and nested
+    dataclasses) in C, so the instance is handed over as-is; msgspec is tried
+    first when installed, through an Encoder reused per `default` hook. The
+    stdlib fallback goes through `obj.to_dict()`.
+    """
+    if msgspec is not None:
+        try:
+            return _msgspec_encoder(default).encode(obj).decode("utf-8")
+        except Exception:
+            pass
+    if orjson is not None:
+        try:
+            return _orjson_dumps(obj, default).decode("utf-8")
+        except TypeError:
+            pass
+    return dumps(obj.to_dict(), default=default)
+
+
+def loads(data):
+    """Parse a JSON str/bytes (orjson if available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class Snapshot(dict):
+    """
+    A page snapshot dict ({"url", "title", "html"}) that memoizes its JSON encoding.
+
+    Instances may be shared through the snapshot cache; treat them as read-only.
+    A hex `digest` of the html, when set, is encoded as "html_digest" so the
+    packing side can key its caches without hashing the page again.
+    """
+
+    __slots__ = ("_encoded", "digest")
+
+    def encoded(self) -> bytes:
+        try:
+            return self._encoded
+        except AttributeError:
+            payload = dict(self)
+            digest = getattr(self, "digest", None)
+            if digest:
+                payload["html_digest"] = digest
+            self._encoded = dumps_bytes(payload)
+            return self._encoded
+
+
+def respond(payload: dict) -> bytes:
+    """
+    Serialize a tool payload to UTF-8 JSON bytes. A `Snapshot` under "snapshot" is
+    spliced in from its memoized encoding instead of being encoded again.
+
+    Tool results stay bytes until the MCP boundary: to_context_pack parses them
+    as-is and the tool decorators decode anything returned directly, so the
+    (snapshot-sized) payload is never decoded to str only to be parsed again.
+    """
+    snap = payload.get("snapshot")
+    if not isinstance(snap, Snapshot):
+        return dumps_bytes(payload)
+    rest = dumps_bytes({k: v for k, v in payload.items() if k != "snapshot"})
+    sep = b"" if rest == b"{}" else b","
+    return rest[:-1] + sep + b'"snapshot":' + snap.encoded() + b"}"
+
+
+__all__ = ['dumps', 'dumps_bytes', 'dumps_record', 'loads', 'respond', 'Snapshot']
@@ -0,0 +1,173 @@
+"""Tests for the exclusive-create fast path of the cross-process softlock."""
+
+import pytest
+
+from mcp_browser_use.locking import action_lock, file_mutex
+
+
+@pytest.fixture
+def lock_paths(tmp_path, monkeypatch):
+    paths = (str(tmp_path / "k.softlock.json"), str(tmp_path / "k.softlock.mutex"), str(tmp_path / "k.start.mutex"))
+    monkeypatch.setattr(file_mutex, "_lock_paths", lambda owner=None: paths)
+    return paths
+
+
+def test_free_lock_is_taken_without_the_mutex(lock_paths, monkeypatch):
+    def _no_mutex(*a, **k):
+        raise AssertionError("mutex should not be needed for a free lock")
+
+    monkeypatch.setattr(file_mutex, "_file_mutex", _no_mutex)
+    res = action_lock._acquire_softlock("a", ttl=30, wait=False)
+    assert res["acquired"] is True
+    assert action_lock._read_softlock(lock_paths[0])["owner"] == "a"
+
+
+def test_create_is_all_or_nothing(lock_paths, tmp_path):
+    assert action_lock._create_softlock(lock_paths[0], {"owner": "a", "expires_at": 1.0})
+    assert action_lock._create_softlock(lock_paths[0], {"owner": "b", "expires_at": 2.0}) is False
+    assert action_lock._read_softlock(lock_paths[0]) == {"owner": "a", "expires_at": 1.0}
+    assert [p.name for p in tmp_path.iterdir()] == ["k.softlock.json"]
+
+
+def test_unreadable_lock_file_counts_as_held_until_stale(lock_paths):
+    import os
+
+    open(lock_paths[0], "w").close()  # a softlock being created elsewhere
+    busy = action_lock._acquire_softlock("b", ttl=30, wait=False)
+    assert busy["acquired"] is False
+    assert os.path.getsize(lock_paths[0]) == 0
+
+    os.utime(lock_paths[0], (0, 0))
+    assert action_lock._acquire_softlock("b", ttl=30, wait=False)["acquired"]
+    assert action_lock._read_softlock(lock_paths[0])["owner"] == "b"
+
+
+def test_held_lock_blocks_other_owner_until_released(lock_paths):
+    assert action_lock._acquire_softlock("a", ttl=30, wait=False)["acquired"]
+    assert action_lock._acquire_softlock("a", ttl=30, wait=False)["acquired"]
+
+    busy = action_lock._acquire_softlock("b", ttl=30, wait=False)
+    assert busy["acquired"] is False and busy["owner"] == "a"
+
+    assert action_lock._release_action_lock("a") is True
+    assert action_lock._acquire_softlock("b", ttl=30, wait=False)["acquired"]
+
+
+def test_expired_lock_is_stolen(lock_paths):
+    action_lock._write_softlock(lock_paths[0], {"owner": "a", "expires_at": 0})
+    res = action_lock._acquire_softlock("b", ttl=30, wait=False)
+    assert res["acquired"] is True
+    assert action_lock._read_softlock(lock_paths[0])["owner"] == "b"
+
+
+def test_renew_after_release_does_not_clobber_new_owner(lock_paths, monkeypatch):
+    monkeypatch.setattr("mcp_browser_use.locking.window_registry._update_window_heartbeat", lambda owner: None)
+    action_lock._acquire_softlock("a", ttl=30, wait=False)
+    action_lock._release_action_lock("a")
+    assert action_lock._acquire_softlock("b", ttl=30, wait=False)["acquired"]
+    assert action_lock._renew_action_lock("a", ttl=30) is False
+    assert action_lock._read_softlock(lock_paths[0])["owner"] == "b"
+
+
+def test_successful_tool_releases_lock_and_failed_tool_keeps_it(lock_paths, monkeypatch):
+    from mcp_browser_use.decorators.locking import _finish_action_lock
+
+    monkeypatch.setattr("mcp_browser_use.locking.window_registry._update_window_heartbeat", lambda owner: None)
+    monkeypatch.setattr("mcp_browser_use.constants.RELEASE_LOCK_ON_SUCCESS", True)
+
+    action_lock._acquire_softlock("a", ttl=30, wait=False)
+    _finish_action_lock("a", '{"ok": false, "error": "timeout"}')
+    assert action_lock._read_softlock(lock_paths[0])["owner"] == "a"
+
+    _finish_action_lock("a", '{"ok": true}')
+    assert action_lock._read_softlock(lock_paths[0]) == {}
+
+
+def test_result_ok_reads_only_the_top_level_status():
+    import asyncio
+    import mcp_browser_use.helpers_context as hc
+    from mcp_browser_use.decorators.locking import _result_ok
+
+    batch = '{"ok": true, "steps": [{"step": 0, "ok": false}], "errors": [{"details": {"ok":false}}]}'
+    assert _result_ok(batch) and _result_ok(batch.encode())
+    assert not _result_ok('{"ok": false, "error": "timeout"}')
+    assert not _result_ok(b'{"ok":false}')
+
+    snapshot = {"url": "https://e.com/", "title": "T", "html": "<p>x</p>"}
+    packed = [
+        asyncio.run(hc.to_context_pack({"ok": ok, "snapshot": snapshot}, "text", 1))
+        for ok in (True, False)
+    ]
+    assert [_result_ok(p) for p in packed] == [True, False]
+
+
+def test_rw_lock_readers_overlap_and_writers_exclude():
+    import asyncio
+
+    async def scenario():
+        lock = action_lock.BrowserRWLock()
+        log = []
+
+        async def reader(name):
+            async with lock.reader:
+                log.append(f"{name}+")
+                await asyncio.sleep(0.02)
+                log.append(f"{name}-")
+
+        async def writer():
+            await asyncio.sleep(0.005)
+            async with lock:
+                log.append("w+")
+                log.append("w-")
+
+        async def late_reader():
+            await asyncio.sleep(0.01)
+            await reader("r3")
+
+        await asyncio.gather(reader("r1"), reader("r2"), writer(), late_reader())
+        return log
+
+    log = asyncio.run(scenario())
+    # Both early readers are in before either leaves; the writer waits for
+    # them, and the reader arriving after the writer queued goes last.
+    assert log[:2] == ["r1+", "r2+"]
+    assert log.index("w+") > log.index("r2-")
+    assert log.index("r3+") > log.index("w-")
+
+
+def test_last_reader_out_reports_the_group_outcome():
+    import asyncio
+
+    async def scenario():
+        lock = action_lock.BrowserRWLock()
+        await lock._acquire_read()
+        await lock._acquire_read()
+        first = lock.reader_done(False)
+        await lock._release_read()
+        last = lock.reader_done(True)
+        await lock._release_read()
+        await lock._acquire_read()
+        alone = lock.reader_done(True)
+        await lock._release_read()
+        return first, last, alone
+
+    assert asyncio.run(scenario()) == (None, False, True)
+
+
+def test_window_scope_gives_each_owner_its_own_softlock(tmp_path, monkeypatch):
+    import mcp_browser_use.constants as constants
+    import mcp_browser_use.config.environment as environment
+    import mcp_browser_use.config.paths as config_paths
+
+    monkeypatch.setattr(environment, "get_env_config", lambda: {})
+    monkeypatch.setattr(environment, "profile_key", lambda cfg: "prof")
+    monkeypatch.setattr(config_paths, "get_lock_dir", lambda: str(tmp_path))
+
+    monkeypatch.setattr(constants, "ACTION_LOCK_SCOPE", "window")
+    assert file_mutex._lock_paths("agent:a")[2] == file_mutex._lock_paths("agent:b")[2]
+    assert action_lock._acquire_softlock("agent:a", ttl=30, wait=False)["acquired"]
+    assert action_lock._acquire_softlock("agent:b", ttl=30, wait=False)["acquired"]
+
+    monkeypatch.setattr(constants, "ACTION_LOCK_SCOPE", "profile")
+    assert action_lock._acquire_softlock("agent:a", ttl=30, wait=False)["acquired"]
+    assert action_lock._acquire_softlock("agent:b", ttl=30, wait=False)["acquired"] is False
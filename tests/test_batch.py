@@ -0,0 +1,89 @@
+"""Tests for the batch step runner."""
+
+import asyncio
+import json
+
+import pytest
+
+import mcp_browser_use.tools.batch as batch
+from mcp_browser_use.context import get_context, reset_context
+
+
+@pytest.fixture
+def event_loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def fake_steps(monkeypatch):
+    reset_context()
+    calls = []
+
+    def make(name, ok=True):
+        async def step(**kwargs):
+            calls.append((name, kwargs, get_context().defer_snapshots))
+            payload = {"ok": ok, "action": name}
+            if not ok:
+                payload["error"] = "boom"
+            return json.dumps(payload)
+        return step
+
+    monkeypatch.setattr(batch, "_BATCH_STEPS", {
+        "fill_text": (make("fill_text"), {"clear_first": True}),
+        "click_element": (make("click_element"), {}),
+        "broken": (make("broken", ok=False), {}),
+    })
+    yield calls
+    reset_context()
+
+
+def test_only_last_step_captures_snapshot(event_loop, fake_steps):
+    steps = [
+        {"tool": "fill_text", "args": {"selector": "#q", "text": "x"}},
+        {"tool": "mcp_browser_use__click_element", "args": {"selector": "#go"}},
+    ]
+    out = json.loads(event_loop.run_until_complete(batch.run_batch(steps)))
+
+    assert [c[2] for c in fake_steps] == [True, False]
+    assert fake_steps[0][1] == {"clear_first": True, "selector": "#q", "text": "x"}
+    assert out["action"] == "click_element"
+    assert out["steps"] == [
+        {"step": 0, "tool": "fill_text", "ok": True},
+        {"step": 1, "tool": "click_element", "ok": True},
+    ]
+    assert get_context().defer_snapshots is False
+
+
+def test_expectation_step_is_rendered(event_loop, fake_steps):
+    async def render(result_json):
+        return json.dumps({"rendered": json.loads(result_json)["action"]})
+
+    steps = [
+        {"tool": "fill_text", "args": {}, "expectation": True},
+        {"tool": "click_element", "args": {}},
+    ]
+    out = json.loads(event_loop.run_until_complete(batch.run_batch(steps, render=render)))
+
+    assert [c[2] for c in fake_steps] == [False, False]
+    assert out["steps"][0]["pack"] == {"rendered": "fill_text"}
+
+
+def test_stop_on_error(event_loop, fake_steps):
+    steps = [{"tool": "broken"}, {"tool": "click_element"}]
+    out = json.loads(event_loop.run_until_complete(batch.run_batch(steps)))
+
+    assert out["ok"] is False
+    assert out["stopped_at"] == 0
+    assert [c[0] for c in fake_steps] == ["broken"]
+
+
+def test_unknown_tool_is_reported(event_loop, fake_steps):
+    out = json.loads(event_loop.run_until_complete(
+        batch.run_batch([{"tool": "nope"}, {"tool": "click_element"}], stop_on_error=False)
+    ))
+
+    assert out["steps"][0]["ok"] is False
+    assert "unsupported" in out["steps"][0]["error"]
+    assert out["ok"] is True
@@ -0,0 +1,126 @@
+"""Tests for budget-bounded cleaning in pack_snapshot."""
+
+import mcp_browser_use.helpers_context as hc
+
+BIG = "<html><body>" + "".join(f"<div><p>Item {i} description text</p></div>" for i in range(5000)) + "</body></html>"
+
+
+def _full(mode, **kw):
+    return hc.pack_snapshot(window_tag=None, url=None, title=None, raw_html=BIG, return_mode=mode,
+                            cleaning_level=2, token_budget=None, **kw)
+
+
+def test_html_mode_cleans_only_a_prefix(monkeypatch):
+    seen = []
+    real = hc.basic_prune
+
+    def spy(html, level):
+        seen.append(len(html))
+        return real(html=html, level=level)
+
+    full = _full("html").html
+    hc._CLEANED_CACHE.clear()
+    monkeypatch.setattr(hc, "basic_prune", spy)
+    cp = hc.pack_snapshot(window_tag=None, url=None, title=None, raw_html=BIG, return_mode="html",
+                          cleaning_level=2, token_budget=500, html_offset=1000)
+
+    assert max(seen) < len(BIG) // 2
+    assert cp.hard_capped is True
+    assert cp.html == full[1000:1000 + 2000]
+
+
+def test_text_mode_matches_full_cleaning():
+    full = _full("text").text
+    cp = hc.pack_snapshot(window_tag=None, url=None, title=None, raw_html=BIG, return_mode="text",
+                          cleaning_level=2, token_budget=300, text_offset=50)
+    assert cp.text == full[50:50 + 1200]
+
+
+def test_small_page_is_cleaned_whole():
+    page = "<html><body><p>short</p></body></html>"
+    cp = hc.pack_snapshot(window_tag=None, url=None, title=None, raw_html=page, return_mode="html",
+                          cleaning_level=2, token_budget=1000)
+    assert "short" in cp.html and cp.hard_capped is False
+
+
+def test_offset_pagination_reuses_one_cleaning_pass(monkeypatch):
+    hc._CLEANED_CACHE.clear()
+    calls = []
+    real = hc.basic_prune
+
+    def counting(html, level):
+        calls.append(len(html))
+        return real(html=html, level=level)
+
+    monkeypatch.setattr(hc, "basic_prune", counting)
+    pages = [
+        hc.pack_snapshot(window_tag=None, url=None, title=None, raw_html=BIG, return_mode="html",
+                         cleaning_level=2, token_budget=500, html_offset=offset).html
+        for offset in (0, 2000, 4000)
+    ]
+
+    assert len(calls) == 1
+    assert "".join(pages) == _full("html").html[:6000]
+
+
+def test_outline_is_capped_by_budget():
+    page = "<html><body>" + "".join(f"<h2>Heading {i}</h2>" for i in range(100)) + "</body></html>"
+    small = hc.pack_snapshot(window_tag=None, url=None, title=None, raw_html=page, return_mode="outline",
+                             cleaning_level=2, token_budget=400)
+    assert len(small.outline) == 10
+    assert small.hard_capped is True
+    assert [o["text"] for o in small.outline] == [f"Heading {i}" for i in range(10)]
+
+    large = hc.pack_snapshot(window_tag=None, url=None, title=None, raw_html=page, return_mode="outline",
+                             cleaning_level=2, token_budget=5000)
+    assert len(large.outline) == 64
+
+
+def test_page_is_hashed_once_per_pack(monkeypatch):
+    calls = []
+    content_hash = hc._content_hash
+
+    def counting_hash(data):
+        calls.append(len(data))
+        return content_hash(data)
+
+    monkeypatch.setattr(hc, "_content_hash", counting_hash)
+    hc._PACK_CACHE.clear()
+    html = BIG.replace("Item 1 ", "Item one ")
+    snap = {"url": "u", "title": "t", "html": html}
+    cp = hc._pack_cached(snap, None, "text", 2, 300, 50, None, False, None)
+    assert cp.text and len(cp.text) == 1200
+    assert calls == [len(html)]
+
+
+def test_outline_token_count_matches_joined_text():
+    from mcp_browser_use.cleaners import approx_token_count
+
+    for outline in ([], [{"text": "abc"}], [{"text": "hello world"}, {"text": "x" * 30}, {"text": ""}]):
+        assert hc._outline_tokens(outline) == approx_token_count(" ".join(o["text"] for o in outline))
+
+
+def test_cleaned_cache_is_bounded_by_size(monkeypatch):
+    import mcp_browser_use.constants as constants
+
+    hc._CLEANED_CACHE.clear()
+    monkeypatch.setattr(constants, "CLEANED_CACHE_MAX_CHARS", 100)
+    for i in range(3):
+        hc._clean_cached(f"<html><body><p>{'x' * 80} {i}</p></body></html>", 2, "html", None)
+    # Each cleaned page exceeds half the bound, so only the newest is kept
+    assert len(hc._CLEANED_CACHE) == 1
+    (cleaned, *_), = hc._CLEANED_CACHE.values()
+    assert cleaned.endswith("2</p></body></html>")
+    hc._CLEANED_CACHE.clear()
+
+
+def test_content_hash_prefers_xxhash(monkeypatch):
+    import hashlib
+    import types
+
+    fake = types.SimpleNamespace(xxh3_64_digest=lambda data: b"x" * 8)
+    monkeypatch.setattr(hc, "xxhash", fake)
+    assert hc.html_digest("<p>a</p>") == b"x" * 8
+
+    monkeypatch.setattr(hc, "xxhash", None)
+    assert hc.html_digest("<p>a</p>") == hashlib.blake2b(b"<p>a</p>", digest_size=8).digest()
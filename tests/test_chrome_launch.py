@@ -0,0 +1,36 @@
+"""Tests for the Chrome launch settle wait."""
+
+import sys
+import time
+import socket
+import subprocess
+
+from mcp_browser_use.browser.chrome_launcher import _wait_for_launch
+
+
+def _spawn(code):
+    return subprocess.Popen([sys.executable, "-c", code])
+
+
+def test_returns_when_process_exits():
+    proc = _spawn("pass")
+    t0 = time.monotonic()
+    _wait_for_launch(proc, port=1, timeout=5.0)
+    assert time.monotonic() - t0 < 4.0
+    assert proc.poll() is not None
+
+
+def test_returns_when_port_accepts():
+    srv = socket.socket()
+    srv.bind(("127.0.0.1", 0))
+    srv.listen(1)
+    proc = _spawn("import time; time.sleep(10)")
+    try:
+        t0 = time.monotonic()
+        _wait_for_launch(proc, port=srv.getsockname()[1], timeout=5.0)
+        assert time.monotonic() - t0 < 2.0
+        assert proc.poll() is None
+    finally:
+        proc.kill()
+        proc.wait()
+        srv.close()
@@ -148,6 +148,29 @@ def test_level_based_cleaning():
     assert counts_2['class_drops'] >= counts_1['class_drops']
 
 
+def test_noise_tags_removed_in_one_walk():
+    """Noise tags and non-canonical links are found by a single find_all."""
+    from bs4 import BeautifulSoup
+
+    html = (
+        "<html><head><link rel=stylesheet href=a.css><link rel=canonical href=/x>"
+        "<noscript><style>.n{}</style></noscript></head><body>"
+        "<svg><style>.s{}</style><canvas></canvas></svg><script>1</script><p>kept</p></body></html>"
+    )
+    soup = BeautifulSoup(html, "html.parser")
+    walks = []
+    find_all = soup.find_all
+    soup.find_all = lambda *a, **kw: walks.append(a) or find_all(*a, **kw)
+    counts = {"script": 0, "style": 0, "noise": 0}
+    _remove_scripts_and_styles(soup, counts)
+
+    assert len(walks) == 1
+    assert counts == {"script": 1, "style": 2, "noise": 4}
+    out = str(soup)
+    assert "kept" in out and 'rel="canonical"' in out
+    assert "<svg" not in out and "<style" not in out and "a.css" not in out
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("Testing cleaners.py refactoring...")
@@ -0,0 +1,24 @@
+"""create_webdriver talks to chromedriver over a direct, kept-alive connection."""
+
+import warnings
+
+import mcp_browser_use.browser.driver as driver_mod
+
+
+def test_chromedriver_connection_bypasses_env_proxy(monkeypatch, tmp_path):
+    created = {}
+
+    class FakeChrome:
+        def __init__(self, service=None, options=None, keep_alive=None):
+            created.update(options=options, keep_alive=keep_alive)
+
+    monkeypatch.setenv("HTTP_PROXY", "http://proxy.invalid:3128")
+    monkeypatch.delenv("MCP_USER_AGENT", raising=False)
+    monkeypatch.setattr(driver_mod.webdriver, "Chrome", FakeChrome)
+    monkeypatch.setattr(driver_mod, "chromedriver_log_path", lambda config: str(tmp_path / "cd.log"))
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        driver_mod.create_webdriver("127.0.0.1", 9222, {})
+
+    assert created["keep_alive"] is True
+    assert created["options"]._ignore_local_proxy is True
@@ -0,0 +1,94 @@
+"""Tests for the interactive snapshot detail level."""
+
+import asyncio
+import json
+
+import mcp_browser_use.__main__ as server_main
+import mcp_browser_use.helpers_context as hc
+from mcp_browser_use.actions.screenshots import _MUTATION_SIGNATURE_JS
+from mcp_browser_use.cleaners import interactive_prune
+from mcp_browser_use.context import get_context, reset_context
+from mcp_browser_use.tools import navigation
+
+
+PAGE = (
+    '<html><body>'
+    '<div class="wrap" data-x="1"><p class="lead">' + "lorem " * 100 + '</p><h2 class="t">Heading</h2></div>'
+    '<form action="/s" class="f"><label class="l">Name</label><input name="q" class="i"></form>'
+    '<div role="button" class="r" tabindex="0">Go</div>'
+    '<script>var x = 1;</script>'
+    '</body></html>'
+)
+
+
+def test_interactive_keeps_actionable_elements_with_attributes():
+    out = interactive_prune(PAGE)
+    assert '<form action="/s" class="f">' in out
+    assert 'name="q"' in out
+    assert 'role="button"' in out
+    assert "<script" not in out
+
+
+def test_interactive_summarizes_long_text_and_strips_other_attributes():
+    out = interactive_prune(PAGE)
+    assert 'class="wrap"' not in out and 'class="lead"' not in out
+    assert "kB)" in out
+    assert "<h2>Heading</h2>" in out
+    assert len(out) < len(PAGE) / 2
+
+
+def _pack(result, level=None):
+    return json.loads(asyncio.run(hc.to_context_pack(
+        result, return_mode="html", cleaning_level=0, token_budget=None, detail_level=level,
+    )))
+
+
+_RESULT = json.dumps({"ok": True, "snapshot": {"url": "https://e.com/", "title": "T", "html": PAGE}})
+
+
+def test_to_context_pack_routes_detail_level():
+    full, interactive, minimal = _pack(_RESULT, "full"), _pack(_RESULT, "interactive"), _pack(_RESULT, "minimal")
+    assert 'class="wrap"' in full["html"]
+    assert 'class="wrap"' not in interactive["html"] and 'name="q"' in interactive["html"]
+    assert minimal["html"] == "" and minimal["url"] == "https://e.com/"
+
+
+def test_env_default_applies_when_no_level_is_given(monkeypatch):
+    monkeypatch.setattr("mcp_browser_use.constants.DEFAULT_DETAIL_LEVEL", "interactive")
+    assert 'class="wrap"' not in _pack(_RESULT)["html"]
+    monkeypatch.setattr("mcp_browser_use.constants.DEFAULT_DETAIL_LEVEL", "full")
+    assert 'class="wrap"' in _pack(_RESULT)["html"]
+
+
+class _PageDriver:
+    """Driver stub that serves PAGE to the snapshot capture."""
+
+    class switch_to:
+        @staticmethod
+        def default_content():
+            pass
+
+    current_url = "https://e.com/"
+    title = "T"
+
+    def execute_script(self, script, *args):
+        if script == _MUTATION_SIGNATURE_JS:
+            return [[1.0, 0, self.current_url], PAGE] if args and args[0] else [1.0, 0, self.current_url]
+        return "complete"
+
+
+def test_navigate_and_wait_full_overrides_interactive_default(monkeypatch):
+    monkeypatch.setattr("mcp_browser_use.constants.DEFAULT_DETAIL_LEVEL", "interactive")
+    monkeypatch.setattr("mcp_browser_use.constants.SNAPSHOT_SETTLE_MS", 0)
+    monkeypatch.setattr(navigation, "_load", lambda *a, **k: None)
+    monkeypatch.setattr(navigation, "_wait_for_condition", lambda *a, **k: None)
+    reset_context()
+    get_context().driver = _PageDriver()
+    try:
+        out = json.loads(asyncio.run(server_main.mcp_browser_use__navigate_and_wait.__wrapped__(
+            url="https://e.com/", selector="form", return_mode="html", cleaning_level=0,
+            token_budget=None, detail_level="full",
+        )))
+    finally:
+        reset_context()
+    assert 'class="wrap"' in out["html"] and "lorem" in out["html"]
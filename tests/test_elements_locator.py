@@ -0,0 +1,89 @@
+from selenium.webdriver.common.by import By
+
+from mcp_browser_use.actions.elements import _locator, get_by_selector
+
+
+def test_get_by_selector_is_case_insensitive():
+    assert get_by_selector("CSS") == By.CSS_SELECTOR
+    assert get_by_selector("xpath") == By.XPATH
+    assert get_by_selector("invalid") is None
+
+
+def test_locator_returns_cached_tuple():
+    _locator.cache_clear()
+    first = _locator("css", "button.submit")
+    second = _locator("css", "button.submit")
+    assert first == (By.CSS_SELECTOR, "button.submit")
+    assert first is second
+    assert _locator.cache_info().hits == 1
+
+
+def test_locator_unsupported_type_returns_none():
+    assert _locator("bogus", "x") is None
+
+
+def test_extract_field_reuses_cached_locator():
+    from mcp_browser_use.actions.extraction import _extract_field_from_container
+
+    class Container:
+        def __init__(self):
+            self.calls = []
+
+        def find_element(self, by, value):
+            self.calls.append((by, value))
+
+            class El:
+                def get_attribute(self, name):
+                    return "https://example.com"
+            return El()
+
+    _locator.cache_clear()
+    spec = {"selector": "a.title", "attribute": "href"}
+    containers = [Container() for _ in range(3)]
+    values = [_extract_field_from_container(c, spec, ctx=None) for c in containers]
+
+    assert values == ["https://example.com"] * 3
+    assert all(c.calls == [(By.CSS_SELECTOR, "a.title")] for c in containers)
+    assert _locator.cache_info().misses == 1
+
+
+def test_structured_extraction_compiles_field_specs_once(monkeypatch):
+    from mcp_browser_use.actions import extraction
+
+    compiled = []
+    real_compile = extraction._compile_field
+    monkeypatch.setattr(
+        extraction, "_compile_field",
+        lambda spec: compiled.append(spec) or real_compile(spec),
+    )
+
+    class El:
+        def get_attribute(self, name):
+            return "price: 42 EUR"
+
+    class Container:
+        def find_element(self, by, value):
+            return El()
+
+    containers = [Container() for _ in range(4)]
+
+    class Driver:
+        def find_elements(self, by, value):
+            return containers
+
+    class Ctx:
+        driver = Driver()
+
+    monkeypatch.setattr(extraction, "get_context", lambda: Ctx())
+    monkeypatch.setattr(extraction, "WebDriverWait", lambda *a: type("W", (), {"until": lambda self, c: True})())
+
+    import asyncio
+    fields = [
+        {"field_name": "price", "selector": ".p", "attribute": "data-x", "regex": r"(\d+)"},
+        {"field_name": "raw", "selector": ".p", "attribute": "data-x", "regex": "("},
+    ]
+    items = asyncio.run(extraction._extract_structured(".item", fields=fields))
+
+    assert len(compiled) == 2
+    assert [i["price"] for i in items] == ["42"] * 4
+    assert [i["raw"] for i in items] == ["price: 42 EUR"] * 4
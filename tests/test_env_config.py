@@ -0,0 +1,30 @@
+"""Tests for the cached get_env_config()."""
+
+import pytest
+
+from mcp_browser_use.config.environment import get_env_config, invalidate_env_config
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(monkeypatch, tmp_path):
+    for var in ("BETA_EXECUTABLE_PATH", "CANARY_EXECUTABLE_PATH", "CHROME_PROFILE_NAME"):
+        monkeypatch.delenv(var, raising=False)
+    monkeypatch.setenv("CHROME_PROFILE_USER_DATA_DIR", str(tmp_path / "a"))
+    invalidate_env_config()
+    yield
+    invalidate_env_config()
+
+
+def test_env_is_read_once_until_invalidated(monkeypatch, tmp_path):
+    first = get_env_config()
+    monkeypatch.setenv("CHROME_PROFILE_USER_DATA_DIR", str(tmp_path / "b"))
+    assert get_env_config()["user_data_dir"] == first["user_data_dir"]
+
+    invalidate_env_config()
+    assert get_env_config()["user_data_dir"] == str(tmp_path / "b")
+
+
+def test_callers_get_independent_copies():
+    cfg = get_env_config()
+    cfg["profile_name"] = "mutated"
+    assert get_env_config()["profile_name"] == "Default"
@@ -0,0 +1,53 @@
+"""Tests for the shared tool error payload."""
+
+import json
+import time
+
+import mcp_browser_use.constants as constants
+import mcp_browser_use.utils.diagnostics as diagnostics
+
+
+def test_error_response_omits_snapshot_by_default(monkeypatch):
+    monkeypatch.setattr(constants, "SNAPSHOT_ON_ERROR", False)
+    monkeypatch.setattr(diagnostics, "collect_diagnostics", lambda *a: "diag")
+
+    payload = json.loads(diagnostics.error_response(ValueError("boom"), selector="#x"))
+    diagnostics_id = payload.pop("diagnostics_id")
+
+    assert payload == {"ok": False, "error": "boom", "selector": "#x"}
+
+    record = diagnostics.get_queued_diagnostics(diagnostics_id, timeout=1.0)
+    assert record["ok"] is True
+    assert record["diagnostics"] == "diag"
+    assert record["error"] == "boom"
+
+
+def test_error_response_does_not_wait_for_diagnostics(monkeypatch):
+    monkeypatch.setattr(constants, "SNAPSHOT_ON_ERROR", False)
+
+    def slow(*_args):
+        time.sleep(0.3)
+        return "late"
+
+    monkeypatch.setattr(diagnostics, "collect_diagnostics", slow)
+
+    started = time.monotonic()
+    payload = json.loads(diagnostics.error_response(RuntimeError("hung")))
+    assert time.monotonic() - started < 0.1
+
+    pending = diagnostics.get_queued_diagnostics(payload["diagnostics_id"], timeout=0.01)
+    assert pending["error"] == "pending"
+
+    record = diagnostics.get_queued_diagnostics(payload["diagnostics_id"], timeout=2.0)
+    assert record["diagnostics"] == "late"
+
+
+def test_queued_diagnostics_fall_back_to_file(monkeypatch):
+    monkeypatch.setattr(diagnostics, "collect_diagnostics", lambda *a: "on-disk")
+
+    diagnostics_id = diagnostics.queue_diagnostics(None, ValueError("x"), None)
+    diagnostics.get_queued_diagnostics(diagnostics_id, timeout=1.0)
+    diagnostics._QUEUED_DIAGNOSTICS.pop(diagnostics_id)
+
+    assert diagnostics.get_queued_diagnostics(diagnostics_id)["diagnostics"] == "on-disk"
+    assert diagnostics.get_queued_diagnostics("nope")["error"] == "unknown_diagnostics_id"
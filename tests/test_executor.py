@@ -0,0 +1,19 @@
+"""Tests for the Selenium worker-thread executor."""
+
+import asyncio
+import threading
+
+from mcp_browser_use.utils.executor import selenium_thread
+
+
+def test_selenium_thread_runs_blocking_tool_off_the_event_loop():
+    @selenium_thread
+    def blocking_tool(value):
+        return threading.current_thread().name, value
+
+    async def run():
+        return await blocking_tool(value=3)
+
+    name, value = asyncio.run(run())
+    assert name.startswith("selenium")
+    assert value == 3
@@ -0,0 +1,79 @@
+"""Extraction results are reused while the page's DOM is unchanged."""
+
+import asyncio
+import json
+
+import pytest
+
+import mcp_browser_use.constants as constants
+import mcp_browser_use.actions.extraction as extraction
+from mcp_browser_use.actions.screenshots import _make_page_snapshot, _MUTATION_SIGNATURE_JS
+from mcp_browser_use.context import get_context, reset_context
+
+
+class _SwitchTo:
+    def default_content(self):
+        pass
+
+
+class FakeDriver:
+    def __init__(self):
+        self.switch_to = _SwitchTo()
+        self.current_url = "https://example.com/"
+        self.title = "Example"
+        self.mutations = 0
+
+    def execute_script(self, script, *args):
+        if script == _MUTATION_SIGNATURE_JS:
+            sig = [1.0, self.mutations, self.current_url]
+            return [sig, "<html><body><h1>Hi</h1></body></html>"] if args and args[0] else sig
+        if "readyState" in script:
+            return "complete"
+        raise AssertionError(f"unexpected script: {script[:40]}")
+
+
+@pytest.fixture
+def driver(monkeypatch):
+    monkeypatch.setattr(constants, "SNAPSHOT_SETTLE_MS", 0)
+    reset_context()
+    get_context().driver = FakeDriver()
+    runs = []
+
+    async def uncached(**kwargs):
+        runs.append(kwargs["container_selector"])
+        _make_page_snapshot()
+        return {"ok": True, "run": len(runs)}
+
+    monkeypatch.setattr(extraction, "_extract_elements_uncached", uncached)
+    yield runs
+    reset_context()
+
+
+def _extract(container=".row"):
+    return asyncio.run(extraction.extract_elements(container_selector=container))
+
+
+def test_unchanged_dom_reuses_extraction(driver):
+    _make_page_snapshot()
+    assert _extract() == _extract()
+    assert driver == [".row"]
+    _extract(".card")
+    assert driver == [".row", ".card"]
+
+
+def test_cached_result_is_the_same_dict(driver):
+    _make_page_snapshot()
+    first = asyncio.run(extraction.extract_elements_data(container_selector=".row"))
+    assert asyncio.run(extraction.extract_elements_data(container_selector=".row")) is first
+    assert json.loads(_extract()) == first
+    assert driver == [".row"]
+
+
+def test_mutation_or_invalidation_reruns_extraction(driver):
+    _make_page_snapshot()
+    _extract()
+    get_context().driver.mutations += 1
+    _extract()
+    get_context().invalidate_snapshot()
+    _extract()
+    assert driver == [".row", ".row", ".row"]
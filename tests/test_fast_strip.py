@@ -0,0 +1,70 @@
+"""The selectolax pre-pass in basic_prune must match the BeautifulSoup phases."""
+
+import pytest
+
+import mcp_browser_use.cleaners as cleaners
+
+pytest.importorskip("selectolax")
+
+PAGE = (
+    "<html><head><title>T</title><meta charset=utf-8><link rel=stylesheet href=a.css>"
+    "<link rel=canonical href=/x><style>.a{b:c}</style></head><body>"
+    + "".join(
+        f'<div class="card" id="c{i}"><!-- c{i} --><script>var x="<p>";</script><h2>Title {i}</h2>'
+        f'<p>Item {i} &amp; desc&nbsp;text <a href="/p/{i}">link</a></p><svg><path d="M0"/></svg></div>'
+        for i in range(50)
+    )
+    + '<div id="ads-top"><div class="sr-only">x</div></div><p hidden>h</p><p aria-hidden=" TRUE ">a</p>'
+    + '<div style="Display: none"><span class="cookie  banner">c</span></div><span class="cookie\tbanner">c</span>'
+    + '<form><input type=HIDDEN name=t><input type=text name=q><select>'
+    + "".join(f"<option>{i}</option>" for i in range(8))
+    + "</select></form></body></html>"
+)
+
+
+@pytest.mark.parametrize("prune_hidden", [True, False])
+@pytest.mark.parametrize("level", [0, 2, 3])
+def test_fast_strip_matches_soup_phases(monkeypatch, level, prune_hidden):
+    monkeypatch.setattr(cleaners, "_FAST_STRIP_MIN_CHARS", 10**12)
+    slow = cleaners.basic_prune(PAGE, level, prune_hidden=prune_hidden)
+    monkeypatch.setattr(cleaners, "_FAST_STRIP_MIN_CHARS", 0)
+    assert cleaners.basic_prune(PAGE, level, prune_hidden=prune_hidden) == slow
+    assert "<script" not in slow[0] and 'rel="canonical"' in slow[0]
+    if level and prune_hidden:
+        assert slow[1]["hidden_removed"] == 4 and "ads-top" not in slow[0] and "banner" not in slow[0]
+
+
+def test_fast_clean_can_be_disabled(monkeypatch):
+    import mcp_browser_use.constants as constants
+
+    monkeypatch.setattr(cleaners, "_FAST_STRIP_MIN_CHARS", 0)
+    monkeypatch.setattr(constants, "FAST_CLEAN", False)
+    monkeypatch.setattr(cleaners, "_strip_noise_fast", lambda *a, **k: pytest.fail("fast path used"))
+    assert "Title 1" in cleaners.basic_prune(PAGE, 2)[0]
+
+
+@pytest.mark.parametrize("max_items", [3, 64])
+def test_fast_outline_matches_soup(monkeypatch, max_items):
+    cleaned = cleaners.basic_prune(PAGE, 2)[0]
+    monkeypatch.setattr(cleaners, "_FAST_STRIP_MIN_CHARS", 10**12)
+    slow = cleaners.extract_outline(cleaned, max_items)
+    monkeypatch.setattr(cleaners, "_FAST_STRIP_MIN_CHARS", 0)
+    assert cleaners.extract_outline(cleaned, max_items, normalized=True) == slow
+    assert slow[0]["text"] == "Title 0" and slow[0]["css_path"].endswith("div#c0 > h2")
+
+
+def test_raw_level_outline_matches_soup_on_large_pages(monkeypatch):
+    import mcp_browser_use.helpers_context as hc
+
+    # No <html>/<body>, and an <h1> inside a <p>: lexbor would imply the
+    # former and close the <p>, BeautifulSoup keeps the markup as written
+    raw = "<section id=s><h2>Top</h2></section><div><p>intro<h1>Misnested</h1></p></div>" + "<i>x</i>" * 8000
+    monkeypatch.setattr(cleaners, "_FAST_STRIP_MIN_CHARS", 10**12)
+    slow = cleaners.extract_outline(raw)
+    monkeypatch.setattr(cleaners, "_FAST_STRIP_MIN_CHARS", 1024)
+    assert len(raw) >= 1024
+
+    cp = hc.pack_snapshot(window_tag=None, url=None, title=None, raw_html=raw,
+                          return_mode="outline", cleaning_level=-1, token_budget=None)
+    assert cp.outline == slow
+    assert [o["css_path"] for o in slow] == ["div > p > h1", "section#s > h2"]
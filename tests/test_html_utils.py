@@ -0,0 +1,24 @@
+"""Tests for get_cleaned_html pre-truncation."""
+
+from mcp_browser_use.utils.html_utils import get_cleaned_html, _pretruncate_html
+
+
+def test_get_cleaned_html_pretruncates_large_pages():
+    """Large pages are cut at a tag boundary before parsing and capped after cleaning."""
+    body = "".join(f"<p>item {i}</p>" for i in range(5000))
+    html = f"<html><body>{body}</body></html>"
+
+    class _Driver:
+        page_source = html
+
+        def execute_script(self, script):
+            return html
+
+    cut = _pretruncate_html(html, 200)
+    assert len(cut) <= 200 and cut.endswith("</p>")
+
+    cleaned = get_cleaned_html(_Driver(), max_chars=100)
+    assert len(cleaned) <= 100
+    assert "item 0" in cleaned
+
+    assert "item 4999" in get_cleaned_html(_Driver(), max_chars=0)
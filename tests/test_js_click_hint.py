@@ -0,0 +1,54 @@
+"""Tests for the intercepted-click JS fallback hint."""
+
+from selenium.common.exceptions import ElementClickInterceptedException
+
+import mcp_browser_use.tools.interaction as interaction
+
+
+class _Element:
+    def __init__(self):
+        self.native_clicks = 0
+
+    def click(self):
+        self.native_clicks += 1
+        raise ElementClickInterceptedException("overlay")
+
+
+class _Driver:
+    def __init__(self):
+        self.js_clicks = 0
+
+    def execute_script(self, script, *args):
+        self.js_clicks += 1
+
+
+class _Ctx:
+    def __init__(self):
+        self.driver = _Driver()
+        self.last_url = "https://shop.example.com/cart"
+
+    def invalidate_snapshot(self):
+        pass
+
+
+def test_intercepted_selector_goes_straight_to_js(monkeypatch):
+    el = _Element()
+    monkeypatch.setattr(interaction, "_locate_interactable", lambda *a: el)
+    monkeypatch.setattr(interaction, "_wait_clickable_element", lambda **kw: el)
+    monkeypatch.setattr(interaction, "_JS_CLICK_HINTS", {})
+    ctx = _Ctx()
+
+    args = (ctx, "#buy", "css", 1.0, False, None, "css", None, "css")
+    interaction._click(*args)
+    interaction._click(*args)
+
+    assert el.native_clicks == 1
+    assert ctx.driver.js_clicks == 2
+    assert ("shop.example.com", "css", "#buy") in interaction._JS_CLICK_HINTS
+
+
+def test_js_click_hint_expires(monkeypatch):
+    monkeypatch.setattr(interaction, "_JS_CLICK_HINTS", {("h", "css", "#x"): 0.0})
+
+    assert interaction._js_click_hinted(("h", "css", "#x")) is False
+    assert interaction._JS_CLICK_HINTS == {}
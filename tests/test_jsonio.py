@@ -0,0 +1,125 @@
+"""Tests for tool payload encoding with pre-encoded snapshots."""
+
+import json
+
+from mcp_browser_use.utils.jsonio import Snapshot, dumps, loads, respond
+
+
+def test_respond_splices_memoized_snapshot_encoding():
+    snap = Snapshot(url="https://x/", title="T", html='<p class="a">é "q"</p>')
+    out = respond({"ok": True, "action": "click", "snapshot": snap})
+    assert json.loads(out) == {"ok": True, "action": "click", "snapshot": dict(snap)}
+    assert snap.encoded() is snap.encoded()
+
+
+def test_respond_with_only_a_snapshot():
+    snap = Snapshot(url=None, title=None, html="")
+    assert json.loads(respond({"snapshot": snap})) == {"snapshot": dict(snap)}
+
+
+def test_respond_plain_payload_matches_stdlib():
+    payload = {"ok": False, "error": "timeout", "snapshot": "Omitted to save tokens."}
+    assert json.loads(respond(payload)) == payload
+    assert json.loads(dumps({1: "non-str key"})) == {"1": "non-str key"}
+
+
+def test_dumps_encodes_dataclasses_with_default():
+    from dataclasses import dataclass, field
+
+    @dataclass
+    class Pack:
+        title: str
+        errors: list = field(default_factory=list)
+
+    out = dumps(Pack(title="Grüße"), default=lambda o: getattr(o, "__dict__", repr(o)))
+
+    assert loads(out) == {"title": "Grüße", "errors": []}
+    assert "Grüße" in out
+
+
+def test_dumps_record_matches_to_dict_encoding(monkeypatch):
+    import mcp_browser_use.utils.jsonio as jsonio
+    from mcp_browser_use.context_pack import ContextPack, OutlineItem
+
+    cp = ContextPack(window_tag="w", url="https://x/", title="é")
+    cp.outline = [OutlineItem(level=1, text="H", word_count=1, css_path="h1", subtree_id=None)]
+    cp.mixed = {"ok": True, 2: "int key"}
+
+    expected = json.loads(json.dumps(cp.to_dict()))
+    assert json.loads(jsonio.dumps_record(cp)) == expected
+
+    monkeypatch.setattr(jsonio, "orjson", None)
+    monkeypatch.setattr(jsonio, "msgspec", None)
+    assert json.loads(jsonio.dumps_record(cp)) == expected
+
+
+def test_dumps_record_reuses_msgspec_encoder(monkeypatch):
+    import types
+    import mcp_browser_use.utils.jsonio as jsonio
+
+    built = []
+
+    class Encoder:
+        def __init__(self, enc_hook=None):
+            built.append(enc_hook)
+
+        def encode(self, obj):
+            return json.dumps(obj).encode("utf-8")
+
+    fake = types.SimpleNamespace(json=types.SimpleNamespace(Encoder=Encoder))
+    monkeypatch.setattr(jsonio, "msgspec", fake)
+    monkeypatch.setattr(jsonio, "_MSGSPEC_ENCODERS", {})
+
+    assert [jsonio.dumps_record({"a": i}) for i in range(3)] == ['{"a": 0}', '{"a": 1}', '{"a": 2}']
+    jsonio.dumps_record({}, default=repr)
+    assert built == [None, repr]
+
+
+def test_respond_returns_bytes_that_to_context_pack_accepts():
+    import asyncio
+    import mcp_browser_use.helpers_context as hc
+
+    out = respond({"ok": True, "snapshot": Snapshot(url="https://x/", title="T", html="<h1>é</h1>")})
+    assert isinstance(out, bytes)
+
+    pack = json.loads(asyncio.run(hc.to_context_pack(out, return_mode="text", cleaning_level=0)))
+    assert pack["text"] == "é" and pack["mixed"] == {"ok": True}
+
+
+def test_to_context_pack_accepts_a_parsed_dict():
+    import asyncio
+    import mcp_browser_use.helpers_context as hc
+
+    result = {"ok": True, "snapshot": {"url": "https://x/", "title": "T", "html": "<h1>é</h1>"}}
+    pack = json.loads(asyncio.run(hc.to_context_pack(result, return_mode="text", cleaning_level=0)))
+    assert pack["text"] == "é" and pack["mixed"] == {"ok": True}
+    assert "snapshot" in result
+
+
+def test_unencoded_snapshot_keeps_its_carried_digest(monkeypatch):
+    import asyncio
+    import mcp_browser_use.helpers_context as hc
+
+    def fail(data):
+        raise AssertionError("the carried digest should be used")
+
+    monkeypatch.setattr(hc, "_content_hash", fail)
+    snap = Snapshot(url="https://x/", title="T", html="<h1>carried digest</h1>")
+    snap.digest = "00112233aabbccdd"
+    pack = json.loads(asyncio.run(hc.to_context_pack({"ok": True, "snapshot": snap}, return_mode="text", cleaning_level=0)))
+    assert pack["text"] == "carried digest"
+
+
+def test_non_str_keys_stay_on_orjson(monkeypatch):
+    import pytest
+    import mcp_browser_use.utils.jsonio as jsonio
+
+    if jsonio.orjson is None:
+        pytest.skip("orjson not installed")
+
+    def fail(*a, **kw):
+        raise AssertionError("stdlib fallback used")
+
+    monkeypatch.setattr(jsonio.json, "dumps", fail)
+    out = respond({"ok": True, "counts": {1: "a", 2: "é"}})
+    assert json.loads(out) == {"ok": True, "counts": {"1": "a", "2": "é"}}
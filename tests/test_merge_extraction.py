@@ -0,0 +1,105 @@
+"""Extraction results are merged into the packed action result."""
+
+import asyncio
+import json
+
+import mcp_browser_use.__main__ as server_main
+from mcp_browser_use.helpers_context import ShapeOpts
+
+_ACTION = b'{"ok": true, "action": "click", "snapshot": {"url": "https://x/", "title": "T", "html": "<h1>Hi</h1>"}}'
+
+
+def _fake_extraction(monkeypatch, payload):
+    calls = []
+
+    async def extract_elements_data(**kwargs):
+        calls.append(kwargs)
+        if isinstance(payload, Exception):
+            raise payload
+        return payload
+
+    monkeypatch.setattr(server_main.extraction, "extract_elements_data", extract_elements_data)
+    return calls
+
+
+def _pack(selectors=None, container=None, **extract):
+    out = asyncio.run(server_main._pack_with_extraction(
+        _ACTION, ShapeOpts(return_mode="text", cleaning_level=0),
+        server_main._extraction_opts(selectors, container, **extract),
+    ))
+    return json.loads(out)
+
+
+def test_extraction_is_merged_into_mixed(monkeypatch):
+    _fake_extraction(monkeypatch, {"ok": True, "mode": "simple", "extracted_elements": [{"text": "é"}], "count": 1})
+    pack = _pack(selectors=[{"selector": "h1"}], timeout=3)
+    assert pack["text"] == "Hi"
+    assert pack["mixed"] == {
+        "ok": True,
+        "action": "click",
+        "extraction": {"mode": "simple", "extracted_elements": [{"text": "é"}], "items": None, "count": 1},
+    }
+
+
+def test_no_extraction_requested(monkeypatch):
+    calls = _fake_extraction(monkeypatch, None)
+    assert _pack()["mixed"] == {"ok": True, "action": "click"}
+    assert calls == []
+
+
+def test_failed_extraction_keeps_the_pack(monkeypatch, caplog):
+    _fake_extraction(monkeypatch, None)
+    assert _pack(container=".row")["mixed"] == {"ok": True, "action": "click"}
+    _fake_extraction(monkeypatch, RuntimeError("driver gone"))
+    with caplog.at_level("WARNING", logger=server_main.logger.name):
+        assert _pack(container=".row")["mixed"] == {"ok": True, "action": "click"}
+    assert "driver gone" in caplog.text
+
+
+def test_extraction_options_reach_the_extraction(monkeypatch):
+    calls = _fake_extraction(monkeypatch, {"ok": True, "mode": "structured", "items": [], "count": 0})
+    _pack(container=".row", fields=[{"selector": "a"}], max_items=5, discover=True)
+    assert calls == [{
+        "selectors": None, "container_selector": ".row", "fields": [{"selector": "a"}],
+        "selector_type": None, "wait_for_visible": False, "timeout": 10, "max_items": 5,
+        "discover_containers": True, "wait_for_content_loaded": None,
+    }]
+
+
+def test_no_extraction_hands_back_the_pack_coroutine():
+    import mcp_browser_use.helpers_context as hc
+
+    coro = server_main._pack_with_extraction(_ACTION, ShapeOpts(return_mode="text", cleaning_level=0))
+    assert coro.cr_code is hc.to_context_pack.__code__
+    assert json.loads(asyncio.run(coro))["text"] == "Hi"
+
+
+def test_merge_does_not_reparse_the_pack(monkeypatch):
+    _fake_extraction(monkeypatch, {"ok": True, "mode": "simple", "extracted_elements": [], "count": 0})
+
+    def fail(data):
+        raise AssertionError("the pack should not be parsed again")
+
+    monkeypatch.setattr(server_main, "_loads", fail)
+    action = {"ok": False, "error": "timeout", "snapshot": {"url": "https://x/", "title": "T", "html": "<h1>Hi</h1>"}}
+    pack = json.loads(asyncio.run(server_main._pack_with_extraction(
+        action, ShapeOpts(return_mode="text", cleaning_level=0), server_main._extraction_opts([{"selector": "h1"}], None),
+    )))
+    assert pack["mixed"]["extraction"]["count"] == 0
+    assert pack["errors"][0]["details"]["extraction"]["mode"] == "simple"
+    assert "snapshot" in action
+
+
+def test_merge_with_the_stdlib_json_backend(monkeypatch):
+    import mcp_browser_use.helpers_context as hc
+    import mcp_browser_use.utils.jsonio as jsonio
+
+    monkeypatch.setattr(jsonio, "orjson", None)
+    monkeypatch.setattr(jsonio, "msgspec", None)
+    hc._PACK_JSON_CACHE.clear()
+    _fake_extraction(monkeypatch, {"ok": True, "mode": "simple", "extracted_elements": [{"text": "a\\b é"}], "count": 1})
+    pack = _pack(selectors=[{"selector": "h1"}])
+    assert pack["mixed"]["extraction"]["extracted_elements"] == [{"text": "a\\b é"}]
+
+    _fake_extraction(monkeypatch, None)
+    assert _pack(container=".row")["mixed"] == {"ok": True, "action": "click"}
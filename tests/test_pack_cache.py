@@ -0,0 +1,349 @@
+"""Tests for the ContextPack packing cache in helpers_context."""
+
+import asyncio
+import json
+
+import mcp_browser_use.helpers_context as hc
+
+PAGE = "<html><head><title>T</title></head><body><h1>Hello</h1><p>World</p></body></html>"
+
+
+def _result(html, **extra):
+    return json.dumps({"ok": True, **extra, "snapshot": {"url": "https://e.com/", "title": "T", "html": html}})
+
+
+def _pack(result_json, mode="outline"):
+    return json.loads(asyncio.run(hc.to_context_pack(result_json, return_mode=mode, cleaning_level=2)))
+
+
+def test_unchanged_page_is_packed_once(monkeypatch):
+    hc._PACK_CACHE.clear()
+    calls = []
+    real = hc.pack_from_snapshot_dict
+
+    def counting(**kwargs):
+        calls.append(kwargs["return_mode"])
+        return real(**kwargs)
+
+    monkeypatch.setattr(hc, "pack_from_snapshot_dict", counting)
+
+    first = _pack(_result(PAGE, action="scroll"))
+    second = _pack(_result(PAGE, action="debug"))
+
+    assert calls == ["outline"]
+    assert first["outline"] == second["outline"]
+    assert second["mixed"] == {"ok": True, "action": "debug"}
+
+    _pack(_result(PAGE.replace("World", "Changed")))
+    _pack(_result(PAGE), mode="text")
+    assert calls == ["outline", "outline", "text"]
+
+
+def test_cached_pack_errors_are_not_shared():
+    hc._PACK_CACHE.clear()
+    failed = _pack(json.dumps({"ok": False, "error": "boom", "snapshot": {"url": "https://e.com/", "title": "T", "html": PAGE}}))
+    ok = _pack(_result(PAGE))
+
+    assert failed["errors"] and failed["errors"][0]["type"] == "boom"
+    assert ok["errors"] == []
+
+
+def test_result_without_snapshot_skips_packing(monkeypatch):
+    def fail(**kwargs):
+        raise AssertionError("empty snapshot should not be packed")
+
+    monkeypatch.setattr(hc, "pack_from_snapshot_dict", fail)
+
+    out = _pack(json.dumps({"ok": True, "diagnostics": {"x": 1}}), mode="html")
+    assert out["html"] == ""
+    assert out["mixed"] == {"ok": True, "diagnostics": {"x": 1}}
+
+    out = _pack(json.dumps({"ok": True, "snapshot": {"url": "u", "title": "t", "html": ""}}))
+    assert out["outline_present"] is True and out["outline"] == []
+    assert out["url"] == "u"
+
+
+def test_return_mode_is_normalized():
+    page = _result(PAGE)
+    assert _pack(page, mode="TEXT")["snapshot_mode"] == "text"
+    assert _pack(page, mode="bogus")["snapshot_mode"] == "outline"
+    assert _pack(page, mode=None)["snapshot_mode"] == "outline"
+
+
+def test_large_result_is_parsed_off_the_loop(monkeypatch):
+    hc._PACK_CACHE.clear()
+    monkeypatch.setattr(hc, "_PARALLEL_PARSE_MIN_CHARS", 10)
+    out = _pack(_result(PAGE, action="big"))
+    assert out["mixed"] == {"ok": True, "action": "big"}
+    assert out["outline"]
+
+
+def test_non_json_result_raises_type_error():
+    import pytest
+
+    with pytest.raises(TypeError):
+        asyncio.run(hc.to_context_pack("not json" * 5000, "outline", 2))
+
+
+def test_pack_instance_is_reused_per_window():
+    hc._PACK_CACHE.clear()
+    hc._PACK_JSON_CACHE.clear()
+    hc._CP_POOL.clear()
+
+    first = asyncio.run(hc.to_context_pack(_result(PAGE), "outline", 2))
+    pooled = hc._CP_POOL[None]
+    second = asyncio.run(hc.to_context_pack(_result(PAGE.replace("Hello", "Bye")), "html", 1))
+
+    assert hc._CP_POOL[None] is pooled
+    assert json.loads(first)["outline_present"] is True
+    second = json.loads(second)
+    assert second["outline_present"] is False and second["outline"] == []
+    assert "Bye" in second["html"]
+
+
+def test_context_pack_to_dict_flattens_nested_dataclasses():
+    from mcp_browser_use.context_pack import ContextPack, OutlineItem
+
+    cp = ContextPack(window_tag="w", url="u", title="t")
+    cp.outline = [OutlineItem(level=1, text="H", word_count=1, css_path=None, subtree_id=None), {"level": 2}]
+    d = cp.to_dict()
+
+    assert d["outline"][0] == {"level": 1, "text": "H", "word_count": 1, "css_path": None, "subtree_id": None}
+    assert d["outline"][1] == {"level": 2}
+    assert set(d) == set(cp.__dataclass_fields__)
+    assert json.loads(json.dumps(d))["window_tag"] == "w"
+
+
+def test_shape_opts_matches_keyword_arguments():
+    hc._PACK_CACHE.clear()
+    result = _result(PAGE)
+    by_kwargs = asyncio.run(hc.to_context_pack(result, return_mode="text", cleaning_level=1, token_budget=50))
+    by_opts = asyncio.run(hc.to_context_pack(
+        result, opts=hc.ShapeOpts(return_mode="text", cleaning_level=1, token_budget=50),
+    ))
+    assert by_opts == by_kwargs
+
+
+def test_metadata_pack_wraps_result_without_packing(monkeypatch):
+    def fail(**kwargs):
+        raise AssertionError("metadata results should not be packed")
+
+    monkeypatch.setattr(hc, "pack_from_snapshot_dict", fail)
+
+    out = json.loads(hc.metadata_pack(json.dumps({"ok": True, "diagnostics": {"x": 1}})))
+    assert out == {"ok": True, "url": None, "title": None, "mixed": {"ok": True, "diagnostics": {"x": 1}}}
+
+    failed = json.loads(hc.metadata_pack(json.dumps({"ok": False, "error": "boom"})))
+    assert failed["ok"] is False and failed["errors"][0]["type"] == "boom"
+
+
+def test_large_pages_are_packed_off_loop(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+    import threading
+    import mcp_browser_use.constants as constants
+
+    hc._PACK_CACHE.clear()
+    inline = _pack(_result(PAGE), mode="text")
+
+    hc._PACK_CACHE.clear()
+    hc._PACK_JSON_CACHE.clear()
+    hc._CLEANED_CACHE.clear()  # else the page is already cleaned here and stays in-process
+    workers = []
+    real = hc._pack_uncached
+
+    def tracking(*args, **kwargs):
+        workers.append(threading.current_thread().name)
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(constants, "PACK_OFFLOAD_MIN_CHARS", 10)
+    monkeypatch.setattr(hc, "_pack_uncached", tracking)
+    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="packer")
+    monkeypatch.setattr(hc, "_pack_executor", lambda: pool)
+
+    offloaded = _pack(_result(PAGE), mode="text")
+    pool.shutdown()
+
+    assert offloaded == inline
+    assert workers and workers[0].startswith("packer")
+
+
+def test_empty_pack_template_matches_full_encoding():
+    hc._EMPTY_TEMPLATES.clear()
+    for mode, budget in (("outline", 1000), ("html", 20_000), ("text", None)):
+        snap = {"url": "https://e.com/\"q\"", "title": "Tä", "html": ""}
+        out = asyncio.run(hc.to_context_pack(json.dumps({"ok": True, "n": 1, "snapshot": snap}),
+                                             return_mode=mode, cleaning_level=1, token_budget=budget))
+        cp = hc._empty_pack(None, snap["url"], snap["title"], mode, 1, budget)
+        if budget and budget > 10_000:
+            cp.errors.append(hc._budget_warning(budget))
+        cp.mixed = {"ok": True, "n": 1}
+        assert json.loads(out) == json.loads(hc.dumps_record(cp, default=hc._encode_fallback))
+    assert len(hc._EMPTY_TEMPLATES) == 3
+
+
+def test_prewarm_runs_once(monkeypatch):
+    monkeypatch.setattr(hc, "_PREWARMED", False)
+
+    async def run():
+        warm = hc.prewarm_packing()
+        assert warm is not None
+        await warm
+        return hc.prewarm_packing()
+
+    assert asyncio.run(run()) is None
+
+
+def test_mid_sized_pages_are_packed_on_a_thread(monkeypatch):
+    import threading
+
+    big = "<html><body>" + "".join(f"<p>Row {i} text</p>" for i in range(6000)) + "</body></html>"
+    assert len(big) >= hc._THREAD_PACK_MIN_CHARS
+    hc._PACK_CACHE.clear()
+    workers = []
+    real = hc._pack_uncached
+
+    def tracking(*args, **kwargs):
+        workers.append(threading.current_thread() is threading.main_thread())
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(hc, "_pack_uncached", tracking)
+    out = _pack(_result(big), mode="text")
+    assert workers == [False]
+    assert out["text"].startswith("Row 0 text")
+    assert hc._offload_target(PAGE, "text", 1000, False) is None
+    # Diff-mode html packs share the subtree hashes: threads only
+    assert hc._offload_target(big, "html", 1000, True) == "thread"
+    assert hc._offload_target(PAGE, "html", 1000, True) is None
+
+
+def test_offset_walk_stays_in_process_after_the_first_page(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+    import mcp_browser_use.constants as constants
+
+    big = "<html><body>" + "".join(f"<p>Row {i} text</p>" for i in range(3000)) + "</body></html>"
+    hc._PACK_CACHE.clear()
+    hc._CLEANED_CACHE.clear()
+    monkeypatch.setattr(constants, "PACK_OFFLOAD_MIN_CHARS", 10)
+    submitted = []
+    pool = ThreadPoolExecutor(max_workers=1)
+    real_submit = pool.submit
+
+    def submit(fn, *args, **kwargs):
+        submitted.append(fn)
+        # Stand-in for the worker process: its cleaning cache is not ours
+        def isolated():
+            saved = hc._CLEANED_CACHE.copy()
+            hc._CLEANED_CACHE.clear()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                hc._CLEANED_CACHE.clear()
+                hc._CLEANED_CACHE.update(saved)
+        return real_submit(isolated)
+
+    monkeypatch.setattr(pool, "submit", submit)
+    monkeypatch.setattr(hc, "_pack_executor", lambda: pool)
+
+    def page(offset):
+        return json.loads(asyncio.run(hc.to_context_pack(
+            _result(big), return_mode="text", cleaning_level=2, token_budget=200, text_offset=offset,
+        )))["text"]
+
+    first, second = page(0), page(800)
+    pool.shutdown()
+    assert len(submitted) == 1
+    assert first.startswith("Row 0 text") and second != first
+    assert hc._has_cleaned(big, 2)
+
+
+def test_large_diff_packs_run_on_a_thread_and_still_diff(monkeypatch):
+    import threading
+
+    big = "<html><body>" + "".join(f"<div><p>Row {i} text</p></div>" for i in range(4000)) + "</body></html>"
+    hc.invalidate_subtree_hashes()
+    threads = []
+    real = hc._elide_unchanged_subtrees
+
+    def tracking(*args):
+        threads.append(threading.current_thread() is threading.main_thread())
+        return real(*args)
+
+    monkeypatch.setattr(hc, "_elide_unchanged_subtrees", tracking)
+
+    def pack():
+        return json.loads(asyncio.run(hc.to_context_pack(
+            _result(big), return_mode="html", cleaning_level=0, token_budget=None, diff_mode=True,
+        )))["html"]
+
+    first, second = pack(), pack()
+    hc.invalidate_subtree_hashes()
+    assert threads == [False, False]
+    assert 'data-mcp="unchanged"' not in first and 'data-mcp="unchanged"' in second
+
+
+def test_raw_html_level_passes_the_page_through(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("raw html must not be cleaned or hashed")
+
+    monkeypatch.setattr(hc, "basic_prune", fail)
+    monkeypatch.setattr(hc, "_content_hash", fail)
+    page = "<html><head><script>var x = 1;</script></head><body>" + "<p>word</p>" * 500 + "</body></html>"
+
+    def raw(**kwargs):
+        return json.loads(asyncio.run(hc.to_context_pack(
+            _result(page), return_mode="html", cleaning_level=-1, diff_mode=False, **kwargs,
+        )))
+
+    full = raw(token_budget=None)
+    assert full["html"] == page
+    assert full["hard_capped"] is False and full["pruned_counts"] == {}
+
+    window = raw(token_budget=100, html_offset=10)
+    assert window["html"] == page[10:410]
+    assert window["hard_capped"] is True
+    assert window["approx_tokens"] == 100
+
+
+def test_identical_calls_return_the_cached_encoding(monkeypatch):
+    hc._PACK_JSON_CACHE.clear()
+    first = asyncio.run(hc.to_context_pack(_result(PAGE), "text", 1))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("an identical call should not re-pack or re-encode")
+
+    monkeypatch.setattr(hc, "_pack_cached", fail)
+    monkeypatch.setattr(hc, "dumps_record", fail)
+    assert asyncio.run(hc.to_context_pack(_result(PAGE), "text", 1)) is first
+
+    monkeypatch.undo()
+    other = json.loads(asyncio.run(hc.to_context_pack(_result(PAGE, action="scroll"), "text", 1)))
+    assert other["mixed"]["action"] == "scroll"
+
+
+def test_zero_budget_skips_packing(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("a zero budget should not pack the page")
+
+    monkeypatch.setattr(hc, "_pack_cached", fail)
+    monkeypatch.setattr(hc, "_pack_offloaded", fail)
+    for budget in (0, -1):
+        pack = json.loads(asyncio.run(hc.to_context_pack(_result(PAGE, action="wait"), "text", 2, token_budget=budget)))
+        assert pack["url"] == "https://e.com/" and pack["title"] == "T"
+        assert pack["text"] == "" and pack["mixed"] == {"ok": True, "action": "wait"}
+
+
+def test_large_packs_are_encoded_in_slices(monkeypatch):
+    monkeypatch.setattr(hc, "_STREAM_CHUNK_CHARS", 7)
+    from mcp_browser_use.context_pack import ContextPack
+
+    cp = ContextPack(window_tag="w", url="https://e.com/", title="T")
+    cp.html = '<p class="q">é \\ \U0001F600</p>' * 5
+    cp.mixed = {"ok": True}
+
+    async def collect():
+        return [fragment async for fragment in hc._stream_context_pack(cp)]
+
+    fragments = asyncio.run(collect())
+    assert len(fragments) > 5
+    assert json.loads("".join(fragments)) == json.loads(hc.dumps_record(cp, default=hc._encode_fallback))
+    assert cp.html.startswith("<p")
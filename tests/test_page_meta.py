@@ -0,0 +1,31 @@
+"""Tests for the per-invocation page meta memo in to_context_pack."""
+
+import asyncio
+import json
+
+import mcp_browser_use.helpers as helpers
+import mcp_browser_use.helpers_context as hc
+from mcp_browser_use.decorators.envelope import tool_envelope
+
+
+def test_page_meta_is_looked_up_once_per_tool_call(monkeypatch):
+    calls = []
+
+    async def fake_meta():
+        calls.append(1)
+        return {"url": "https://e.com/", "title": "T", "window_tag": "w1"}
+
+    monkeypatch.setattr(helpers, "get_current_page_meta", fake_meta, raising=False)
+    result = json.dumps({"ok": True})
+
+    @tool_envelope
+    async def tool():
+        first = json.loads(await hc.to_context_pack(result, "outline", 2))
+        second = json.loads(await hc.to_context_pack(result, "outline", 2))
+        return json.dumps([first["window_tag"], second["window_tag"]])
+
+    assert json.loads(asyncio.run(tool())) == ["w1", "w1"]
+    assert len(calls) == 1
+
+    asyncio.run(tool())
+    assert len(calls) == 2
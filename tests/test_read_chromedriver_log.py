@@ -0,0 +1,40 @@
+import json
+
+from mcp_browser_use.tools import debugging
+
+
+def _read(monkeypatch, tmp_path, content, **kwargs):
+    log = tmp_path / "chromedriver.log"
+    if content is not None:
+        log.write_bytes(content)
+    monkeypatch.setattr(debugging, "chromedriver_log_path", lambda config: str(log))
+    monkeypatch.setattr(debugging, "get_context", lambda: type("Ctx", (), {"config": {}})())
+    return json.loads(debugging.read_chromedriver_log(**kwargs))
+
+
+def test_tail_is_default(monkeypatch, tmp_path):
+    body = b"".join(b"[%d][INFO]: line %d\n" % (i, i) for i in range(1000))
+    out = _read(monkeypatch, tmp_path, body, lines=3)
+    assert out["ok"] is True
+    assert out["content"].splitlines() == [
+        "[997][INFO]: line 997", "[998][INFO]: line 998", "[999][INFO]: line 999",
+    ]
+    assert out["lines_read"] == 3
+
+
+def test_tail_handles_short_files_and_missing_newline(monkeypatch, tmp_path):
+    out = _read(monkeypatch, tmp_path, b"a\r\n[ERROR]: b", lines=10)
+    assert out["content"] == "a\n[ERROR]: b"
+    assert out["has_errors"] is True
+    assert _read(monkeypatch, tmp_path, b"", lines=5)["lines_read"] == 0
+
+
+def test_from_top(monkeypatch, tmp_path):
+    out = _read(monkeypatch, tmp_path, b"one\ntwo\nthree\n", lines=2, from_top=True)
+    assert out["content"] == "one\ntwo"
+    assert out["from_top"] is True
+
+
+def test_missing_log(monkeypatch, tmp_path):
+    out = _read(monkeypatch, tmp_path, None)
+    assert out == {"ok": False, "error": "log_not_found", "log_path": str(tmp_path / "chromedriver.log")}
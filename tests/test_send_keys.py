@@ -0,0 +1,62 @@
+"""Tests for the send_keys tool implementation."""
+
+import json
+
+import mcp_browser_use.tools.interaction as interaction
+
+
+class _Element:
+    def __init__(self):
+        self.sent = []
+
+    def send_keys(self, *keys):
+        self.sent.extend(keys)
+
+
+class _Ctx:
+    driver = object()
+
+    def __init__(self):
+        self.invalidated = 0
+
+    def is_driver_initialized(self):
+        return True
+
+    def invalidate_snapshot(self):
+        self.invalidated += 1
+
+
+def _setup(monkeypatch, snapshots):
+    el = _Element()
+    ctx = _Ctx()
+    monkeypatch.setattr(interaction, "get_context", lambda: ctx)
+    monkeypatch.setattr(interaction, "find_element", lambda **kw: el)
+    monkeypatch.setattr(interaction, "_make_page_snapshot", lambda: snapshots.append(1) or {"url": "u", "title": "t", "html": ""})
+    monkeypatch.setattr(interaction.time, "sleep", lambda s: None)
+    return el, ctx
+
+
+def test_send_keys_without_snapshot_skips_capture(monkeypatch):
+    snapshots = []
+    el, ctx = _setup(monkeypatch, snapshots)
+
+    out = json.loads(interaction.send_keys.__wrapped__(key="a", selector="#q", snapshot=False))
+    assert out["ok"] is True and "snapshot" not in out
+    assert snapshots == [] and el.sent == ["a"] and ctx.invalidated == 1
+
+    out = json.loads(interaction.send_keys.__wrapped__(key="ENTER", selector="#q"))
+    assert out["snapshot"]["url"] == "u"
+    assert snapshots == [1]
+
+
+def test_key_list_is_sent_in_one_call(monkeypatch):
+    el, _ = _setup(monkeypatch, [])
+    calls = []
+    monkeypatch.setattr(el, "send_keys", lambda *keys: calls.append(keys))
+
+    out = json.loads(interaction.send_keys.__wrapped__(key=["hello", "TAB", "world"], selector="#q", snapshot=False))
+    assert out["ok"] is True
+    assert calls == [("hello", interaction._selenium_key("TAB"), "world")]
+
+    out = json.loads(interaction.send_keys.__wrapped__(key=[], selector="#q"))
+    assert out["ok"] is False and out["error"] == "invalid_key"
@@ -0,0 +1,156 @@
+"""Tests for the mutation-signature snapshot cache in _make_page_snapshot."""
+
+import pytest
+
+import mcp_browser_use.constants as constants
+
+from mcp_browser_use.context import get_context, reset_context
+from mcp_browser_use.actions.screenshots import _make_page_snapshot, _MUTATION_SIGNATURE_JS
+
+
+class _SwitchTo:
+    def default_content(self):
+        pass
+
+
+class FakeDriver:
+    """Minimal driver that serves a page and a controllable mutation counter."""
+
+    def __init__(self):
+        self.switch_to = _SwitchTo()
+        self.current_url = "https://example.com/"
+        self.title = "Example"
+        self.mutations = 0
+        self.html = "<html><body>v1</body></html>"
+        self.html_reads = 0
+
+    def execute_script(self, script, *args):
+        if script == _MUTATION_SIGNATURE_JS:
+            sig = [1.0, self.mutations, self.current_url]
+            if args and args[0]:
+                self.html_reads += 1
+                return [sig, self.html]
+            return sig
+        if "readyState" in script:
+            return "complete"
+        raise AssertionError(f"unexpected script: {script[:40]}")
+
+
+@pytest.fixture
+def driver(monkeypatch):
+    monkeypatch.setattr(constants, "SNAPSHOT_SETTLE_MS", 0)
+    reset_context()
+    ctx = get_context()
+    ctx.driver = FakeDriver()
+    yield ctx.driver
+    reset_context()
+
+
+def test_unchanged_dom_reuses_cached_html(driver):
+    first = _make_page_snapshot()
+    second = _make_page_snapshot()
+    assert first == second
+    assert driver.html_reads == 1
+
+
+def test_mutation_forces_fresh_capture(driver):
+    _make_page_snapshot()
+    driver.mutations += 1
+    driver.html = "<html><body>v2</body></html>"
+    snap = _make_page_snapshot()
+    assert "v2" in snap["html"]
+    assert driver.html_reads == 2
+
+
+def test_invalidate_snapshot_forces_fresh_capture(driver):
+    _make_page_snapshot()
+    get_context().invalidate_snapshot()
+    _make_page_snapshot()
+    assert driver.html_reads == 2
+
+
+class FusedDriver(FakeDriver):
+    """Driver that supports the single-round-trip ready+snapshot script."""
+
+    def __init__(self):
+        super().__init__()
+        self.async_calls = 0
+
+    def execute_async_script(self, script, *args):
+        self.async_calls += 1
+        self.async_args = args
+        self.html_reads += 1
+        return {
+            "readyState": "complete",
+            "url": self.current_url,
+            "title": self.title,
+            "sig": [1.0, self.mutations, self.current_url],
+            "html": self.html,
+        }
+
+    def execute_script(self, script, *args):
+        if "readyState" in script:
+            raise AssertionError("fused capture should not poll readyState separately")
+        return super().execute_script(script, *args)
+
+
+def test_fused_capture_uses_one_async_round_trip(monkeypatch):
+    monkeypatch.setattr(constants, "SNAPSHOT_SETTLE_MS", 0)
+    reset_context()
+    ctx = get_context()
+    ctx.driver = FusedDriver()
+    try:
+        snap = _make_page_snapshot()
+        assert snap == {"url": "https://example.com/", "title": "Example", "html": ctx.driver.html}
+        assert ctx.driver.async_calls == 1
+
+        # Unchanged DOM: served from cache after a signature check, title included
+        assert _make_page_snapshot() == snap
+        assert ctx.driver.async_calls == 1
+    finally:
+        reset_context()
+
+
+def test_idle_wait_is_passed_to_the_fused_script(monkeypatch):
+    monkeypatch.setattr(constants, "SNAPSHOT_SETTLE_MS", 0)
+    reset_context()
+    ctx = get_context()
+    ctx.driver = FusedDriver()
+    try:
+        _make_page_snapshot(ready_timeout=20, idle_ms=500)
+        assert ctx.driver.async_args == (20000, 0, 500)
+        assert ctx.driver.async_calls == 1
+    finally:
+        reset_context()
+
+
+def test_scroll_keeps_cached_snapshot(driver, monkeypatch):
+    import mcp_browser_use.tools.navigation as navigation
+
+    scrolls = []
+    real = driver.execute_script
+
+    def execute_script(script, *args):
+        if script == navigation._SCROLL_BY_JS:
+            scrolls.append(args)
+            return None
+        return real(script, *args)
+
+    driver.execute_script = execute_script
+    monkeypatch.setattr(navigation.time, "sleep", lambda s: None)
+    _make_page_snapshot()
+
+    out = navigation.scroll.__wrapped__(0, 400)
+    assert out["ok"] is True and scrolls == [(0, 400)]
+    assert driver.html_reads == 1
+
+
+def test_cached_snapshot_carries_its_digest(driver):
+    from mcp_browser_use.helpers_context import html_digest, _snapshot_digest
+    from mcp_browser_use.utils.jsonio import loads
+
+    snap = _make_page_snapshot()
+    parsed = loads(snap.encoded())
+    assert parsed["html_digest"] == html_digest(snap["html"]).hex()
+    # The parsed payload keys the pack cache exactly as hashing the html would
+    assert _snapshot_digest(parsed) == html_digest(parsed["html"])
@@ -0,0 +1,59 @@
+"""Tests for eliding unchanged top-level subtrees between html-mode snapshots."""
+
+import pytest
+
+from mcp_browser_use.helpers_context import (
+    elide_unchanged_subtrees,
+    invalidate_subtree_hashes,
+    pack_snapshot,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean_state():
+    invalidate_subtree_hashes()
+    yield
+    invalidate_subtree_hashes()
+
+
+def _page(main):
+    return f"<html><body><header>Site nav</header><main>{main}</main><footer>Footer</footer></body></html>"
+
+
+def test_first_snapshot_is_full_then_unchanged_subtrees_are_stubbed():
+    html, elided = elide_unchanged_subtrees(_page("one"), owner="w", url="u")
+    assert elided == 0 and "Site nav" in html
+
+    html, elided = elide_unchanged_subtrees(_page("two"), owner="w", url="u")
+    assert elided == 2
+    assert "Site nav" not in html and "Footer" not in html
+    assert "two" in html
+    assert html.count('data-mcp="unchanged"') == 2
+
+
+def test_url_change_resets_hashes():
+    elide_unchanged_subtrees(_page("one"), owner="w", url="u1")
+    _, elided = elide_unchanged_subtrees(_page("one"), owner="w", url="u2")
+    assert elided == 0
+
+
+def test_pack_snapshot_sets_diff_present_only_in_diff_mode():
+    kw = dict(window_tag="w", url="u", title="t", return_mode="html", cleaning_level=0, token_budget=None)
+    pack_snapshot(raw_html=_page("one"), diff_mode=True, **kw)
+    cp = pack_snapshot(raw_html=_page("two"), diff_mode=True, **kw)
+    assert cp.diff_present is True
+    assert 'data-mcp="unchanged"' in cp.html
+
+    cp = pack_snapshot(raw_html=_page("three"), **kw)
+    assert cp.diff_present is False
+    assert "Site nav" in cp.html
+
+
+def test_changed_container_keeps_its_unchanged_children_elided():
+    items = "".join(f"<li>item {i}</li>" for i in range(5))
+    elide_unchanged_subtrees(_page(f"<ul>{items}</ul>"), owner="w", url="u")
+
+    html, elided = elide_unchanged_subtrees(_page(f"<ul>{items.replace('item 3', 'item three')}</ul>"), owner="w", url="u")
+    assert "item three" in html
+    assert "item 0" not in html and "item 4" not in html
+    assert elided == 2 + 4
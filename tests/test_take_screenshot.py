@@ -0,0 +1,65 @@
+"""take_screenshot hands its result to the packer without a JSON round trip."""
+
+import asyncio
+import base64
+import io
+import json
+
+import pytest
+
+from mcp_browser_use.context import get_context, reset_context
+from mcp_browser_use.tools import screenshots
+
+Image = pytest.importorskip("PIL.Image")
+
+
+class FakeDriver:
+    def __init__(self):
+        buf = io.BytesIO()
+        Image.new("RGB", (400, 300), "red").save(buf, format="PNG")
+        self.png = buf.getvalue()
+
+    def get_screenshot_as_png(self):
+        return self.png
+
+
+@pytest.fixture
+def driver():
+    reset_context()
+    get_context().driver = FakeDriver()
+    yield get_context().driver
+    reset_context()
+
+
+def test_thumbnail_result_is_a_dict(driver, tmp_path):
+    path = str(tmp_path / "shot.png")
+    out = asyncio.run(screenshots.take_screenshot(path, True, False, thumbnail_width=100))
+
+    assert isinstance(out, dict)
+    assert out["saved_to"] == path and out["saved_bytes"] == len(driver.png)
+    thumb = Image.open(io.BytesIO(base64.b64decode(out["base64"], validate=True)))
+    assert thumb.size == (100, 75)
+    assert out["thumbnail_format"] == "webp"
+
+
+@pytest.mark.parametrize("fmt, pil_format", [("webp", "WEBP"), ("jpeg", "JPEG"), ("png", "PNG"), ("gif", "WEBP")])
+def test_thumbnail_formats(driver, fmt, pil_format):
+    from PIL import features
+
+    if pil_format == "WEBP" and not features.check("webp"):
+        pil_format = "PNG"
+    out = asyncio.run(screenshots.take_screenshot(
+        None, True, False, thumbnail_format=fmt, thumbnail_quality=60,
+    ))
+    thumb = Image.open(io.BytesIO(base64.b64decode(out["base64"])))
+    assert thumb.format == pil_format
+    assert out["thumbnail_format"] == pil_format.lower()
+
+
+def test_thumbnail_is_packed_into_mixed(driver):
+    import mcp_browser_use.helpers_context as hc
+
+    out = asyncio.run(screenshots.take_screenshot(None, True, False))
+    pack = json.loads(asyncio.run(hc.to_context_pack(out, return_mode="outline")))
+    assert pack["mixed"]["base64"] == out["base64"]
+    assert pack["mixed"]["thumbnail_width"] == 200
@@ -0,0 +1,34 @@
+"""tools/list is built once and served from cache."""
+
+import asyncio
+
+from mcp import types
+
+import mcp_browser_use.__main__ as server_main
+
+
+def test_tool_listing_is_built_once():
+    mcp = server_main.mcp
+    calls = []
+    real = mcp.list_tools
+
+    async def counting():
+        calls.append(1)
+        return await real()
+
+    # Rebuild the handler chain around a counting list_tools
+    mcp._mcp_server.list_tools()(counting)
+    server_main._cache_tool_listing()
+    handler = mcp._mcp_server.request_handlers[types.ListToolsRequest]
+
+    async def run():
+        return await handler(None), await handler(None)
+
+    first, second = asyncio.run(run())
+    assert first is second
+    assert calls == [1]
+    assert {t.name for t in first.root.tools} == {t.name for t in mcp._tool_manager.list_tools()}
+    assert set(mcp._mcp_server._tool_cache) == {t.name for t in first.root.tools}
+
+    mcp._mcp_server.list_tools()(real)
+    server_main._cache_tool_listing()
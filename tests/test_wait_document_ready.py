@@ -0,0 +1,40 @@
+"""Tests for the backoff polling in _wait_document_ready."""
+
+from mcp_browser_use.context import get_context, reset_context
+from mcp_browser_use.actions import navigation
+
+
+class FakeDriver:
+    def __init__(self, states):
+        self.states = list(states)
+        self.calls = 0
+
+    def execute_script(self, script):
+        self.calls += 1
+        return self.states.pop(0) if self.states else "complete"
+
+
+def test_returns_as_soon_as_ready(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(navigation.time, "sleep", sleeps.append)
+    reset_context()
+    get_context().driver = FakeDriver(["loading", "loading", "loading", "interactive"])
+    try:
+        navigation._wait_document_ready(timeout=5.0)
+    finally:
+        drv = get_context().driver
+        reset_context()
+    assert drv.calls == 4
+    assert sleeps == [0.01, 0.02, 0.04]
+
+
+def test_backoff_is_capped(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(navigation.time, "sleep", sleeps.append)
+    reset_context()
+    get_context().driver = FakeDriver(["loading"] * 8)
+    try:
+        navigation._wait_document_ready(timeout=5.0)
+    finally:
+        reset_context()
+    assert max(sleeps) == 0.25
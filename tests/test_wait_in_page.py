@@ -0,0 +1,85 @@
+"""Tests for the single-round-trip in-page element wait."""
+
+import pytest
+from selenium.common.exceptions import JavascriptException, TimeoutException
+
+import mcp_browser_use.tools.interaction as interaction
+
+
+class _Driver:
+    def __init__(self, result):
+        self.result = result
+        self.calls = []
+
+    def execute_async_script(self, script, *args):
+        self.calls.append(args)
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+class _Ctx:
+    def __init__(self, driver):
+        self.driver = driver
+
+
+def _no_polling(monkeypatch):
+    def fail(**kwargs):
+        raise AssertionError("should not fall back to WebDriver polling")
+
+    monkeypatch.setattr(interaction, "find_element", fail)
+
+
+def test_condition_met_in_one_round_trip(monkeypatch):
+    _no_polling(monkeypatch)
+    driver = _Driver(True)
+    interaction._wait_for_condition(_Ctx(driver), "#q", "css", 5.0, "clickable", None, "css")
+    assert driver.calls == [("#q", "css", "clickable", 5000)]
+
+
+def test_in_page_timeout_raises(monkeypatch):
+    _no_polling(monkeypatch)
+    with pytest.raises(TimeoutException):
+        interaction._wait_for_condition(_Ctx(_Driver(False)), "//div", "xpath", 1.0, "visible", None, "css")
+
+
+def test_undecided_script_falls_back_to_polling(monkeypatch):
+    found = []
+    monkeypatch.setattr(interaction, "find_element", lambda **kw: found.append(kw["selector"]))
+    interaction._wait_for_condition(_Ctx(_Driver(JavascriptException("unloaded"))), "#q", "css", 5.0, "present", None, "css")
+    interaction._wait_for_condition(_Ctx(_Driver("error:bad selector")), "#q", "css", 5.0, "present", None, "css")
+    interaction._wait_for_condition(_Ctx(_Driver(True)), "q", "name", 5.0, "present", None, "css")
+    assert found == ["#q", "#q", "q"]
+
+
+def test_condition_is_validated(monkeypatch):
+    _no_polling(monkeypatch)
+    driver = _Driver(True)
+    interaction._wait_for_condition(_Ctx(driver), "#q", "css", 5.0, "Visible", None, "css")
+    assert driver.calls == [("#q", "css", "visible", 5000)]
+    with pytest.raises(ValueError):
+        interaction._wait_for_condition(_Ctx(driver), "#q", "css", 5.0, "hidden", None, "css")
+
+
+def test_frames_are_searched_in_one_round_trip(monkeypatch):
+    _no_polling(monkeypatch)
+    driver = _Driver(1)
+    frames = ["#ad", "#checkout"]
+    matched = interaction._wait_for_condition_in_frames(_Ctx(driver), "#pay", "css", 5.0, "visible", frames, "css")
+    assert matched == "#checkout"
+    assert driver.calls == [("#pay", "css", "visible", 5000, frames)]
+
+
+def test_cross_origin_frames_fall_back_to_each_frame(monkeypatch):
+    tried = []
+
+    def find(**kw):
+        tried.append(kw["iframe_selector"])
+        if kw["iframe_selector"] != "#b":
+            raise TimeoutException()
+
+    monkeypatch.setattr(interaction, "find_element", find)
+    driver = _Driver("error:cross-origin frame #a")
+    matched = interaction._wait_for_condition_in_frames(_Ctx(driver), "#q", "css", 5.0, "present", ["#a", "#b"], "css")
+    assert matched == "#b"
+    assert tried == ["#a", "#b"]
@@ -0,0 +1,66 @@
+"""Tests for reusing blanked windows across close_browser/start_browser."""
+
+import pytest
+
+from mcp_browser_use.context import get_context, reset_context
+from mcp_browser_use.browser import driver as driver_mod
+
+
+class _SwitchTo:
+    def __init__(self, drv):
+        self._drv = drv
+
+    def window(self, handle):
+        self._drv.current = handle
+
+
+class FakeDriver:
+    def __init__(self, targets):
+        self.window_handles = [f"CDwindow-{t}" for t in targets]
+        self.switch_to = _SwitchTo(self)
+        self.current = None
+        self.scripts = []
+        self.cdp = []
+
+    def execute_script(self, script, *args):
+        self.scripts.append((self.current, script))
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp.append(cmd)
+        return {}
+
+
+@pytest.fixture
+def ctx():
+    reset_context()
+    c = get_context()
+    yield c
+    reset_context()
+
+
+def test_close_pools_window_instead_of_closing(ctx, monkeypatch):
+    monkeypatch.setattr("mcp_browser_use.constants.WINDOW_POOL_MAX", 1)
+    ctx.driver = FakeDriver(["T1"])
+    ctx.target_id, ctx.window_id = "T1", 7
+
+    assert driver_mod.close_singleton_window() is True
+    assert "Target.closeTarget" not in ctx.driver.cdp
+    assert ctx.driver.scripts[-1][0] == "CDwindow-T1"
+    assert "about:blank" in ctx.driver.scripts[-1][1]
+    assert ctx.target_id is None
+    assert list(ctx.window_pool) == [("T1", 7)]
+
+    assert driver_mod._take_pooled_window(ctx.driver) is True
+    assert (ctx.target_id, ctx.window_id) == ("T1", 7)
+    assert not ctx.window_pool
+
+
+def test_pool_disabled_closes_target(ctx, monkeypatch):
+    monkeypatch.setattr("mcp_browser_use.constants.WINDOW_POOL_MAX", 0)
+    monkeypatch.setattr(driver_mod, "_unregister_window", lambda owner: None)
+    ctx.driver = FakeDriver(["T1"])
+    ctx.target_id = "T1"
+
+    assert driver_mod.close_singleton_window() is True
+    assert "Target.closeTarget" in ctx.driver.cdp
+    assert not ctx.window_pool
@@ -0,0 +1,138 @@
+# tests/tests_decorators/test_browser_tool.py
+import json
+import asyncio
+import pytest
+
+import mcp_browser_use.decorators.tool as tool_mod
+from mcp_browser_use.decorators import browser_tool
+
+## We DO NOT want to use pytest-asyncio.
+## Instead, use event_loop.run_until_complete()!
+
+
+@pytest.fixture(scope="function")
+def event_loop():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def gates(monkeypatch):
+    state = {"acquire_err": None, "not_ready": None, "finished": []}
+    lock = asyncio.Lock()
+    monkeypatch.setattr(tool_mod, "_validate_config_or_error", lambda: None)
+    monkeypatch.setattr(tool_mod, "ensure_process_tag", lambda: "owner-1")
+    monkeypatch.setattr(tool_mod, "get_intra_process_lock", lambda: lock)
+    monkeypatch.setattr(tool_mod, "_acquire_action_lock_or_error", lambda owner: state["acquire_err"])
+    monkeypatch.setattr(tool_mod, "driver_not_ready_payload", lambda: state["not_ready"])
+    monkeypatch.setattr(tool_mod, "_finish_action_lock", lambda owner, result, ok=None: state["finished"].append(result))
+    return state
+
+
+def test_browser_tool_runs_and_finishes_lock(event_loop, gates):
+    @browser_tool
+    async def tool(x):
+        return {"ok": True, "x": x}
+
+    out = event_loop.run_until_complete(tool(3))
+    assert json.loads(out) == {"ok": True, "x": 3}
+    assert gates["finished"] == [out]
+
+
+def test_browser_tool_gates_short_circuit(event_loop, gates):
+    called = []
+
+    @browser_tool
+    async def tool():
+        called.append(1)
+        return "never"
+
+    gates["acquire_err"] = json.dumps({"ok": False, "error": "locked"})
+    assert json.loads(event_loop.run_until_complete(tool()))["error"] == "locked"
+    assert gates["finished"] == []
+
+    gates["acquire_err"] = None
+    gates["not_ready"] = json.dumps({"ok": False, "error": "browser_not_started"})
+    assert json.loads(event_loop.run_until_complete(tool()))["error"] == "browser_not_started"
+    assert called == []
+
+
+def test_browser_tool_wraps_exceptions(event_loop, gates):
+    @browser_tool
+    async def tool():
+        raise RuntimeError("boom")
+
+    out = json.loads(event_loop.run_until_complete(tool()))
+    assert out["ok"] is False
+    assert out["error"]["type"] == "RuntimeError"
+    assert gates["finished"] == [None]
+
+
+def test_shared_browser_tools_run_concurrently(event_loop, gates, monkeypatch):
+    from mcp_browser_use.locking.action_lock import BrowserRWLock
+
+    lock = BrowserRWLock()
+    monkeypatch.setattr(tool_mod, "get_intra_process_lock", lambda: lock)
+    inside = []
+
+    @browser_tool(shared=True)
+    async def inspect_page():
+        inside.append(lock._readers)
+        await asyncio.sleep(0.01)
+        return {"ok": True}
+
+    async def both():
+        return await asyncio.gather(inspect_page(), inspect_page())
+
+    event_loop.run_until_complete(both())
+    assert max(inside) == 2
+    # The softlock the readers share is finished once, by the last one out
+    assert len(gates["finished"]) == 1
+
+
+def test_window_check_skipped_until_a_call_fails(monkeypatch):
+    import mcp_browser_use.helpers as helpers
+    from mcp_browser_use.decorators.ensure import driver_not_ready_payload, forget_verified_window
+
+    checks = []
+    ctx = helpers.get_context()
+    monkeypatch.setattr(ctx, "driver", object())
+    monkeypatch.setattr(ctx, "target_id", "T1")
+    monkeypatch.setattr(ctx, "verified_window", None)
+    monkeypatch.setattr(helpers, "_ensure_singleton_window", lambda driver: checks.append(driver))
+
+    assert driver_not_ready_payload() is None
+    assert driver_not_ready_payload() is None
+    assert len(checks) == 1
+
+    forget_verified_window()
+    assert driver_not_ready_payload() is None
+    assert len(checks) == 2
+
+    ctx.target_id = "T2"
+    assert driver_not_ready_payload() is None
+    assert len(checks) == 3
+
+
+def test_heartbeat_renews_on_timers_until_stopped(event_loop, monkeypatch):
+    import mcp_browser_use.locking.action_lock as action_lock
+    from mcp_browser_use.decorators.locking import _Heartbeat
+
+    renewed = []
+    monkeypatch.setattr(action_lock, "_renew_action_lock", lambda owner, ttl: renewed.append(owner))
+
+    async def run():
+        beat = _Heartbeat("owner-1")
+        first = beat._handle
+        beat._tick()
+        assert renewed == ["owner-1"]
+        assert beat._handle is not first
+        beat.stop()
+        assert beat._handle is None
+        beat._tick()  # a tick already dispatched after stop() does not reschedule
+        assert beat._handle is None
+        assert not asyncio.all_tasks() - {asyncio.current_task()}
+
+    event_loop.run_until_complete(run())
@@ -8,7 +8,7 @@ import asyncio
 import pytest
 
 from mcp_browser_use.decorators import (
-    tool_envelope, exclusive_browser_access,
+    tool_envelope, exclusive_browser_access, fast_path,
 )
 
 ## We DO NOT want to use pytest-asyncio.
@@ -213,6 +213,36 @@ def test_tool_envelope_bytes_decoding_fallback():
     assert len(s) > 0  # replaced chars
 
 
+def test_tool_envelope_fast_path_sync_runs_inline_as_coroutine(event_loop):
+    import inspect
+    import threading
+
+    seen_threads = []
+
+    @tool_envelope
+    @fast_path
+    def f():
+        seen_threads.append(threading.get_ident())
+        return {"ok": True}
+
+    @tool_envelope
+    @fast_path
+    def f_fail():
+        raise ValueError("boom")
+
+    assert inspect.iscoroutinefunction(f)
+
+    async def test_logic():
+        out = await f()
+        assert json.loads(out) == {"ok": True}
+        err = json.loads(await f_fail())
+        assert err["ok"] is False
+        assert err["error"]["type"] == "ValueError"
+
+    event_loop.run_until_complete(test_logic())
+    assert seen_threads == [threading.get_ident()]
+
+
 # ------------------------------
 # ensure_driver_ready tests
 # ------------------------------